@@ -1,15 +1,29 @@
 """Authentication API — login endpoint."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import time
+from collections import deque
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.database import get_session
+from backend.database import get_async_session
 from backend.models.user import User
 from backend.services.auth import verify_password, verify_totp, create_access_token
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+# Login throttle: each attempt costs a bcrypt hash, so cap how many a single
+# client can trigger per username. Keyed on (client IP, username) so that one
+# client hammering an account can't lock everyone else out of it; the client
+# IP comes from the proxy's X-Forwarded-For (see the Dockerfile CMD).
+LOGIN_ATTEMPTS_PER_MINUTE = 5
+_LOGIN_WINDOW_SECONDS = 60.0
+_LOGIN_PRUNE_THRESHOLD = 1024
+_login_attempts: dict[tuple[str, str], deque[float]] = {}
+
 
 class LoginRequest(BaseModel):
     username: str
@@ -22,9 +36,38 @@ class LoginResponse(BaseModel):
     token_type: str = "bearer"
 
 
+def _prune_login_attempts(cutoff: float):
+    """Drop clients whose last attempt is outside the window."""
+    for key in [k for k, attempts in _login_attempts.items() if attempts[-1] <= cutoff]:
+        del _login_attempts[key]
+
+
+def _check_rate_limit(key: tuple[str, str]):
+    now = time.monotonic()
+    cutoff = now - _LOGIN_WINDOW_SECONDS
+    if len(_login_attempts) >= _LOGIN_PRUNE_THRESHOLD:
+        _prune_login_attempts(cutoff)
+    attempts = _login_attempts.setdefault(key, deque())
+    while attempts and attempts[0] <= cutoff:
+        attempts.popleft()
+    if len(attempts) >= LOGIN_ATTEMPTS_PER_MINUTE:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, try again later",
+        )
+    attempts.append(now)
+
+
 @router.post("/login", response_model=LoginResponse)
-def login(body: LoginRequest, session: Session = Depends(get_session)):
-    user = session.exec(select(User).where(User.username == body.username)).first()
+async def login(
+    body: LoginRequest,
+    request: Request,
+    session: AsyncSession = Depends(get_async_session),
+):
+    throttle_key = (request.client.host if request.client else "unknown", body.username)
+    _check_rate_limit(throttle_key)
+
+    user = (await session.exec(select(User).where(User.username == body.username))).first()
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -32,17 +75,20 @@ def login(body: LoginRequest, session: Session = Depends(get_session)):
             detail="Invalid credentials",
         )
 
-    if not verify_password(body.password, user.hashed_password):
+    # bcrypt is deliberately slow; keep it off the event loop
+    if not await asyncio.to_thread(verify_password, body.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
-    if not verify_totp(user.totp_secret, body.totp_code):
+    if not await asyncio.to_thread(verify_totp, user.totp_secret, body.totp_code):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid TOTP code",
         )
 
-    token = create_access_token(subject=user.username)
+    # Successful logins don't count against the budget
+    _login_attempts.pop(throttle_key, None)
+    token = await asyncio.to_thread(create_access_token, user.username)
     return LoginResponse(access_token=token)
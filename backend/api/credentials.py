@@ -1,21 +1,30 @@
 """CRUD API for Lighter DEX credentials."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import delete
 from sqlmodel import Session, select
 
 from backend.database import get_session
 from backend.models.credential import Credential
 from backend.schemas.credential import CredentialCreate, CredentialUpdate, CredentialRead
-from backend.services.encryption import encrypt, decrypt
+from backend.services.encryption import encrypt
 from backend.api.deps import get_current_user
-from backend.engine.pair_job import invalidate_lighter_client
+from backend.api.responses import json_rows
+from backend.engine.pair_job import _get_lighter_client, invalidate_lighter_client
 
 router = APIRouter(prefix="/api/credentials", tags=["credentials"], dependencies=[Depends(get_current_user)])
 
+TEST_CONNECTION_TIMEOUT = 5.0  # seconds
+
+# Only the columns CredentialRead exposes — never load the encrypted key for listing
+_list_credentials = select(*(getattr(Credential, f) for f in CredentialRead.model_fields))
+
 
 @router.get("", response_model=list[CredentialRead])
 def list_credentials(session: Session = Depends(get_session)):
-    return session.exec(select(Credential)).all()
+    return json_rows(session.exec(_list_credentials).mappings().all())
 
 
 @router.post("", response_model=CredentialRead, status_code=201)
@@ -41,7 +50,8 @@ def get_credential(cred_id: int, session: Session = Depends(get_session)):
     cred = session.get(Credential, cred_id)
     if not cred:
         raise HTTPException(status_code=404, detail="Credential not found")
-    return cred
+    # Instances of the response model itself are not re-validated by FastAPI
+    return CredentialRead.from_orm_trusted(cred)
 
 
 @router.put("/{cred_id}", response_model=CredentialRead)
@@ -72,11 +82,10 @@ def update_credential(
 
 @router.delete("/{cred_id}", status_code=204)
 def delete_credential(cred_id: int, session: Session = Depends(get_session)):
-    cred = session.get(Credential, cred_id)
-    if not cred:
-        raise HTTPException(status_code=404, detail="Credential not found")
-    session.delete(cred)
+    result = session.exec(delete(Credential).where(Credential.id == cred_id))
     session.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Credential not found")
     invalidate_lighter_client(cred_id)
 
 
@@ -88,17 +97,9 @@ async def test_credential(cred_id: int, session: Session = Depends(get_session))
         raise HTTPException(status_code=404, detail="Credential not found")
 
     try:
-        pk = decrypt(cred.private_key_encrypted)
-        from backend.services.lighter_client import LighterClient
-
-        client = LighterClient(
-            host=cred.lighter_host,
-            private_key=pk,
-            api_key_index=cred.api_key_index,
-            account_index=cred.account_index,
-        )
-        result = await client.test_connection()
-        await client.close()
-        return result
+        client = await _get_lighter_client(cred.id)
+        return await asyncio.wait_for(client.test_connection(), timeout=TEST_CONNECTION_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {"status": "error", "message": "timeout"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -1,80 +1,180 @@
 """Dashboard API — summary stats and equity curves."""
 
+import asyncio
 import logging
+import time
 
-from fastapi import APIRouter, Depends
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import BigInteger, case, cast, literal_column
 from sqlmodel import Session, select, func
 
-from backend.database import get_session
+from backend.config import settings
+from backend.database import AsyncSessionLocal, get_session
 from backend.api.deps import get_current_user
+from backend.api.responses import OrjsonResponse
 from backend.models.trade import Trade
 from backend.models.trading_pair import TradingPair
 from backend.models.equity_snapshot import EquitySnapshot
 from backend.models.credential import Credential
-from backend.services.encryption import decrypt
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"], dependencies=[Depends(get_current_user)])
 
 
+# Short-lived cache for /summary: dashboards poll it every few seconds and each
+# hit costs two aggregate queries plus an exchange round-trip.
+SUMMARY_TTL_SECONDS = 5.0
+_summary_generation = 0
+_summary_cache: tuple[int, float, asyncio.Task] | None = None
+
+
+def invalidate_summary_cache():
+    """Drop the cached summary so the next poll recomputes it."""
+    global _summary_generation
+    _summary_generation += 1
+
+
 @router.get("/summary")
-async def dashboard_summary(session: Session = Depends(get_session)):
-    """Aggregated stats across all pairs."""
-    pairs = session.exec(select(TradingPair)).all()
-    trades = session.exec(select(Trade)).all()
+async def dashboard_summary():
+    """Aggregated stats across all pairs.
+
+    Concurrent callers within the TTL window share one in-flight computation.
+    """
+    global _summary_cache
+    cached = _summary_cache
+    now = time.monotonic()
+    if (
+        cached is None
+        or cached[0] != _summary_generation
+        or (cached[2].done() and cached[1] <= now)
+    ):
+        cached = (_summary_generation, now + SUMMARY_TTL_SECONDS, asyncio.create_task(_compute_summary()))
+        _summary_cache = cached
+    try:
+        return await asyncio.shield(cached[2])
+    except Exception:
+        if _summary_cache is cached:
+            _summary_cache = None
+        raise
 
-    total_pnl = sum(t.pnl for t in trades)
-    winning = [t for t in trades if t.pnl > 0]
-    win_rate = len(winning) / len(trades) * 100 if trades else 0.0
+
+async def _compute_summary() -> dict:
+    async with AsyncSessionLocal() as session:
+        return await _summary_from_session(session)
+
+
+async def _summary_from_session(session) -> dict:
+    total_pairs, active_pairs = (await session.exec(
+        select(
+            func.count(TradingPair.id),
+            func.coalesce(func.sum(case((TradingPair.is_enabled, 1), else_=0)), 0),
+        )
+    )).one()
+    total_trades, total_pnl, winning = (await session.exec(
+        select(
+            func.count(Trade.id),
+            func.coalesce(func.sum(Trade.pnl), 0.0),
+            func.coalesce(func.sum(case((Trade.pnl > 0, 1), else_=0)), 0),
+        )
+    )).one()
+    win_rate = winning / total_trades * 100 if total_trades else 0.0
 
     # Fetch real position count from exchange
     exchange_position_count = 0
-    cred = session.exec(
+    cred = (await session.exec(
         select(Credential).where(Credential.is_active == True)
-    ).first()
+    )).first()
     if cred:
         try:
-            from backend.services.lighter_client import LighterClient
-
-            pk = decrypt(cred.private_key_encrypted)
-            client = LighterClient(
-                host=cred.lighter_host,
-                private_key=pk,
-                api_key_index=cred.api_key_index,
-                account_index=cred.account_index,
-            )
-            try:
-                positions = await client.get_positions()
-                exchange_position_count = len(positions)
-            finally:
-                await client.close()
+            from backend.engine.pair_job import _get_lighter_client
+
+            client = await _get_lighter_client(cred.id)
+            positions = await client.get_positions()
+            exchange_position_count = len(positions)
         except Exception as e:
             logger.warning(f"Could not fetch exchange positions for summary: {e}")
 
     return {
-        "total_pairs": len(pairs),
-        "active_pairs": sum(1 for p in pairs if p.is_enabled),
+        "total_pairs": total_pairs,
+        "active_pairs": active_pairs,
         "open_positions": exchange_position_count,
-        "total_trades": len(trades),
-        "total_pnl": round(total_pnl, 2),
+        "total_trades": total_trades,
+        "total_pnl": round(float(total_pnl), 2),
         "win_rate": round(win_rate, 1),
     }
 
 
+EQUITY_CURVE_RESOLUTIONS = {
+    "1m": 60, "5m": 300, "15m": 900, "1h": 3600, "4h": 14400, "1d": 86400,
+}
+EQUITY_CURVE_MAX_POINTS = 5000
+
+
+def _epoch_seconds(column):
+    if settings.database_url.startswith("sqlite"):
+        return cast(func.strftime("%s", column), BigInteger)
+    return cast(func.extract("epoch", column), BigInteger)
+
+
 @router.get("/equity/{pair_id}")
-def pair_equity_curve(pair_id: int, session: Session = Depends(get_session)):
-    """Equity curve data for one pair."""
-    snapshots = session.exec(
-        select(EquitySnapshot)
+def pair_equity_curve(
+    pair_id: int,
+    resolution: str | None = None,
+    session: Session = Depends(get_session),
+):
+    """Equity curve data for one pair.
+
+    Without ``resolution`` every snapshot is returned. With one, snapshots
+    are bucketed in SQL: each point is the bucket start with the average
+    equity and the worst drawdown within the bucket, and at most the latest
+    5000 buckets are returned.
+    """
+    if resolution is None:
+        rows = session.exec(
+            select(EquitySnapshot.timestamp, EquitySnapshot.equity, EquitySnapshot.drawdown_pct)
+            .where(EquitySnapshot.pair_id == pair_id)
+            .order_by(EquitySnapshot.timestamp)
+        ).all()
+        if not rows:
+            return OrjsonResponse([])
+        timestamps = [row[0].isoformat() for row in rows]
+        values = np.asarray([row[1:] for row in rows], dtype=np.float64).round(2)
+        return _curve_points(timestamps, values)
+
+    bucket_seconds = EQUITY_CURVE_RESOLUTIONS.get(resolution)
+    if bucket_seconds is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"resolution must be one of {list(EQUITY_CURVE_RESOLUTIONS)}",
+        )
+
+    # Inline the width (trusted, from the map above) so the SELECT and GROUP BY
+    # expressions are textually identical; PG rejects differing bind params.
+    width = literal_column(str(bucket_seconds))
+    bucket = (_epoch_seconds(EquitySnapshot.timestamp) // width * width).label("bucket")
+    rows = session.exec(
+        select(bucket, func.avg(EquitySnapshot.equity), func.min(EquitySnapshot.drawdown_pct))
         .where(EquitySnapshot.pair_id == pair_id)
-        .order_by(EquitySnapshot.timestamp)
+        .group_by(bucket)
+        .order_by(bucket.desc())
+        .limit(EQUITY_CURVE_MAX_POINTS)
     ).all()
-    return [
-        {
-            "timestamp": s.timestamp.isoformat(),
-            "equity": round(s.equity, 2),
-            "drawdown_pct": round(s.drawdown_pct, 2),
-        }
-        for s in snapshots
-    ]
+    if not rows:
+        return OrjsonResponse([])
+
+    # Columns: bucket epoch, equity, drawdown — rounded and formatted in bulk
+    data = np.asarray(rows, dtype=np.float64)[::-1]
+    timestamps = np.datetime_as_string(data[:, 0].astype("datetime64[s]"), timezone="UTC").tolist()
+    return _curve_points(timestamps, data[:, 1:].round(2))
+
+
+def _curve_points(timestamps: list[str], values: np.ndarray) -> OrjsonResponse:
+    """Zip formatted timestamps with rounded (equity, drawdown_pct) columns."""
+    equity = values[:, 0].tolist()
+    drawdown = values[:, 1].tolist()
+    return OrjsonResponse([
+        {"timestamp": ts, "equity": eq, "drawdown_pct": dd}
+        for ts, eq, dd in zip(timestamps, equity, drawdown)
+    ])
@@ -1,7 +1,10 @@
 """Shared API dependencies."""
 
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 
 from backend.database import get_session
@@ -10,6 +13,16 @@ from backend.services.auth import decode_access_token
 
 bearer_scheme = HTTPBearer()
 
+_user_by_name = select(User).where(User.username == bindparam("username"))
+
+# username -> (expires_at, column values). Saves a user lookup on every
+# authenticated request; users are only changed via the CLI (another
+# process), so a short TTL is enough. Plain values are cached rather than the
+# ORM instance, which would be expired by the request session's commit.
+USER_CACHE_TTL = 30.0
+_USER_CACHE_MAX = 1024
+_user_cache: dict[str, tuple[float, dict]] = {}
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
@@ -22,7 +35,18 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
-    user = session.exec(select(User).where(User.username == username)).first()
+
+    now = time.monotonic()
+    cached = _user_cache.get(username)
+    if cached is not None and cached[0] > now:
+        user = User.model_validate(cached[1])
+    else:
+        user = session.exec(_user_by_name, params={"username": username}).first()
+        if user is not None:
+            if len(_user_cache) >= _USER_CACHE_MAX:
+                _user_cache.clear()
+            _user_cache[username] = (now + USER_CACHE_TTL, user.model_dump())
+
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
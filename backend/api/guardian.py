@@ -14,7 +14,6 @@ from backend.models.position import OpenPosition
 from backend.models.trading_pair import TradingPair
 from backend.models.credential import Credential
 from backend.api.deps import get_current_user
-from backend.services.encryption import decrypt
 
 router = APIRouter(
     prefix="/api/guardian",
@@ -118,8 +117,8 @@ async def guardian_live_pnl(session: Session = Depends(get_session)):
 
     Uses the same logic as the guardian stop-loss check.
     """
-    from backend.services.lighter_client import LighterClient
-    from backend.services.market_data import fetch_orderbook
+    from backend.engine.pair_job import _get_lighter_client
+    from backend.services.market_data import fetch_orderbooks_batch
 
     settings = _get_or_create_settings(session)
 
@@ -155,18 +154,11 @@ async def guardian_live_pnl(session: Session = Depends(get_session)):
     needed_cred_ids = {cid for _, _, cid in checks if cid is not None}
 
     async def _fetch_for_cred(cred):
-        pk = decrypt(cred.private_key_encrypted)
-        client = LighterClient(
-            host=cred.lighter_host,
-            private_key=pk,
-            api_key_index=cred.api_key_index,
-            account_index=cred.account_index,
-        )
-        try:
-            raw = await client.get_positions()
-            return cred.id, {p["market_index"]: p for p in raw}
-        finally:
-            await client.close()
+        client = await _get_lighter_client(cred.id)
+        if client is None:
+            return cred.id, {}
+        raw = await client.get_positions()
+        return cred.id, {p["market_index"]: p for p in raw}
 
     cred_tasks = [_fetch_for_cred(cred_map[cid]) for cid in needed_cred_ids if cid in cred_map]
 
@@ -176,14 +168,13 @@ async def guardian_live_pnl(session: Session = Depends(get_session)):
         market_ids.add(pair.lighter_market_a)
         market_ids.add(pair.lighter_market_b)
 
-    ob_tasks = {mid: fetch_orderbook(mid) for mid in market_ids}
-    cred_results, *ob_results = await asyncio.gather(
+    cred_results, orderbooks = await asyncio.gather(
         asyncio.gather(*cred_tasks),
-        *ob_tasks.values(),
+        fetch_orderbooks_batch(market_ids),
     )
 
     exchange_by_cred = dict(cred_results)
-    mid_prices = {mid: ob["mid_price"] for mid, ob in zip(ob_tasks.keys(), ob_results)}
+    mid_prices = {mid: ob["mid_price"] for mid, ob in orderbooks.items()}
 
     result = []
     for pair, pos, cred_id in checks:
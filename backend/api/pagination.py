@@ -0,0 +1,35 @@
+"""Keyset pagination cursors for newest-first list endpoints."""
+
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+# Response header carrying the next keyset cursor for list endpoints that
+# return a bare JSON array; main.py exposes it to cross-origin clients.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Cursor for the last row of a page: `<iso timestamp>_<id>`."""
+    return f"{timestamp.isoformat()}_{row_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    ts, sep, row_id = cursor.rpartition("_")
+    try:
+        if not sep:
+            raise ValueError
+        return datetime.fromisoformat(ts), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid cursor: {cursor!r}")
+
+
+def before_cursor(timestamp_col, id_col, cursor: str):
+    """WHERE clause for rows strictly after `cursor` in (timestamp, id) DESC order.
+
+    The id tiebreaker keeps rows that share the boundary timestamp (batched
+    exits, bulk sync logs) from being skipped.
+    """
+    ts, row_id = decode_cursor(cursor)
+    return tuple_(timestamp_col, id_col) < tuple_(ts, row_id)
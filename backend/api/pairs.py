@@ -4,26 +4,34 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import ValidationError
+from sqlalchemy import bindparam, delete, exists
 from sqlmodel import Session, select
 
 from backend.database import get_session
 from backend.models.trading_pair import TradingPair
 from backend.models.position import OpenPosition
 from backend.schemas.trading_pair import TradingPairCreate, TradingPairUpdate, TradingPairRead
+from backend.api.dashboard import invalidate_summary_cache
 from backend.api.deps import get_current_user
+from backend.api.responses import json_rows
 
 router = APIRouter(prefix="/api/pairs", tags=["pairs"], dependencies=[Depends(get_current_user)])
 
+# Project only the columns TradingPairRead returns instead of hydrating ORM rows
+_all_pairs = select(*(getattr(TradingPair, f) for f in TradingPairRead.model_fields))
+_pairs_by_enabled = _all_pairs.where(TradingPair.is_enabled == bindparam("enabled"))
+
 
 @router.get("", response_model=list[TradingPairRead])
 def list_pairs(
     enabled: bool | None = None,
     session: Session = Depends(get_session),
 ):
-    stmt = select(TradingPair)
     if enabled is not None:
-        stmt = stmt.where(TradingPair.is_enabled == enabled)
-    return session.exec(stmt).all()
+        rows = session.exec(_pairs_by_enabled, params={"enabled": enabled}).mappings().all()
+    else:
+        rows = session.exec(_all_pairs).mappings().all()
+    return json_rows(rows)
 
 
 @router.post("", response_model=TradingPairRead, status_code=201)
@@ -38,6 +46,7 @@ def create_pair(
     session.add(pair)
     session.commit()
     session.refresh(pair)
+    invalidate_summary_cache()
 
     # Add scheduler job if enabled
     if pair.is_enabled:
@@ -63,7 +72,8 @@ def get_pair(pair_id: int, session: Session = Depends(get_session)):
     pair = session.get(TradingPair, pair_id)
     if not pair:
         raise HTTPException(status_code=404, detail="Pair not found")
-    return pair
+    # Instances of the response model itself are not re-validated by FastAPI
+    return TradingPairRead.from_orm_trusted(pair)
 
 
 @router.put("/{pair_id}", response_model=TradingPairRead)
@@ -92,6 +102,7 @@ def update_pair(
     session.add(pair)
     session.commit()
     session.refresh(pair)
+    invalidate_summary_cache()
 
     # Reschedule if interval changed or enablement toggled
     from backend.engine.scheduler import add_pair_job, remove_pair_job
@@ -105,15 +116,17 @@ def update_pair(
 
 @router.delete("/{pair_id}", status_code=204)
 def delete_pair(pair_id: int, session: Session = Depends(get_session)):
-    pair = session.get(TradingPair, pair_id)
-    if not pair:
-        raise HTTPException(status_code=404, detail="Pair not found")
-
-    # Check for open positions
-    pos = session.exec(
-        select(OpenPosition).where(OpenPosition.pair_id == pair_id)
-    ).first()
-    if pos:
+    # Delete only if no open position exists, atomically in one statement
+    result = session.exec(
+        delete(TradingPair).where(
+            TradingPair.id == pair_id,
+            ~exists().where(OpenPosition.pair_id == pair_id),
+        )
+    )
+    session.commit()
+    if result.rowcount == 0:
+        if session.get(TradingPair, pair_id) is None:
+            raise HTTPException(status_code=404, detail="Pair not found")
         raise HTTPException(
             status_code=409,
             detail="Cannot delete pair with open position. Close it first.",
@@ -121,9 +134,7 @@ def delete_pair(pair_id: int, session: Session = Depends(get_session)):
 
     from backend.engine.scheduler import remove_pair_job
     remove_pair_job(pair_id)
-
-    session.delete(pair)
-    session.commit()
+    invalidate_summary_cache()
 
 
 @router.post("/{pair_id}/toggle", response_model=TradingPairRead)
@@ -137,6 +148,7 @@ def toggle_pair(pair_id: int, session: Session = Depends(get_session)):
     session.add(pair)
     session.commit()
     session.refresh(pair)
+    invalidate_summary_cache()
 
     from backend.engine.scheduler import add_pair_job, remove_pair_job
     if pair.is_enabled:
@@ -4,44 +4,52 @@ import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import bindparam, delete
+from sqlalchemy.orm import raiseload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.database import get_session
+from backend.database import get_async_session, get_session
 from backend.models.position import OpenPosition
 from backend.models.trading_pair import TradingPair
 from backend.models.credential import Credential
-from backend.services.market_data import fetch_orderbook, fetch_markets
-from backend.services.encryption import decrypt
+from backend.services.market_data import fetch_orderbooks_batch, fetch_markets
 from backend.api.deps import get_current_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/positions", tags=["positions"], dependencies=[Depends(get_current_user)])
 
+# Statements built once at import; per request only the parameters change.
+_all_positions = select(OpenPosition).options(raiseload("*"))
+_position_by_pair = _all_positions.where(OpenPosition.pair_id == bindparam("pair_id"))
+_positions_with_pairs = (
+    select(OpenPosition, TradingPair)
+    .join(TradingPair, OpenPosition.pair_id == TradingPair.id)
+    .options(raiseload("*"))
+)
+_active_credentials = select(Credential).where(Credential.is_active == True)
+
 
 @router.get("")
 def list_positions(
     pair_id: int | None = None,
     session: Session = Depends(get_session),
 ):
-    stmt = select(OpenPosition)
     if pair_id is not None:
-        stmt = stmt.where(OpenPosition.pair_id == pair_id)
-    return session.exec(stmt).all()
+        return session.exec(_position_by_pair, params={"pair_id": pair_id}).all()
+    return session.exec(_all_positions).all()
 
 
 @router.post("/{pair_id}/close")
 def close_position(pair_id: int, session: Session = Depends(get_session)):
     """Manually close an open position."""
-    pos = session.exec(
-        select(OpenPosition).where(OpenPosition.pair_id == pair_id)
-    ).first()
-    if not pos:
+    result = session.exec(delete(OpenPosition).where(OpenPosition.pair_id == pair_id))
+    session.commit()
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="No open position for this pair")
 
     pair = session.get(TradingPair, pair_id)
-    session.delete(pos)
-    session.commit()
 
     # Reschedule job back to entry interval if use_exit_schedule is on
     if pair and pair.use_exit_schedule and pair.is_enabled:
@@ -52,38 +60,23 @@ def close_position(pair_id: int, session: Session = Depends(get_session)):
 
 
 @router.get("/enriched")
-async def enriched_positions(session: Session = Depends(get_session)):
+async def enriched_positions(session: AsyncSession = Depends(get_async_session)):
     """Return open positions enriched with current prices and unrealized P&L."""
-    positions = session.exec(select(OpenPosition)).all()
-    if not positions:
+    # One joined query; positions whose pair no longer exists drop out.
+    rows = (await session.exec(_positions_with_pairs)).all()
+    if not rows:
         return []
 
-    # Load all referenced pairs
-    pair_ids = {p.pair_id for p in positions}
-    pairs = session.exec(select(TradingPair).where(TradingPair.id.in_(pair_ids))).all()  # type: ignore[attr-defined]
-    pair_map = {p.id: p for p in pairs}
-
-    # Collect unique market IDs to fetch
     market_ids: set[int] = set()
-    for pos in positions:
-        pair = pair_map.get(pos.pair_id)
-        if pair:
-            market_ids.add(pair.lighter_market_a)
-            market_ids.add(pair.lighter_market_b)
-
-    # Fetch all orderbooks in parallel
-    market_list = list(market_ids)
-    orderbooks = await asyncio.gather(
-        *(fetch_orderbook(mid) for mid in market_list)
-    )
-    price_map = {mid: ob["mid_price"] for mid, ob in zip(market_list, orderbooks)}
+    for _, pair in rows:
+        market_ids.add(pair.lighter_market_a)
+        market_ids.add(pair.lighter_market_b)
 
-    result = []
-    for pos in positions:
-        pair = pair_map.get(pos.pair_id)
-        if not pair:
-            continue
+    orderbooks = await fetch_orderbooks_batch(market_ids)
+    price_map = {mid: ob["mid_price"] for mid, ob in orderbooks.items()}
 
+    result = []
+    for pos, pair in rows:
         current_price_a = price_map.get(pair.lighter_market_a, 0.0)
         current_price_b = price_map.get(pair.lighter_market_b, 0.0)
 
@@ -120,34 +113,23 @@ async def enriched_positions(session: Session = Depends(get_session)):
 
 
 @router.get("/exchange")
-async def exchange_positions(session: Session = Depends(get_session)):
+async def exchange_positions(session: AsyncSession = Depends(get_async_session)):
     """Return actual open positions from the Lighter exchange.
 
     Each individual market position is returned independently (not grouped by pair).
     This reflects the real state on the exchange, not the DB.
     """
-    from backend.services.lighter_client import LighterClient
+    from backend.engine.pair_job import _get_lighter_client
 
     # Get ALL active credentials
-    creds = session.exec(
-        select(Credential).where(Credential.is_active == True)
-    ).all()
+    creds = (await session.exec(_active_credentials)).all()
     if not creds:
         return []
 
     # Fetch positions from all credentials in parallel
     async def _fetch_for_cred(cred):
-        pk = decrypt(cred.private_key_encrypted)
-        client = LighterClient(
-            host=cred.lighter_host,
-            private_key=pk,
-            api_key_index=cred.api_key_index,
-            account_index=cred.account_index,
-        )
-        try:
-            return cred, await client.get_positions()
-        finally:
-            await client.close()
+        client = await _get_lighter_client(cred.id)
+        return cred, await client.get_positions()
 
     cred_results, markets = await asyncio.gather(
         asyncio.gather(*[_fetch_for_cred(c) for c in creds]),
@@ -171,11 +153,8 @@ async def exchange_positions(session: Session = Depends(get_session)):
             symbol_map[int(mid)] = m.get("symbol", f"Market {mid}")
 
     # Fetch current prices for all position markets
-    market_indices = [p["market_index"] for p in exchange_positions_raw]
-    orderbooks = await asyncio.gather(
-        *(fetch_orderbook(mid) for mid in market_indices)
-    )
-    price_map = {mid: ob["mid_price"] for mid, ob in zip(market_indices, orderbooks)}
+    orderbooks = await fetch_orderbooks_batch(p["market_index"] for p in exchange_positions_raw)
+    price_map = {mid: ob["mid_price"] for mid, ob in orderbooks.items()}
 
     result = []
     for pos in exchange_positions_raw:
@@ -0,0 +1,34 @@
+"""Fast orjson-backed JSON responses."""
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+# Z-suffixed UTC timestamps, matching what pydantic emits for the Read schemas
+_ROW_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson (the app's default response class).
+
+    Non-finite floats encode as null rather than failing, and numpy arrays
+    and scalars serialize directly.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def json_rows(rows) -> Response:
+    """Serialize column-projected DB rows straight to JSON.
+
+    The rows come from selects built from a Read schema's fields, so they
+    already have the response shape; returning a Response skips FastAPI's
+    per-item response_model validation and serialization.
+    """
+    return Response(
+        content=orjson.dumps([dict(row) for row in rows], option=_ROW_JSON_OPTIONS),
+        media_type="application/json",
+    )
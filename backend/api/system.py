@@ -1,13 +1,13 @@
 """System API — health check, scheduler status, job logs, manual trigger, emergency stop."""
 
-import math
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import func as sa_func
+from sqlalchemy import case, func as sa_func, select as sa_select
 from sqlmodel import Session, func, select
 
+from backend.api.pagination import before_cursor, encode_cursor
 from backend.database import get_session
 from backend.models.job_log import JobLog
 from backend.api.deps import get_current_user
@@ -47,6 +47,18 @@ def log_actions(session: Session = Depends(get_session)):
     return [a for a in rows if a]
 
 
+# Float columns that can hold inf/nan (e.g. a degenerate z-score); these are
+# mapped to NULL in SQL so the JSON encoder never sees them.
+_LOG_FLOAT_FIELDS = ("z_score", "hedge_ratio", "half_life", "adx", "rsi", "close_a", "close_b")
+_NON_FINITE = [float("inf"), float("-inf"), float("nan")]
+_LOG_COLUMNS = [
+    case((col.in_(_NON_FINITE), None), else_=col).label(col.key)
+    if col.key in _LOG_FLOAT_FIELDS else col
+    for col in JobLog.__table__.columns
+    if col.key != "market_blob"
+]
+
+
 @router.get("/logs", dependencies=[Depends(get_current_user)])
 def job_logs(
     pair_id: int | None = None,
@@ -58,37 +70,49 @@ def job_logs(
     date_to: str | None = None,
     limit: int = 100,
     offset: int = 0,
+    before: str | None = None,
     session: Session = Depends(get_session),
 ):
-    base = select(JobLog)
+    """Job logs, newest first.
+
+    Pass `before` (the previous page's `next_cursor`) for keyset pagination;
+    keyset pages skip the COUNT and return `total: null`. `offset` is kept
+    for page-number navigation but gets slower with depth.
+    """
+    conditions = []
     if pair_id is not None:
-        base = base.where(JobLog.pair_id == pair_id)
+        conditions.append(JobLog.pair_id == pair_id)
     if status is not None:
-        base = base.where(JobLog.status == status)
+        conditions.append(JobLog.status == status)
     if action is not None:
-        base = base.where(JobLog.action == action)
+        conditions.append(JobLog.action == action)
     if z_min is not None:
-        base = base.where(sa_func.abs(JobLog.z_score) >= z_min)
+        conditions.append(sa_func.abs(JobLog.z_score) >= z_min)
     if z_max is not None:
-        base = base.where(sa_func.abs(JobLog.z_score) <= z_max)
+        conditions.append(sa_func.abs(JobLog.z_score) <= z_max)
     if date_from is not None:
-        base = base.where(JobLog.timestamp >= datetime.fromisoformat(date_from))
+        conditions.append(JobLog.timestamp >= datetime.fromisoformat(date_from))
     if date_to is not None:
         end = datetime.fromisoformat(date_to) + timedelta(days=1)
-        base = base.where(JobLog.timestamp < end)
-
-    total = session.exec(select(func.count()).select_from(base.subquery())).one()
-
-    stmt = base.order_by(JobLog.timestamp.desc()).offset(offset).limit(limit)
-    rows = session.exec(stmt).all()
-    # Replace inf/nan with None so JSON serialization doesn't blow up.
-    float_fields = ("z_score", "hedge_ratio", "half_life", "adx", "rsi", "close_a", "close_b")
-    for row in rows:
-        for f in float_fields:
-            v = getattr(row, f, None)
-            if isinstance(v, float) and (math.isinf(v) or math.isnan(v)):
-                setattr(row, f, None)
-    return {"items": rows, "total": total}
+        conditions.append(JobLog.timestamp < end)
+
+    stmt = (
+        sa_select(*_LOG_COLUMNS)
+        .where(*conditions)
+        .order_by(JobLog.timestamp.desc(), JobLog.id.desc())
+    )
+    if before is not None:
+        total = None
+        stmt = stmt.where(before_cursor(JobLog.timestamp, JobLog.id, before))
+    else:
+        total = session.exec(select(func.count()).select_from(JobLog).where(*conditions)).one()
+        if offset:
+            stmt = stmt.offset(offset)
+    rows = session.execute(stmt.limit(limit)).mappings().all()
+    next_cursor = (
+        encode_cursor(rows[-1]["timestamp"], rows[-1]["id"]) if len(rows) == limit else None
+    )
+    return {"items": rows, "total": total, "next_cursor": next_cursor}
 
 
 class EmergencyStopRequest(BaseModel):
@@ -1,8 +1,9 @@
 """Trade history API."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlmodel import Session, select
 
+from backend.api.pagination import NEXT_CURSOR_HEADER, before_cursor, encode_cursor
 from backend.database import get_session
 from backend.models.trade import Trade
 from backend.api.deps import get_current_user
@@ -12,16 +13,29 @@ router = APIRouter(prefix="/api/trades", tags=["trades"], dependencies=[Depends(
 
 @router.get("")
 def list_trades(
+    response: Response,
     pair_id: int | None = None,
     limit: int = 50,
     offset: int = 0,
+    before: str | None = None,
     session: Session = Depends(get_session),
 ):
-    stmt = select(Trade).order_by(Trade.exit_time.desc())
+    """Trades, newest first.
+
+    A full page sets an `X-Next-Cursor` header; pass it back as `before` to
+    page by keyset.
+    """
+    stmt = select(Trade).order_by(Trade.exit_time.desc(), Trade.id.desc())
     if pair_id is not None:
         stmt = stmt.where(Trade.pair_id == pair_id)
-    stmt = stmt.offset(offset).limit(limit)
-    return session.exec(stmt).all()
+    if before is not None:
+        stmt = stmt.where(before_cursor(Trade.exit_time, Trade.id, before))
+    elif offset:
+        stmt = stmt.offset(offset)
+    trades = session.exec(stmt.limit(limit)).all()
+    if len(trades) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(trades[-1].exit_time, trades[-1].id)
+    return trades
 
 
 @router.get("/{trade_id}")
@@ -12,10 +12,19 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     cors_origins: list[str] = ["http://localhost:5173"]  # Vite dev server
 
+    # Connection pool (ignored for SQLite)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 3600  # seconds
+
+    # JobLog rows older than this are pruned daily (0 = keep forever)
+    joblog_retention_days: int = 14
+
     # Auth
     jwt_secret: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 43200  # 30 days
+    bcrypt_rounds: int = 12  # cost factor for new password hashes
 
     # Telegram
     telegram_bot_token: str = ""
@@ -1,9 +1,15 @@
 """SQLModel database engine and session management."""
 
 import logging
+import os
+from datetime import datetime, timezone
 
-from sqlalchemy import inspect
+import orjson
+from sqlalchemy import event, inspect, make_url
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.config import settings
 
@@ -11,16 +17,134 @@ logger = logging.getLogger(__name__)
 
 # SQLite needs check_same_thread=False; PostgreSQL does not
 connect_args = {}
+pool_kwargs = {}
 if settings.database_url.startswith("sqlite"):
     connect_args["check_same_thread"] = False
+else:
+    # Size the pool for bursts of API requests + scheduler jobs; pre-ping and
+    # recycle so connections dropped by the server don't surface as errors.
+    pool_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_use_lifo": True,
+    }
+
+
+def _json_dumps(value) -> str:
+    """orjson-backed serializer for JSON columns (JobLog.market_data etc.)."""
+    return orjson.dumps(
+        value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+json_kwargs = {"json_serializer": _json_dumps, "json_deserializer": orjson.loads}
 
 engine = create_engine(
     settings.database_url,
     echo=False,
     connect_args=connect_args,
+    **json_kwargs,
+    **pool_kwargs,
+)
+# Writers share the primary engine. It is not capped at one connection
+# because job code opens a nested Session (e.g. _log_cycle) while another is
+# still checked out; SQLite's busy_timeout serializes the actual writes.
+write_engine = engine
+
+
+def _read_only_sqlite_url(url: str) -> str | None:
+    """Return a read-only URI for a file-backed SQLite URL, else None."""
+    database = make_url(url).database
+    if not url.startswith("sqlite") or not database or database == ":memory:":
+        return None
+    return f"sqlite:///file:{database}?mode=ro&uri=true"
+
+
+# Reader pool for the job hot path. Under WAL, read-only connections never
+# wait on the writer, so pair cycles can load config while JobLog commits
+# land. PostgreSQL (and in-memory SQLite) just reuse the primary engine.
+_read_only_url = _read_only_sqlite_url(settings.database_url)
+if _read_only_url:
+    read_engine = create_engine(
+        _read_only_url,
+        echo=False,
+        connect_args=connect_args,
+        poolclass=QueuePool,
+        **json_kwargs,
+        pool_size=os.cpu_count() or 4,
+    )
+else:
+    read_engine = engine
+
+
+def _async_database_url(url: str) -> str:
+    """Map the configured sync URL onto its asyncio driver."""
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+# Async engine for `async def` routes so DB I/O doesn't block the event loop.
+# Sync routes, the scheduler and background jobs keep using `engine`.
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    echo=False,
+    **json_kwargs,
+    **pool_kwargs,
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+# SQLite tuning: WAL lets readers run alongside the job writers, and
+# synchronous=NORMAL is durable enough under WAL without an fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+    # Checkpoint less often during JobLog bursts; checkpoint_wal() truncates
+    # the file periodically so it doesn't stay large.
+    "PRAGMA wal_autocheckpoint=10000",
+)
+
+
+# journal_mode/synchronous can't be set on a read-only connection; the WAL
+# mode itself is persistent and was already set by the writer.
+SQLITE_READER_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
 )
 
 
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _set_sqlite_reader_pragmas(dbapi_conn, _connection_record):
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_READER_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if settings.database_url.startswith("sqlite"):
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    if read_engine is not engine:
+        event.listen(read_engine, "connect", _set_sqlite_reader_pragmas)
+
+
 def _run_migrations():
     """Run lightweight schema migrations for column renames."""
     from sqlalchemy import text
@@ -102,6 +226,13 @@ def _run_migrations():
             conn.execute(text("ALTER TABLE trading_pair ADD COLUMN use_exit_schedule BOOLEAN NOT NULL DEFAULT FALSE"))
             conn.commit()
 
+    # Add debug_replay_enabled column for per-pair raw close logging
+    if "debug_replay_enabled" not in columns:
+        logger.info("Migrating: adding debug_replay_enabled column to trading_pair")
+        with engine.connect() as conn:
+            conn.execute(text("ALTER TABLE trading_pair ADD COLUMN debug_replay_enabled BOOLEAN NOT NULL DEFAULT FALSE"))
+            conn.commit()
+
     # Add guardian_excluded column for per-pair guardian opt-out
     if "guardian_excluded" not in columns:
         logger.info("Migrating: adding guardian_excluded column to trading_pair")
@@ -170,6 +301,49 @@ def _run_migrations():
                 ))
                 conn.commit()
 
+    # Composite indexes for the hot read paths (equity curve, job log
+    # filters, trade history). IF NOT EXISTS works on both SQLite and PG.
+    hot_path_indexes = [
+        ("equity_snapshot", "ix_equity_snapshot_pair_ts", "(pair_id, timestamp)"),
+        # Peak-equity MAX() on every exit becomes a single index seek
+        ("equity_snapshot", "ix_equity_snapshot_pair_equity", "(pair_id, equity)"),
+        ("job_log", "ix_job_log_pair_status_ts", "(pair_id, status, timestamp DESC)"),
+        ("job_log", "ix_job_log_pair_ts", "(pair_id, timestamp DESC)"),
+        ("trade", "ix_trade_exit_time", "(exit_time DESC)"),
+        ("trade", "ix_trade_pair_exit_time", "(pair_id, exit_time DESC)"),
+    ]
+    table_names = inspector.get_table_names()
+    with engine.connect() as conn:
+        for table, index_name, index_cols in hot_path_indexes:
+            if table in table_names:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} {index_cols}"))
+        # Give the planner stats for the new indexes right away
+        conn.execute(text("ANALYZE"))
+        conn.commit()
+
+    # Add market_blob column for compact replay closes
+    if "job_log" in table_names:
+        job_log_columns = {col["name"] for col in inspector.get_columns("job_log")}
+        if "market_blob" not in job_log_columns:
+            logger.info("Migrating: adding market_blob column to job_log")
+            blob_type = "BLOB" if settings.database_url.startswith("sqlite") else "BYTEA"
+            with engine.connect() as conn:
+                conn.execute(text(f"ALTER TABLE job_log ADD COLUMN market_blob {blob_type}"))
+                conn.commit()
+
+    # Store job_log.market_data as jsonb on PostgreSQL
+    if "job_log" in table_names and not settings.database_url.startswith("sqlite"):
+        market_data_col = next(
+            (c for c in inspector.get_columns("job_log") if c["name"] == "market_data"), None
+        )
+        if market_data_col is not None and market_data_col["type"].__class__.__name__ != "JSONB":
+            logger.info("Migrating: converting job_log.market_data to jsonb")
+            with engine.connect() as conn:
+                conn.execute(text(
+                    "ALTER TABLE job_log ALTER COLUMN market_data TYPE JSONB USING market_data::jsonb"
+                ))
+                conn.commit()
+
     # Add order mode to quick trades.
     if "simple_pair_trade" in inspector.get_table_names():
         simple_columns = {col["name"] for col in inspector.get_columns("simple_pair_trade")}
@@ -180,14 +354,116 @@ def _run_migrations():
                 conn.commit()
 
 
+# Bump whenever a step is added to _run_migrations(). Once the database has
+# recorded this version, startup skips the catalog inspection entirely.
+SCHEMA_VERSION = 5
+_MIGRATION_LOCK_KEY = 748_219_003  # arbitrary pg_advisory_lock key
+
+
+def _migrate_if_needed():
+    """Run _run_migrations() unless schema_migrations is already current.
+
+    On PostgreSQL an advisory lock serializes concurrently booting workers.
+    """
+    from sqlalchemy import text
+
+    use_lock = not settings.database_url.startswith("sqlite")
+    with engine.connect() as conn:
+        if use_lock:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+        try:
+            conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations "
+                "(version INTEGER PRIMARY KEY, applied_at TIMESTAMP NOT NULL)"
+            ))
+            version = conn.execute(text("SELECT MAX(version) FROM schema_migrations")).scalar() or 0
+            conn.commit()
+            if version >= SCHEMA_VERSION:
+                return
+
+            _run_migrations()
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, applied_at) VALUES (:version, :applied_at)"),
+                {"version": SCHEMA_VERSION, "applied_at": datetime.now(timezone.utc)},
+            )
+            conn.commit()
+            logger.info(f"Schema migrated to version {SCHEMA_VERSION}")
+        finally:
+            if use_lock:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+                conn.commit()
+
+
+def optimize_database():
+    """Refresh SQLite planner statistics (no-op on PostgreSQL, which autovacuums).
+
+    analysis_limit bounds the ANALYZE work PRAGMA optimize may do, so this is
+    cheap enough to run at startup, periodically and on shutdown.
+    """
+    if not settings.database_url.startswith("sqlite"):
+        return
+    from sqlalchemy import text
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA analysis_limit=400"))
+        conn.execute(text("PRAGMA optimize"))
+        conn.commit()
+
+
+def checkpoint_wal():
+    """Checkpoint the SQLite WAL and truncate it (no-op on PostgreSQL)."""
+    if not settings.database_url.startswith("sqlite"):
+        return
+    from sqlalchemy import text
+    with write_engine.connect() as conn:
+        busy, log_pages, checkpointed = conn.execute(
+            text("PRAGMA wal_checkpoint(TRUNCATE)")
+        ).one()
+        conn.commit()
+    if busy:
+        logger.warning(f"WAL checkpoint blocked: {checkpointed}/{log_pages} pages checkpointed")
+    else:
+        logger.debug(f"WAL checkpoint: {checkpointed}/{log_pages} pages")
+
+
 def create_db_and_tables():
     """Create all tables. Called on startup."""
     import backend.models  # noqa: F401 — ensure all models are registered
     SQLModel.metadata.create_all(engine)
-    _run_migrations()
+    _migrate_if_needed()
+
+    if settings.database_url.startswith("sqlite"):
+        from sqlalchemy import text
+        with engine.connect() as conn:
+            mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+        logger.info(f"SQLite journal_mode={mode}")
+        optimize_database()
+
+
+async def dispose_engines():
+    """Close all pooled connections. Called on shutdown."""
+    try:
+        optimize_database()
+    except Exception as e:
+        logger.warning(f"PRAGMA optimize on shutdown failed: {e}")
+    engine.dispose()
+    if read_engine is not engine:
+        read_engine.dispose()
+    await async_engine.dispose()
 
 
 def get_session() -> Session:
     """Dependency that yields a database session."""
     with Session(engine) as session:
         yield session
+
+
+def get_read_session() -> Session:
+    """Dependency that yields a session on the read-only engine."""
+    with Session(read_engine) as session:
+        yield session
+
+
+async def get_async_session() -> AsyncSession:
+    """Dependency that yields an async database session for async routes."""
+    async with AsyncSessionLocal() as session:
+        yield session
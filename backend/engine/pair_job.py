@@ -5,14 +5,17 @@ data fetch → signal computation → entry/exit decisions → order execution 
 """
 
 import asyncio
+import dataclasses
 import logging
+import math
 import time
 from datetime import datetime, timedelta, timezone
 
 import numpy as np
+from sqlalchemy import bindparam, delete, insert, update
 from sqlmodel import Session, select
 
-from backend.database import engine
+from backend.database import read_engine, write_engine
 from backend.models.trading_pair import TradingPair
 from backend.models.position import OpenPosition
 from backend.models.trade import Trade
@@ -20,11 +23,18 @@ from backend.models.equity_snapshot import EquitySnapshot
 from backend.models.job_log import JobLog
 from backend.models.credential import Credential
 from backend.services import signal_engine
-from backend.services.encryption import decrypt
+from backend.services.encryption import get_decrypted_pk, invalidate_decrypted_pk
 
 logger = logging.getLogger(__name__)
 _pair_locks: dict[int, asyncio.Lock] = {}
-_pair_locks_guard = asyncio.Lock()
+_pair_cache: dict[int, TradingPair] = {}
+
+# JobLog writes are queued and committed in batches by _joblog_writer so the
+# trading path doesn't wait on a commit per cycle.
+JOB_LOG_FLUSH_INTERVAL = 0.2
+_job_log_queue: asyncio.Queue | None = None
+_job_log_loop: asyncio.AbstractEventLoop | None = None
+_job_log_writer_task: asyncio.Task | None = None
 
 
 def _notify(message: str):
@@ -40,7 +50,7 @@ def _notify(message: str):
 
 async def run_pair_cycle(pair_id: int):
     """Run one cycle per pair, skipping if a prior cycle is still in-flight."""
-    lock = await _get_pair_lock(pair_id)
+    lock = _get_pair_lock(pair_id)
     if lock.locked():
         logger.warning(f"[pair_{pair_id}] Skipping overlapping cycle")
         _log_cycle(
@@ -55,13 +65,41 @@ async def run_pair_cycle(pair_id: int):
         await _run_pair_cycle_once(pair_id)
 
 
-async def _get_pair_lock(pair_id: int) -> asyncio.Lock:
-    async with _pair_locks_guard:
-        lock = _pair_locks.get(pair_id)
-        if lock is None:
-            lock = asyncio.Lock()
-            _pair_locks[pair_id] = lock
-        return lock
+def get_pair_cached(pair_id: int, session: Session | None = None) -> TradingPair | None:
+    """Load a TradingPair, reusing the cached row while its updated_at is unchanged.
+
+    Anything that changes pair config or cooldown state must bump updated_at.
+    The cached row is detached from ``session`` so a later commit there can't
+    expire it for the next cycle.
+    """
+    if session is None:
+        with Session(read_engine) as session:
+            return get_pair_cached(pair_id, session)
+
+    updated_at = session.exec(
+        select(TradingPair.updated_at).where(TradingPair.id == pair_id)
+    ).first()
+    if updated_at is None:
+        _pair_cache.pop(pair_id, None)
+        return None
+
+    cached = _pair_cache.get(pair_id)
+    if cached is not None and cached.updated_at == updated_at:
+        return cached
+
+    pair = session.get(TradingPair, pair_id)
+    if pair is not None:
+        session.expunge(pair)
+        _pair_cache[pair_id] = pair
+    return pair
+
+
+def _get_pair_lock(pair_id: int) -> asyncio.Lock:
+    # No await between lookup and insert, so this can't race on the loop.
+    lock = _pair_locks.get(pair_id)
+    if lock is None:
+        lock = _pair_locks.setdefault(pair_id, asyncio.Lock())
+    return lock
 
 
 async def _run_pair_cycle_once(pair_id: int):
@@ -75,97 +113,104 @@ async def _run_pair_cycle_once(pair_id: int):
     5. If in position: evaluate exit → close position
     6. Log everything
     """
-    pair_name = f"pair_{pair_id}"
-    with Session(engine) as session:
-        pair = session.get(TradingPair, pair_id)
+    # One read session for the whole cycle. Each read ends with commit() so
+    # the connection returns to the pool before any exchange I/O is awaited.
+    with Session(read_engine, expire_on_commit=False) as session:
+        pair = get_pair_cached(pair_id, session)
+        session.commit()
         if not pair or not pair.is_enabled:
             return
 
         pair_name = pair.name
         logger.info(f"[{pair_name}] Starting cycle")
 
-    try:
-        # Step 1: Fetch market data
-        from backend.services.market_data import fetch_pair_data
-
-        # Fetch enough candles for RSI Wilder smoothing to converge
-        fetch_candles = max(pair.window_candles, pair.rsi_period * 5)
-
-        data = await fetch_pair_data(
-            asset_a=pair.asset_a,
-            asset_b=pair.asset_b,
-            window_interval=pair.window_interval,
-            window_candles=fetch_candles,
-            train_interval=pair.train_interval,
-            train_candles=pair.train_candles,
-            market_id_a=pair.lighter_market_a or None,
-            market_id_b=pair.lighter_market_b or None,
-        )
-
-        prices_a = data["prices_a"]
-        prices_b = data["prices_b"]
-        train_a = data["train_a"]
-        train_b = data["train_b"]
-
-        # Build market data summary for logging (includes full close arrays for replay)
-        mkt = {
-            "prices_a": {"count": len(prices_a), "first": str(prices_a.index[0]) if not prices_a.empty else None, "last": str(prices_a.index[-1]) if not prices_a.empty else None, "closes": prices_a.values.tolist()},
-            "prices_b": {"count": len(prices_b), "first": str(prices_b.index[0]) if not prices_b.empty else None, "last": str(prices_b.index[-1]) if not prices_b.empty else None, "closes": prices_b.values.tolist()},
-            "train_a": {"count": len(train_a), "first": str(train_a.index[0]) if not train_a.empty else None, "last": str(train_a.index[-1]) if not train_a.empty else None, "closes": train_a.values.tolist()},
-            "train_b": {"count": len(train_b), "first": str(train_b.index[0]) if not train_b.empty else None, "last": str(train_b.index[-1]) if not train_b.empty else None, "closes": train_b.values.tolist()},
-        }
-
-        if prices_a.empty or prices_b.empty or train_a.empty or train_b.empty:
-            _log_cycle(pair_id, "error", message="Empty candle data from exchange",
-                       market_data=mkt)
-            return
-
-        close_a = float(prices_a.iloc[-1])
-        close_b = float(prices_b.iloc[-1])
-
-        if len(prices_a) < fetch_candles or len(prices_b) < fetch_candles:
-            _log_cycle(pair_id, "error", message="Insufficient price data",
-                       close_a=close_a, close_b=close_b, market_data=mkt)
-            return
-
-        if len(train_a) < pair.train_candles or len(train_b) < pair.train_candles:
-            _log_cycle(pair_id, "error", message="Insufficient training data",
-                       close_a=close_a, close_b=close_b, market_data=mkt)
-            return
+        try:
+            # Step 1: Fetch market data
+            from backend.services.market_data import fetch_pair_data
+
+            # Fetch enough candles for RSI Wilder smoothing to converge
+            fetch_candles = max(pair.window_candles, pair.rsi_period * 5)
+
+            data = await fetch_pair_data(
+                asset_a=pair.asset_a,
+                asset_b=pair.asset_b,
+                window_interval=pair.window_interval,
+                window_candles=fetch_candles,
+                train_interval=pair.train_interval,
+                train_candles=pair.train_candles,
+                market_id_a=pair.lighter_market_a or None,
+                market_id_b=pair.lighter_market_b or None,
+            )
 
-        # Step 2: Compute signals
-        signals = signal_engine.compute_signals(
-            prices_a=prices_a.values,
-            prices_b=prices_b.values,
-            train_prices_a=train_a.values,
-            train_prices_b=train_b.values,
-            window_candles=pair.window_candles,
-            train_candles=pair.train_candles,
-            rsi_period=pair.rsi_period,
-        )
+            prices_a = data["prices_a"]
+            prices_b = data["prices_b"]
+            train_a = data["train_a"]
+            train_b = data["train_b"]
 
-        logger.info(
-            f"[{pair_name}] z={signals.z_score:.3f} hr={signals.hedge_ratio:.4f} "
-            f"hl={signals.half_life:.1f} rsi={signals.rsi:.1f} rsi_a={signals.rsi_a:.1f} rsi_b={signals.rsi_b:.1f}"
-        )
+            # Build market data summary for logging (raw closes only if replay is on)
+            mkt = _market_summary(
+                pair, prices_a=prices_a, prices_b=prices_b, train_a=train_a, train_b=train_b
+            )
 
-        # Step 3: Check for open position
-        with Session(engine) as session:
+            if prices_a.empty or prices_b.empty or train_a.empty or train_b.empty:
+                _log_cycle(pair_id, "error", message="Empty candle data from exchange",
+                           market_data=mkt)
+                return
+
+            # Work on the numpy buffers from here on; pandas scalar indexing is slow
+            arr_a = prices_a.to_numpy()
+            arr_b = prices_b.to_numpy()
+            train_arr_a = train_a.to_numpy()
+            train_arr_b = train_b.to_numpy()
+            close_a = float(arr_a[-1])
+            close_b = float(arr_b[-1])
+
+            if min(len(arr_a), len(arr_b)) < fetch_candles:
+                _log_cycle(pair_id, "error", message="Insufficient price data",
+                           close_a=close_a, close_b=close_b, market_data=mkt)
+                return
+
+            if min(len(train_arr_a), len(train_arr_b)) < pair.train_candles:
+                _log_cycle(pair_id, "error", message="Insufficient training data",
+                           close_a=close_a, close_b=close_b, market_data=mkt)
+                return
+
+            # Step 2: Check for open position
             position = session.exec(
                 select(OpenPosition).where(OpenPosition.pair_id == pair_id)
             ).first()
+            session.commit()
 
-        if position is None:
-            # FLAT — evaluate entry
-            await _handle_entry(pair, signals, prices_a, prices_b, close_a, close_b, mkt)
-        else:
-            # IN POSITION — evaluate exit
-            await _handle_exit(pair, position, signals, prices_a, prices_b, close_a, close_b, mkt)
+            # Step 3: Compute signals. Half-life and ratio RSI are kept for the
+            # logged row; the per-asset RSIs are entry-only, so skip them when
+            # already in a position.
+            signals = signal_engine.compute_signals(
+                prices_a=arr_a,
+                prices_b=arr_b,
+                train_prices_a=train_arr_a,
+                train_prices_b=train_arr_b,
+                window_candles=pair.window_candles,
+                train_candles=pair.train_candles,
+                rsi_period=pair.rsi_period,
+                asset_rsi=position is None,
+            )
 
-    except Exception as e:
-        logger.error(f"[{pair_name}] Cycle error: {e}", exc_info=True)
-        _notify(f"[{pair_name}] ERROR: {e}")
-        _log_cycle(pair_id, "error", message=str(e))
+            logger.info(
+                f"[{pair_name}] z={signals.z_score:.3f} hr={signals.hedge_ratio:.4f} "
+                f"hl={signals.half_life:.1f} rsi={signals.rsi:.1f} rsi_a={signals.rsi_a:.1f} rsi_b={signals.rsi_b:.1f}"
+            )
+
+            if position is None:
+                # FLAT — evaluate entry
+                await _handle_entry(pair, signals, close_a, close_b, mkt, session=session)
+            else:
+                # IN POSITION — evaluate exit
+                await _handle_exit(pair, position, signals, close_a, close_b, mkt)
+
+        except Exception as e:
+            logger.error(f"[{pair_name}] Cycle error: {e}", exc_info=True)
+            _notify(f"[{pair_name}] ERROR: {e}")
+            _log_cycle(pair_id, "error", message=str(e))
 
 
 async def _execute_chunked_orders(
@@ -191,7 +236,7 @@ async def _execute_chunked_orders(
     )
 
 
-def _check_cooldown(pair: TradingPair) -> bool:
+def _check_cooldown(pair: TradingPair, session: Session) -> bool:
     """Check if pair is in cooldown or should enter cooldown. Returns True if entry should be skipped."""
     if pair.cooldown_candles <= 0:
         return False
@@ -203,11 +248,11 @@ def _check_cooldown(pair: TradingPair) -> bool:
         return True
 
     # Check consecutive losses from Trade table
-    with Session(engine) as session:
-        recent_trades = session.exec(
-            select(Trade).where(Trade.pair_id == pair.id)
-            .order_by(Trade.exit_time.desc()).limit(max(pair.cooldown_losses, 20))
-        ).all()
+    recent_trades = session.exec(
+        select(Trade).where(Trade.pair_id == pair.id)
+        .order_by(Trade.exit_time.desc()).limit(max(pair.cooldown_losses, 20))
+    ).all()
+    session.commit()
 
     consecutive_losses = 0
     cumulative_loss_pct = 0.0
@@ -231,21 +276,30 @@ def _check_cooldown(pair: TradingPair) -> bool:
         from backend.engine.scheduler import _interval_to_minutes
         interval_min = _interval_to_minutes(pair.schedule_interval)
         cooldown_end = datetime.now(timezone.utc) + timedelta(minutes=interval_min * pair.cooldown_candles)
-        with Session(engine) as session:
-            db_pair = session.get(TradingPair, pair.id)
+        with Session(write_engine) as write_session:
+            db_pair = write_session.get(TradingPair, pair.id)
             db_pair.cooldown_until = cooldown_end
-            session.add(db_pair)
-            session.commit()
+            db_pair.updated_at = datetime.now(timezone.utc)
+            write_session.add(db_pair)
+            write_session.commit()
         logger.info(f"Pair {pair.id}: cooldown triggered ({consecutive_losses} losses, {cumulative_loss_pct:.1f}% cumulative), until {cooldown_end}")
         return True
 
     return False
 
 
-async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a: float, close_b: float, market_data: dict | None = None):
-    """Evaluate and execute entry if conditions are met."""
+async def _handle_entry(pair: TradingPair, signals, close_a: float, close_b: float, market_data: dict | None = None, session: Session | None = None):
+    """Evaluate and execute entry if conditions are met.
+
+    ``session`` is the cycle's read session, reused for the cooldown lookup.
+    """
     # Cooldown check — short-circuit before any API calls
-    if _check_cooldown(pair):
+    if session is None:
+        with Session(read_engine) as read_session:
+            in_cooldown = _check_cooldown(pair, read_session)
+    else:
+        in_cooldown = _check_cooldown(pair, session)
+    if in_cooldown:
         _log_cycle(pair.id, "success", signals=signals, action="skip:cooldown",
                    message="Entry paused: cooldown active",
                    close_a=close_a, close_b=close_b, market_data=market_data)
@@ -268,14 +322,9 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
 
     equity_floor = position_size * pair.min_equity_pct / 100.0
 
-    # Track equity from balance (position sizing capital).
+    # Equity is tracked from balance (position sizing capital) and persisted
+    # with whichever write ends this cycle, so there is no extra transaction.
     # PnL calculations use entry_notional/leverage, so deposits don't inflate PnL.
-    with Session(engine) as session:
-        db_pair = session.get(TradingPair, pair.id)
-        db_pair.current_equity = position_size
-        session.add(db_pair)
-        session.commit()
-
     entry = signal_engine.evaluate_entry(
         signals=signals,
         entry_z=pair.entry_z,
@@ -297,12 +346,13 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
             pair.id, "success", signals=signals, action=action,
             message=f"No entry: {entry.skip_reason}",
             close_a=close_a, close_b=close_b, market_data=market_data,
+            current_equity=position_size,
         )
         return
 
     # Place entry orders on Lighter
-    current_price_a = float(prices_a.iloc[-1])
-    current_price_b = float(prices_b.iloc[-1])
+    current_price_a = close_a
+    current_price_b = close_b
     dollar_per_unit = current_price_a + abs(signals.hedge_ratio) * current_price_b
     units = entry.notional / dollar_per_unit if dollar_per_unit > 0 else 0
 
@@ -323,10 +373,12 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
         if completed_chunks == 0 or result_a is None or result_b is None:
             _log_cycle(pair.id, "error", signals=signals, action="entry_failed",
                        message=f"{order_mode.title()} entry: 0 chunks completed",
-                       close_a=close_a, close_b=close_b)
+                       close_a=close_a, close_b=close_b, current_equity=position_size)
             return
         if completed_chunks < pair.slice_chunks:
-            entry.notional = entry.notional * (completed_chunks / pair.slice_chunks)
+            entry = dataclasses.replace(
+                entry, notional=entry.notional * (completed_chunks / pair.slice_chunks)
+            )
             logger.warning(
                 f"[{pair.name}] Partial {order_mode} entry: {completed_chunks}/{pair.slice_chunks} chunks, "
                 f"notional reduced to ${entry.notional:.0f}"
@@ -353,16 +405,16 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
             err = pair_result.error or result_a.error or result_b.error
             _log_cycle(pair.id, "error", signals=signals, action="entry_failed",
                         message=f"Batch order failed: {err}",
-                        close_a=close_a, close_b=close_b)
+                        close_a=close_a, close_b=close_b, current_equity=position_size)
             return
 
     # Verify positions actually exist on the exchange
     # Limit orders sit on the book and may not fill immediately — skip verification
     if order_mode in ("market", "sliced"):
-        settle_delay = 2 if order_mode == "sliced" else 1
-        await asyncio.sleep(settle_delay)
-
-        exchange_positions = await lighter_client.get_positions()
+        exchange_positions = await _wait_for_positions(
+            lighter_client, {pair.lighter_market_a, pair.lighter_market_b},
+            present=True, timeout=4.0 if order_mode == "sliced" else 2.0,
+        )
         exchange_by_market = {p["market_index"]: p for p in exchange_positions}
 
         has_leg_a = pair.lighter_market_a in exchange_by_market
@@ -376,7 +428,8 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
                 missing.append(f"leg B (market {pair.lighter_market_b})")
             _log_cycle(pair.id, "error", signals=signals, action="entry_not_confirmed",
                        message=f"Orders accepted but positions not found on exchange: {', '.join(missing)}",
-                       close_a=close_a, close_b=close_b, market_data=market_data)
+                       close_a=close_a, close_b=close_b, market_data=market_data,
+                       current_equity=position_size)
             _notify(f"[{pair.name}] Entry orders accepted but NOT confirmed on exchange. Positions missing: {', '.join(missing)}")
             return
 
@@ -385,40 +438,42 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
         exchange_fill_b = exchange_by_market[pair.lighter_market_b]["entry_price"]
         logger.info(f"[{pair.name}] Exchange entry prices: A={exchange_fill_a}, B={exchange_fill_b}")
 
-    # Save open position (re-check to prevent duplicates from race conditions)
-    with Session(engine) as session:
+    # Save equity + open position in one transaction (re-check to prevent
+    # duplicates from race conditions)
+    with Session(write_engine) as session, session.begin():
+        db_pair = session.get(TradingPair, pair.id)
+        db_pair.current_equity = position_size
         existing = session.exec(
-            select(OpenPosition).where(OpenPosition.pair_id == pair.id)
+            select(OpenPosition.id).where(OpenPosition.pair_id == pair.id)
         ).first()
-        if existing:
-            logger.warning(f"[{pair.name}] Position already exists, aborting entry")
-            _log_cycle(pair.id, "skipped", signals=signals, action="entry_aborted_duplicate",
-                       message="Position already existed at commit time",
-                       close_a=close_a, close_b=close_b)
-            return
-        pos = OpenPosition(
-            pair_id=pair.id,
-            direction=entry.direction,
-            entry_z=signals.z_score,
-            entry_spread=signals.current_spread,
-            entry_price_a=current_price_a,
-            entry_price_b=current_price_b,
-            entry_hedge_ratio=signals.hedge_ratio,
-            entry_notional=entry.notional,
-            lighter_order_id_a=result_a.order_id,
-            lighter_order_id_b=result_b.order_id,
-            fill_price_a=exchange_fill_a if order_mode in ("market", "sliced") else result_a.filled_price,
-            fill_price_b=exchange_fill_b if order_mode in ("market", "sliced") else result_b.filled_price,  # limit mode sets filled_price from exchange
-            fill_amount_a=result_a.filled_amount,
-            fill_amount_b=result_b.filled_amount,
-        )
-        session.add(pos)
-        # Clear cooldown on successful entry
-        db_pair = session.get(TradingPair, pair.id)
-        if db_pair.cooldown_until is not None:
-            db_pair.cooldown_until = None
-            session.add(db_pair)
-        session.commit()
+        if existing is None:
+            session.add(OpenPosition(
+                pair_id=pair.id,
+                direction=entry.direction,
+                entry_z=signals.z_score,
+                entry_spread=signals.current_spread,
+                entry_price_a=current_price_a,
+                entry_price_b=current_price_b,
+                entry_hedge_ratio=signals.hedge_ratio,
+                entry_notional=entry.notional,
+                lighter_order_id_a=result_a.order_id,
+                lighter_order_id_b=result_b.order_id,
+                fill_price_a=exchange_fill_a if order_mode in ("market", "sliced") else result_a.filled_price,
+                fill_price_b=exchange_fill_b if order_mode in ("market", "sliced") else result_b.filled_price,  # limit mode sets filled_price from exchange
+                fill_amount_a=result_a.filled_amount,
+                fill_amount_b=result_b.filled_amount,
+            ))
+            # Clear cooldown on successful entry
+            if db_pair.cooldown_until is not None:
+                db_pair.cooldown_until = None
+                db_pair.updated_at = datetime.now(timezone.utc)
+
+    if existing is not None:
+        logger.warning(f"[{pair.name}] Position already exists, aborting entry")
+        _log_cycle(pair.id, "skipped", signals=signals, action="entry_aborted_duplicate",
+                   message="Position already existed at commit time",
+                   close_a=close_a, close_b=close_b)
+        return
 
     direction_str = "entry_long" if entry.direction == 1 else "entry_short"
     logger.info(f"[{pair.name}] Entered {direction_str} at z={signals.z_score:.3f}")
@@ -435,10 +490,10 @@ async def _handle_entry(pair: TradingPair, signals, prices_a, prices_b, close_a:
         logger.info(f"[{pair.name}] Rescheduled to exit interval: {pair.exit_schedule_interval}")
 
 
-async def _handle_exit(pair: TradingPair, position: OpenPosition, signals, prices_a, prices_b, close_a: float, close_b: float, market_data: dict | None = None):
+async def _handle_exit(pair: TradingPair, position: OpenPosition, signals, close_a: float, close_b: float, market_data: dict | None = None):
     """Evaluate and execute exit if conditions are met."""
-    current_price_a = float(prices_a.iloc[-1])
-    current_price_b = float(prices_b.iloc[-1])
+    current_price_a = close_a
+    current_price_b = close_b
 
     # Use entry-time equity (notional / leverage) as PnL denominator,
     # not pair.current_equity which could be inflated by deposits.
@@ -513,13 +568,11 @@ async def execute_exit(
     await lighter_client.cancel_all_orders()
     await asyncio.sleep(2)
 
-    # Snapshot realized PnL before exit (for delta calculation)
-    pnl_before = await lighter_client.get_realized_pnl(
+    # Snapshot realized PnL before exit (for delta calculation) and
+    # 2. get actual open position sizes from exchange, in one account fetch
+    exchange_positions, pnl_before = await lighter_client.get_positions_and_realized_pnl(
         [pair.lighter_market_a, pair.lighter_market_b]
     )
-
-    # 2. Get actual open position sizes from exchange
-    exchange_positions = await lighter_client.get_positions()
     exchange_by_market = {p["market_index"]: p for p in exchange_positions}
 
     pos_a = exchange_by_market.get(pair.lighter_market_a)
@@ -588,37 +641,23 @@ async def execute_exit(
     # Verify positions are actually closed on the exchange (with retries)
     # Limit exit orders sit on the book — cannot verify immediate close
     if order_mode in ("market", "sliced"):
-        settle_delays = [3, 6, 10] if order_mode == "market" else [3, 6, 15]
-        positions_closed = False
-        has_leg_a = False
-        has_leg_b = False
-
-        for attempt, delay in enumerate(settle_delays, 1):
-            await asyncio.sleep(delay)
-            exchange_positions = await lighter_client.get_positions()
-            exchange_markets = {p["market_index"] for p in exchange_positions}
-
-            has_leg_a = pair.lighter_market_a in exchange_markets
-            has_leg_b = pair.lighter_market_b in exchange_markets
-
-            if not has_leg_a and not has_leg_b:
-                positions_closed = True
-                break
-
-            if attempt < len(settle_delays):
-                logger.info(
-                    f"[{pair.name}] Exit verification attempt {attempt}/{len(settle_delays)}: "
-                    f"positions still open, retrying..."
-                )
+        settle_timeout = 19.0 if order_mode == "market" else 24.0
+        exchange_positions = await _wait_for_positions(
+            lighter_client, {pair.lighter_market_a, pair.lighter_market_b},
+            present=False, timeout=settle_timeout, max_delay=2.0,
+        )
+        exchange_markets = {p["market_index"] for p in exchange_positions}
+        has_leg_a = pair.lighter_market_a in exchange_markets
+        has_leg_b = pair.lighter_market_b in exchange_markets
 
-        if not positions_closed:
+        if has_leg_a or has_leg_b:
             still_open = []
             if has_leg_a:
                 still_open.append(f"leg A (market {pair.lighter_market_a})")
             if has_leg_b:
                 still_open.append(f"leg B (market {pair.lighter_market_b})")
             _log_cycle(pair.id, "error", signals=signals, action="exit_not_confirmed",
-                       message=f"Exit orders accepted but positions still open after {len(settle_delays)} checks: {', '.join(still_open)}",
+                       message=f"Exit orders accepted but positions still open after {settle_timeout:.0f}s: {', '.join(still_open)}",
                        close_a=close_a, close_b=close_b)
             return
 
@@ -658,21 +697,22 @@ async def execute_exit(
     pnl_pct = pnl / entry_equity * 100 if entry_equity > 0 else 0
 
     # Compute duration in candles from entry_time
-    from backend.utils.constants import INTERVAL_HOURS
+    from backend.utils.constants import DIRECTION_LABELS, INTERVAL_HOURS
+    now = datetime.now(timezone.utc)
     et = position.entry_time if position.entry_time.tzinfo else position.entry_time.replace(tzinfo=timezone.utc)
-    elapsed = (datetime.now(timezone.utc) - et).total_seconds()
+    elapsed = (now - et).total_seconds()
     interval_sec = INTERVAL_HOURS.get(pair.window_interval, 1.0) * 3600
     duration = int(elapsed / interval_sec) if interval_sec > 0 else 0
 
-    direction_str = "Long A / Short B" if position.direction == 1 else "Short A / Long B"
+    direction_str = DIRECTION_LABELS[position.direction]
 
-    with Session(engine) as session:
+    with Session(write_engine) as session:
         # Save trade record
         trade = Trade(
             pair_id=pair.id,
             direction=direction_str,
             entry_time=position.entry_time,
-            exit_time=datetime.now(timezone.utc),
+            exit_time=now,
             entry_price_a=entry_pa,
             exit_price_a=exit_pa,
             entry_price_b=entry_pb,
@@ -690,7 +730,7 @@ async def execute_exit(
         # Update pair equity
         db_pair = session.get(TradingPair, pair.id)
         db_pair.current_equity += pnl
-        db_pair.updated_at = datetime.now(timezone.utc)
+        db_pair.updated_at = now
         session.add(db_pair)
 
         # Save equity snapshot with drawdown from peak
@@ -730,6 +770,30 @@ async def execute_exit(
         logger.info(f"[{pair.name}] Rescheduled to entry interval: {pair.schedule_interval}")
 
 
+async def _wait_for_positions(
+    client, markets: set[int], *, present: bool, timeout: float, max_delay: float = 0.4
+) -> list[dict]:
+    """Poll get_positions() until every market in ``markets`` is open
+    (``present=True``) or closed (``present=False``).
+
+    Backs off from 50ms up to ``max_delay`` and gives up after ``timeout``
+    seconds, returning the last positions seen either way. Each poll bypasses
+    the client's account cache, which would otherwise pin the early polls to
+    one snapshot.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while True:
+        await asyncio.sleep(delay)
+        positions = await client.get_positions(fresh=True)
+        open_markets = {p["market_index"] for p in positions}
+        settled = markets <= open_markets if present else not (markets & open_markets)
+        if settled or loop.time() + delay >= deadline:
+            return positions
+        delay = min(delay * 2, max_delay)
+
+
 async def _rollback_partial_fill(
     lighter_client,
     pair: TradingPair,
@@ -781,11 +845,28 @@ async def _rollback_partial_fill(
 
 
 _lighter_client_cache: dict[int, "LighterClient"] = {}
+# Requested credential_id (None = first active) -> resolved credential id, so
+# the per-cycle client lookup skips the Credential query once resolved.
+_resolved_credential_ids: dict[int | None, int] = {}
 
 
 def invalidate_lighter_client(credential_id: int):
     """Remove a cached client when credential is updated or deleted."""
     _lighter_client_cache.pop(credential_id, None)
+    _resolved_credential_ids.clear()
+    invalidate_decrypted_pk(credential_id)
+
+
+async def close_lighter_clients():
+    """Close all cached clients. Called on shutdown."""
+    clients = list(_lighter_client_cache.values())
+    _lighter_client_cache.clear()
+    _resolved_credential_ids.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Lighter client: {e}")
 
 
 async def _get_lighter_client(credential_id: int | None = None):
@@ -796,7 +877,11 @@ async def _get_lighter_client(credential_id: int | None = None):
     """
     from backend.services.lighter_client import LighterClient
 
-    with Session(engine) as session:
+    client = _lighter_client_cache.get(_resolved_credential_ids.get(credential_id))
+    if client is not None:
+        return client
+
+    with Session(read_engine) as session:
         if credential_id is not None:
             cred = session.get(Credential, credential_id)
         else:
@@ -806,10 +891,11 @@ async def _get_lighter_client(credential_id: int | None = None):
         if not cred:
             return None
 
+        _resolved_credential_ids[credential_id] = cred.id
         if cred.id in _lighter_client_cache:
             return _lighter_client_cache[cred.id]
 
-        pk = decrypt(cred.private_key_encrypted)
+        pk = get_decrypted_pk(cred)
         client = LighterClient(
             host=cred.lighter_host,
             private_key=pk,
@@ -830,17 +916,36 @@ def _build_order_results(result_a, result_b) -> dict:
             "filled_price": r.filled_price,
             "filled_amount": r.filled_amount,
             "order_status": r.order_status,
-            "raw_response": r.raw_response,
+            "raw_response": str(r.raw_response) if r.raw_response else None,
         }
     return {"leg_a": _order_dict(result_a), "leg_b": _order_dict(result_b)}
 
 
+def _market_summary(pair: TradingPair, **series) -> dict:
+    """Summarize fetched candle series for JobLog.market_data.
+
+    With ``pair.debug_replay_enabled`` the raw closes are attached as one
+    float64 buffer under ``closes_blob``, which _log_cycle moves into
+    JobLog.market_blob instead of the JSON column.
+    """
+    mkt = {
+        name: {
+            "count": len(s),
+            "first": str(s.index[0]) if not s.empty else None,
+            "last": str(s.index[-1]) if not s.empty else None,
+        }
+        for name, s in series.items()
+    }
+    if pair.debug_replay_enabled:
+        mkt["closes_blob"] = np.concatenate(
+            [np.asarray(s.values, dtype=np.float64) for s in series.values()]
+        ).tobytes()
+    return mkt
+
+
 def _safe_float(v: float | None) -> float | None:
     """Return None for inf/nan so they don't end up in the DB."""
-    if v is None:
-        return None
-    import math
-    if math.isinf(v) or math.isnan(v):
+    if v is None or not math.isfinite(v):
         return None
     return v
 
@@ -855,8 +960,18 @@ def _log_cycle(
     close_b: float | None = None,
     market_data: dict | None = None,
     order_results: dict | None = None,
+    current_equity: float | None = None,
 ):
-    """Write a JobLog entry."""
+    """Queue a JobLog entry for the background writer.
+
+    If ``current_equity`` is given, the pair's equity is updated in the same
+    transaction as the log.
+    """
+    market_blob = None
+    if market_data and "closes_blob" in market_data:
+        market_data = dict(market_data)
+        market_blob = market_data.pop("closes_blob")
+
     # Merge candle data and order results into a single JSON blob
     combined_market_data = None
     if market_data or order_results:
@@ -866,20 +981,126 @@ def _log_cycle(
         if order_results:
             combined_market_data["orders"] = order_results
 
-    with Session(engine) as session:
-        log = JobLog(
-            pair_id=pair_id,
-            status=status,
-            z_score=_safe_float(signals.z_score) if signals else None,
-            hedge_ratio=_safe_float(signals.hedge_ratio) if signals else None,
-            half_life=_safe_float(signals.half_life) if signals else None,
-            adx=None,
-            rsi=_safe_float(signals.rsi) if signals else None,
-            action=action,
-            close_a=_safe_float(close_a),
-            close_b=_safe_float(close_b),
-            message=message,
-            market_data=combined_market_data,
-        )
-        session.add(log)
-        session.commit()
+    # Plain row dict (every column present) so the writer can executemany
+    row = {
+        "pair_id": pair_id,
+        "timestamp": datetime.now(timezone.utc),
+        "status": status,
+        "z_score": _safe_float(signals.z_score) if signals else None,
+        "hedge_ratio": _safe_float(signals.hedge_ratio) if signals else None,
+        "half_life": _safe_float(signals.half_life) if signals else None,
+        "adx": None,
+        "rsi": _safe_float(signals.rsi) if signals else None,
+        "action": action,
+        "close_a": _safe_float(close_a),
+        "close_b": _safe_float(close_b),
+        "message": message,
+        "market_data": combined_market_data,
+        "market_blob": market_blob,
+    }
+    entry = (row, current_equity)
+
+    # Hand off to the background writer when called on its loop; otherwise
+    # (startup, CLI, other threads) write synchronously.
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if _job_log_queue is not None and loop is _job_log_loop:
+        _job_log_queue.put_nowait(entry)
+    else:
+        _write_job_logs([entry])
+
+
+_job_log_insert = insert(JobLog.__table__)
+_equity_update = (
+    update(TradingPair.__table__)
+    .where(TradingPair.__table__.c.id == bindparam("pair_id"))
+    .values(current_equity=bindparam("current_equity"))
+)
+
+
+def _write_job_logs(entries: list[tuple[dict, float | None]]):
+    """Insert a batch of JobLog rows (and any equity updates) in one transaction.
+
+    Uses Core executemany rather than the ORM unit of work.
+    """
+    # Last queued equity per pair wins
+    equity = {row["pair_id"]: eq for row, eq in entries if eq is not None}
+    with write_engine.begin() as conn:
+        conn.execute(_job_log_insert, [row for row, _ in entries])
+        if equity:
+            conn.execute(
+                _equity_update,
+                [{"pair_id": pid, "current_equity": eq} for pid, eq in equity.items()],
+            )
+
+
+async def _joblog_writer(queue: asyncio.Queue):
+    """Drain queued JobLogs, committing everything that arrived per flush window."""
+    while True:
+        entries = [await queue.get()]
+        await asyncio.sleep(JOB_LOG_FLUSH_INTERVAL)
+        while not queue.empty():
+            entries.append(queue.get_nowait())
+
+        stop = None in entries
+        entries = [e for e in entries if e is not None]
+        if entries:
+            try:
+                await asyncio.to_thread(_write_job_logs, entries)
+            except Exception as e:
+                logger.error(f"Failed to write {len(entries)} job logs: {e}", exc_info=True)
+        if stop:
+            return
+
+
+JOB_LOG_PRUNE_BATCH = 5000
+
+
+def prune_job_logs():
+    """Delete JobLogs older than settings.joblog_retention_days.
+
+    Deletes in batches, each in its own short transaction, so the job never
+    holds the write lock long enough to stall the pair cycles.
+    """
+    from backend.config import settings
+
+    if settings.joblog_retention_days <= 0:
+        return
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.joblog_retention_days)
+    old_ids = (
+        select(JobLog.id).where(JobLog.timestamp < cutoff).limit(JOB_LOG_PRUNE_BATCH)
+    )
+
+    deleted = 0
+    with Session(write_engine) as session:
+        while True:
+            result = session.exec(delete(JobLog).where(JobLog.id.in_(old_ids)))
+            session.commit()
+            deleted += result.rowcount
+            if result.rowcount < JOB_LOG_PRUNE_BATCH:
+                break
+    if deleted:
+        logger.info(f"Pruned {deleted} job logs older than {settings.joblog_retention_days} days")
+
+
+def start_job_log_writer():
+    """Start the background JobLog writer on the running event loop."""
+    global _job_log_queue, _job_log_loop, _job_log_writer_task
+    if _job_log_writer_task is not None:
+        return
+    _job_log_loop = asyncio.get_running_loop()
+    _job_log_queue = asyncio.Queue()
+    _job_log_writer_task = _job_log_loop.create_task(_joblog_writer(_job_log_queue))
+
+
+async def stop_job_log_writer():
+    """Flush pending JobLogs and stop the writer. Called on shutdown."""
+    global _job_log_queue, _job_log_loop, _job_log_writer_task
+    queue, task = _job_log_queue, _job_log_writer_task
+    _job_log_queue = _job_log_loop = _job_log_writer_task = None
+    if task is None:
+        return
+    queue.put_nowait(None)
+    await task
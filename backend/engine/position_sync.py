@@ -11,9 +11,11 @@ Scenarios handled:
 3. Exchange has position not tracked in DB → auto-create OpenPosition if both legs match a pair
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
+from sqlalchemy import delete, insert
 from sqlmodel import Session, select
 
 from backend.database import engine
@@ -21,21 +23,33 @@ from backend.models.position import OpenPosition
 from backend.models.trading_pair import TradingPair
 from backend.models.job_log import JobLog
 from backend.models.credential import Credential
-from backend.services.encryption import decrypt
+from backend.services.encryption import get_decrypted_pk
 
 logger = logging.getLogger(__name__)
 
+SYNC_LOG_BATCH = 1000
+CLIENT_CLOSE_TIMEOUT = 5.0
+FETCH_ATTEMPTS = 5
+# Startup (and so the API) waits on the sync: cap the total time one
+# credential may spend sleeping between retries. Credentials are fetched
+# concurrently, so this also bounds the whole sync's retry delay.
+FETCH_INITIAL_BACKOFF = 0.25
+FETCH_BACKOFF_BUDGET = 3.0
 
-def _resolve_credential_id(pair: TradingPair, default_cred_id: int | None) -> int | None:
+# Strong refs to detached client-close tasks so they are not GC'd mid-close
+_close_tasks: set[asyncio.Task] = set()
+
+
+def _resolve_credential_id(pair, default_cred_id: int | None) -> int | None:
     """Return the credential id a pair should use."""
     return pair.credential_id if pair.credential_id is not None else default_cred_id
 
 
-async def _fetch_positions_for_credential(cred: Credential) -> list[dict]:
-    """Fetch exchange positions for a single credential."""
+async def _fetch_positions_for_credential(cred) -> list[dict]:
+    """Fetch exchange positions for a single credential row."""
     from backend.services.lighter_client import LighterClient
 
-    pk = decrypt(cred.private_key_encrypted)
+    pk = get_decrypted_pk(cred)
     client = LighterClient(
         host=cred.lighter_host,
         private_key=pk,
@@ -43,12 +57,40 @@ async def _fetch_positions_for_credential(cred: Credential) -> list[dict]:
         account_index=cred.account_index,
     )
     try:
-        return await client.get_positions()
-    except Exception as e:
-        logger.error(f"Position sync: failed to fetch positions for credential {cred.id} ({cred.name}): {e}")
-        return []
+        # Retry transient failures with exponential backoff (0.25s, 0.5s, ...)
+        # until the attempts or the backoff budget run out
+        delay = FETCH_INITIAL_BACKOFF
+        slept = 0.0
+        for attempt in range(1, FETCH_ATTEMPTS + 1):
+            try:
+                return await client.get_positions()
+            except Exception as e:
+                if attempt == FETCH_ATTEMPTS or slept + delay > FETCH_BACKOFF_BUDGET:
+                    logger.error(
+                        f"Position sync: failed to fetch positions for credential {cred.id} "
+                        f"({cred.name}) after {attempt} attempts: {e}"
+                    )
+                    return []
+                logger.warning(
+                    f"Position sync: fetch for credential {cred.id} failed "
+                    f"(attempt {attempt}/{FETCH_ATTEMPTS}), retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                slept += delay
+                delay *= 2
     finally:
-        await client.close()
+        # Tear the client down in the background; startup does not wait on it
+        task = asyncio.create_task(_close_client(client, cred.id))
+        _close_tasks.add(task)
+        task.add_done_callback(_close_tasks.discard)
+
+
+async def _close_client(client, cred_id: int):
+    """Close a sync-only client, bounded so a stuck socket cannot linger."""
+    try:
+        await asyncio.wait_for(client.close(), timeout=CLIENT_CLOSE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Position sync: closing client for credential {cred_id} failed: {e}")
 
 
 async def sync_positions_on_startup():
@@ -59,28 +101,65 @@ async def sync_positions_on_startup():
     credentials are checked against the correct account.
     """
     with Session(engine) as session:
+        # Plain column rows — the credentials are only read, never written
         active_creds = session.exec(
-            select(Credential).where(Credential.is_active == True)
+            select(
+                Credential.id,
+                Credential.name,
+                Credential.lighter_host,
+                Credential.private_key_encrypted,
+                Credential.api_key_index,
+                Credential.account_index,
+            ).where(Credential.is_active == True)
         ).all()
+        # Nothing to reconcile or recover without positions or enabled pairs,
+        # so skip the exchange round-trips entirely
+        has_work = (
+            session.exec(select(OpenPosition.id).limit(1)).first() is not None
+            or session.exec(
+                select(TradingPair.id).where(TradingPair.is_enabled == True).limit(1)
+            ).first() is not None
+        )
+        # End the read transaction so nothing is held open across the fetches
+        session.commit()
 
-    if not active_creds:
-        logger.info("Position sync: no active credential, skipping")
-        return
+        if not active_creds:
+            logger.info("Position sync: no active credential, skipping")
+            return
+        if not has_work:
+            logger.info("Position sync: no DB positions or enabled pairs, skipping exchange fetch")
+            return
 
-    # Fetch exchange positions for every active credential
-    # Key: credential_id → {market_index: position_dict}
-    positions_by_cred: dict[int, dict[int, dict]] = {}
-    for cred in active_creds:
-        exchange_positions = await _fetch_positions_for_credential(cred)
-        by_market: dict[int, dict] = {}
-        for pos in exchange_positions:
-            by_market[pos["market_index"]] = pos
-        positions_by_cred[cred.id] = by_market
+        # Fetch exchange positions for every active credential
+        # Key: credential_id → {market_index: position_dict}
+        # Fetched concurrently so one unreachable account's retries don't
+        # add up across credentials
+        fetched = await asyncio.gather(
+            *(_fetch_positions_for_credential(cred) for cred in active_creds)
+        )
+        positions_by_cred: dict[int, dict[int, dict]] = {
+            cred.id: {p["market_index"]: p for p in exchange_positions}
+            for cred, exchange_positions in zip(active_creds, fetched)
+        }
 
-    default_cred_id = active_creds[0].id
+        default_cred_id = active_creds[0].id
 
-    with Session(engine) as session:
         db_positions = session.exec(select(OpenPosition)).all()
+        # Load every pair once instead of a session.get() per position,
+        # projecting only the columns reconciliation reads
+        pairs_by_id = {
+            p.id: p
+            for p in session.exec(
+                select(
+                    TradingPair.id,
+                    TradingPair.name,
+                    TradingPair.credential_id,
+                    TradingPair.lighter_market_a,
+                    TradingPair.lighter_market_b,
+                    TradingPair.is_enabled,
+                )
+            ).all()
+        }
 
         total_exchange = sum(len(m) for m in positions_by_cred.values())
         if not db_positions and total_exchange == 0:
@@ -92,20 +171,27 @@ async def sync_positions_on_startup():
             f"{total_exchange} exchange positions across {len(active_creds)} credentials"
         )
 
-        # Track which (cred_id, market_index) are accounted for
+        # Track which (cred_id, market_index) are accounted for, and which
+        # markets belong to a DB position (for the auto-recover pass)
         matched_markets: set[tuple[int, int]] = set()
+        tracked_markets: set[tuple[int, int]] = set()
+        # Sync events and stale position ids are flushed in bulk at the end
+        pending_logs: list[dict] = []
+        stale_ids: list[int] = []
 
         for db_pos in db_positions:
-            pair = session.get(TradingPair, db_pos.pair_id)
+            pair = pairs_by_id.get(db_pos.pair_id)
             if not pair:
                 logger.warning(
                     f"Position sync: orphaned DB position {db_pos.id} for deleted pair {db_pos.pair_id}, removing"
                 )
-                session.delete(db_pos)
+                stale_ids.append(db_pos.id)
                 continue
 
             cred_id = _resolve_credential_id(pair, default_cred_id)
             exchange_by_market = positions_by_cred.get(cred_id, {})
+            tracked_markets.add((cred_id, pair.lighter_market_a))
+            tracked_markets.add((cred_id, pair.lighter_market_b))
 
             has_leg_a = pair.lighter_market_a in exchange_by_market
             has_leg_b = pair.lighter_market_b in exchange_by_market
@@ -127,7 +213,7 @@ async def sync_positions_on_startup():
                     f"but missing leg {missing_leg}. Manual review recommended."
                 )
                 _log_sync_event(
-                    session, db_pos.pair_id,
+                    pending_logs, db_pos.pair_id,
                     f"Partial position detected: leg {missing_leg} missing on exchange. "
                     f"Leg {present_leg} still open. Manual intervention may be needed.",
                 )
@@ -137,34 +223,38 @@ async def sync_positions_on_startup():
                     f"on credential {cred_id}. Removing stale DB record."
                 )
                 _log_sync_event(
-                    session, db_pos.pair_id,
+                    pending_logs, db_pos.pair_id,
                     f"Stale position removed (direction={db_pos.direction}, "
                     f"notional=${db_pos.entry_notional:.0f}): exchange has no matching positions.",
                 )
-                session.delete(db_pos)
-
-        # Auto-recover exchange positions not tracked in DB
-        tracked_markets: set[tuple[int, int]] = set()
-        for db_pos in db_positions:
-            p = session.get(TradingPair, db_pos.pair_id)
-            if p:
-                cid = _resolve_credential_id(p, default_cred_id)
-                tracked_markets.add((cid, p.lighter_market_a))
-                tracked_markets.add((cid, p.lighter_market_b))
-
-        all_pairs = session.exec(
-            select(TradingPair).where(TradingPair.is_enabled == True)
-        ).all()
-        for pair in all_pairs:
-            if any(dp.pair_id == pair.id for dp in db_positions):
+                stale_ids.append(db_pos.id)
+
+        # Auto-recover exchange positions not tracked in DB. Index untracked
+        # enabled pairs by (credential, market) and walk the exchange
+        # positions, so only pairs with at least one open leg are visited.
+        db_pair_ids = {dp.pair_id for dp in db_positions}
+        pairs_by_market: dict[tuple[int, int], list] = {}
+        for pair in pairs_by_id.values():
+            if not pair.is_enabled or pair.id in db_pair_ids:
                 continue
             cred_id = _resolve_credential_id(pair, default_cred_id)
+            pairs_by_market.setdefault((cred_id, pair.lighter_market_a), []).append(pair)
+            pairs_by_market.setdefault((cred_id, pair.lighter_market_b), []).append(pair)
+        candidates: dict[int, object] = {}
+        for cred_id, by_market in positions_by_cred.items():
+            for market_idx in by_market:
+                for pair in pairs_by_market.get((cred_id, market_idx), ()):
+                    candidates[pair.id] = pair
+
+        for pair_id in sorted(candidates):
+            pair = candidates[pair_id]
+            cred_id = _resolve_credential_id(pair, default_cred_id)
             exchange_by_market = positions_by_cred.get(cred_id, {})
-            has_a = pair.lighter_market_a in exchange_by_market
-            has_b = pair.lighter_market_b in exchange_by_market
+            ex_a = exchange_by_market.get(pair.lighter_market_a)
+            ex_b = exchange_by_market.get(pair.lighter_market_b)
+            has_a = ex_a is not None
+            has_b = ex_b is not None
             if has_a and has_b:
-                ex_a = exchange_by_market[pair.lighter_market_a]
-                ex_b = exchange_by_market[pair.lighter_market_b]
                 direction = 1 if ex_a["side"] == "long" else -1
                 size_a = ex_a["size"]
                 size_b = ex_b["size"]
@@ -188,7 +278,7 @@ async def sync_positions_on_startup():
                     f"(direction={direction}, notional=${notional:.0f}, cred {cred_id})"
                 )
                 _log_sync_event(
-                    session, pair.id,
+                    pending_logs, pair.id,
                     f"Auto-recovered position from exchange "
                     f"(direction={direction}, hedge_ratio={hedge_ratio:.4f}, notional=${notional:.0f})",
                     status="success",
@@ -212,17 +302,21 @@ async def sync_positions_on_startup():
                         f"This may be a manually opened position or from a deleted pair."
                     )
 
+        if stale_ids:
+            session.execute(delete(OpenPosition).where(OpenPosition.id.in_(stale_ids)))
+        for i in range(0, len(pending_logs), SYNC_LOG_BATCH):
+            session.execute(insert(JobLog.__table__), pending_logs[i:i + SYNC_LOG_BATCH])
         session.commit()
 
     logger.info("Position sync complete")
 
 
-def _log_sync_event(session: Session, pair_id: int, message: str, status: str = "error"):
-    """Write a sync event to the job log."""
-    log = JobLog(
-        pair_id=pair_id,
-        status=status,
-        action="position_sync",
-        message=message,
-    )
-    session.add(log)
+def _log_sync_event(pending_logs: list[dict], pair_id: int, message: str, status: str = "error"):
+    """Queue a sync event for the bulk job log insert."""
+    pending_logs.append({
+        "pair_id": pair_id,
+        "timestamp": datetime.now(timezone.utc),
+        "status": status,
+        "action": "position_sync",
+        "message": message,
+    })
@@ -5,12 +5,15 @@ Manages per-pair interval jobs that run the trading engine.
 
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from sqlmodel import Session, select
 
-from backend.database import engine
+from backend.config import settings
+from backend.database import checkpoint_wal, engine, optimize_database
 from backend.models.trading_pair import TradingPair
 from backend.utils.constants import INTERVAL_HOURS
 
@@ -23,6 +26,7 @@ def _job_id(pair_id: int) -> str:
     return f"pair_{pair_id}"
 
 
+@lru_cache(maxsize=32)
 def _interval_to_minutes(interval: str) -> int:
     """Parse an interval string to total minutes."""
     if interval.endswith("m") and interval[:-1].isdigit():
@@ -52,11 +56,6 @@ def add_pair_job(pair_id: int, schedule_interval: str):
     from backend.engine.pair_job import run_pair_cycle
 
     job_id = _job_id(pair_id)
-
-    # Remove existing job if present
-    if scheduler.get_job(job_id):
-        scheduler.remove_job(job_id)
-
     trigger = _get_trigger(schedule_interval)
     scheduler.add_job(
         run_pair_cycle,
@@ -74,34 +73,34 @@ def add_pair_job(pair_id: int, schedule_interval: str):
 
 def remove_pair_job(pair_id: int):
     """Remove a scheduler job for a trading pair."""
-    job_id = _job_id(pair_id)
-    if scheduler.get_job(job_id):
-        scheduler.remove_job(job_id)
-        logger.info(f"Removed job for pair {pair_id}")
+    try:
+        scheduler.remove_job(_job_id(pair_id))
+    except JobLookupError:
+        return
+    logger.info(f"Removed job for pair {pair_id}")
 
 
 def reschedule_pair_job(pair_id: int, schedule_interval: str):
     """Reschedule an existing job with a new interval."""
-    job_id = _job_id(pair_id)
-    if scheduler.get_job(job_id):
-        trigger = _get_trigger(schedule_interval)
-        scheduler.reschedule_job(job_id, trigger=trigger)
-        logger.info(f"Rescheduled pair {pair_id} to {schedule_interval}")
-    else:
+    try:
+        scheduler.reschedule_job(_job_id(pair_id), trigger=_get_trigger(schedule_interval))
+    except JobLookupError:
         add_pair_job(pair_id, schedule_interval)
+        return
+    logger.info(f"Rescheduled pair {pair_id} to {schedule_interval}")
 
 
 GUARDIAN_JOB_ID = "stop_loss_guardian"
 SIMPLE_GUARDIAN_JOB_ID = "simple_trade_guardian"
+DB_OPTIMIZE_JOB_ID = "db_optimize"
+JOB_LOG_PRUNE_JOB_ID = "job_log_prune"
+WAL_CHECKPOINT_JOB_ID = "wal_checkpoint"
 
 
 def add_guardian_job(interval_minutes: int):
     """Add or replace the global stop-loss guardian job."""
     from backend.engine.stop_loss_guardian import run_stop_loss_check
 
-    if scheduler.get_job(GUARDIAN_JOB_ID):
-        scheduler.remove_job(GUARDIAN_JOB_ID)
-
     scheduler.add_job(
         run_stop_loss_check,
         trigger=IntervalTrigger(minutes=interval_minutes),
@@ -119,9 +118,6 @@ def add_simple_trade_guardian_job(interval_minutes: int):
     """Add or replace the simple trade guardian job (SL + TP monitoring)."""
     from backend.engine.simple_trade_guardian import run_simple_trade_check
 
-    if scheduler.get_job(SIMPLE_GUARDIAN_JOB_ID):
-        scheduler.remove_job(SIMPLE_GUARDIAN_JOB_ID)
-
     scheduler.add_job(
         run_simple_trade_check,
         trigger=IntervalTrigger(minutes=interval_minutes),
@@ -137,9 +133,11 @@ def add_simple_trade_guardian_job(interval_minutes: int):
 
 def remove_guardian_job():
     """Remove the guardian job if running."""
-    if scheduler.get_job(GUARDIAN_JOB_ID):
+    try:
         scheduler.remove_job(GUARDIAN_JOB_ID)
-        logger.info("Guardian job removed")
+    except JobLookupError:
+        return
+    logger.info("Guardian job removed")
 
 
 def start_scheduler():
@@ -148,18 +146,24 @@ def start_scheduler():
     from backend.models.guardian_settings import GuardianSettings
 
     with Session(engine) as session:
+        # One query for every pair in a position instead of one per pair
+        in_position = set(session.exec(select(OpenPosition.pair_id)).all())
+        # Only the scheduling columns, streamed in batches rather than
+        # materialized up front
         pairs = session.exec(
-            select(TradingPair).where(TradingPair.is_enabled == True)
-        ).all()
-        for pair in pairs:
-            interval = pair.schedule_interval
-            if pair.use_exit_schedule:
-                has_pos = session.exec(
-                    select(OpenPosition).where(OpenPosition.pair_id == pair.id)
-                ).first()
-                if has_pos:
-                    interval = pair.exit_schedule_interval
-            add_pair_job(pair.id, interval)
+            select(
+                TradingPair.id,
+                TradingPair.schedule_interval,
+                TradingPair.use_exit_schedule,
+                TradingPair.exit_schedule_interval,
+            )
+            .where(TradingPair.is_enabled == True)
+            .execution_options(yield_per=500)
+        )
+        for pair_id, interval, use_exit_schedule, exit_interval in pairs:
+            if use_exit_schedule and pair_id in in_position:
+                interval = exit_interval
+            add_pair_job(pair_id, interval)
 
         # Start guardian jobs if enabled
         guardian = session.get(GuardianSettings, 1)
@@ -167,6 +171,39 @@ def start_scheduler():
             add_guardian_job(guardian.interval_minutes)
             add_simple_trade_guardian_job(guardian.interval_minutes)
 
+    # Keep SQLite planner stats fresh as JobLog grows
+    if settings.database_url.startswith("sqlite"):
+        scheduler.add_job(
+            optimize_database,
+            trigger=IntervalTrigger(hours=6),
+            id=DB_OPTIMIZE_JOB_ID,
+            name="SQLite PRAGMA optimize",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+        scheduler.add_job(
+            checkpoint_wal,
+            trigger=IntervalTrigger(minutes=15),
+            id=WAL_CHECKPOINT_JOB_ID,
+            name="SQLite WAL checkpoint",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
+    from backend.engine.pair_job import prune_job_logs, start_job_log_writer
+    scheduler.add_job(
+        prune_job_logs,
+        trigger=IntervalTrigger(days=1),
+        id=JOB_LOG_PRUNE_JOB_ID,
+        name="Prune old job logs",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    start_job_log_writer()
+
     scheduler.start()
     logger.info(f"Scheduler started with {len(scheduler.get_jobs())} jobs")
 
@@ -27,7 +27,7 @@ async def run_simple_trade_check():
         if not trades:
             return
 
-    from backend.services.market_data import fetch_orderbook
+    from backend.services.market_data import fetch_orderbooks_batch
 
     # Fetch mid prices for all needed markets
     market_ids = set()
@@ -35,15 +35,12 @@ async def run_simple_trade_check():
         market_ids.add(t.lighter_market_a)
         market_ids.add(t.lighter_market_b)
 
-    orderbook_tasks = {mid: fetch_orderbook(mid) for mid in market_ids}
-    results = await asyncio.gather(*orderbook_tasks.values(), return_exceptions=True)
-    mid_prices = {}
-    for mid, result in zip(orderbook_tasks.keys(), results):
-        if isinstance(result, Exception):
-            logger.error(f"[simple-guardian] Failed to fetch orderbook for market {mid}: {result}")
-            mid_prices[mid] = None
-        else:
-            mid_prices[mid] = result.get("mid_price", 0.0)
+    try:
+        books = await fetch_orderbooks_batch(market_ids)
+    except Exception as e:
+        logger.error(f"[simple-guardian] Failed to fetch orderbooks for markets {sorted(market_ids)}: {e}")
+        books = {}
+    mid_prices = {mid: books[mid]["mid_price"] if mid in books else None for mid in market_ids}
 
     # Check each open trade
     close_tasks = []
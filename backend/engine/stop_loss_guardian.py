@@ -10,7 +10,6 @@ from backend.models.guardian_settings import GuardianSettings
 from backend.models.position import OpenPosition
 from backend.models.trading_pair import TradingPair
 from backend.models.credential import Credential
-from backend.services.encryption import decrypt
 
 logger = logging.getLogger(__name__)
 
@@ -67,22 +66,19 @@ async def run_stop_loss_check():
             exchange_positions_by_cred[cid] = {}
 
     # Fetch orderbook mid-prices for current prices
-    from backend.services.market_data import fetch_orderbook
+    from backend.services.market_data import fetch_orderbooks_batch
 
     market_ids = set()
     for pair, _, _ in checks:
         market_ids.add(pair.lighter_market_a)
         market_ids.add(pair.lighter_market_b)
 
-    orderbook_tasks = {mid: fetch_orderbook(mid) for mid in market_ids}
-    results = await asyncio.gather(*orderbook_tasks.values(), return_exceptions=True)
-    mid_prices = {}
-    for mid, result in zip(orderbook_tasks.keys(), results):
-        if isinstance(result, Exception):
-            logger.error(f"[guardian] Failed to fetch orderbook for market {mid}: {result}")
-            mid_prices[mid] = None
-        else:
-            mid_prices[mid] = result.get("mid_price", 0.0)
+    try:
+        books = await fetch_orderbooks_batch(market_ids)
+    except Exception as e:
+        logger.error(f"[guardian] Failed to fetch orderbooks for markets {sorted(market_ids)}: {e}")
+        books = {}
+    mid_prices = {mid: books[mid]["mid_price"] if mid in books else None for mid in market_ids}
 
     # Check each position for stop-loss breach using real exchange data
     exit_tasks = []
@@ -155,21 +151,18 @@ async def run_stop_loss_check():
 
 
 async def _fetch_exchange_positions(cred: Credential) -> dict[int, dict]:
-    """Fetch exchange positions for a credential, keyed by market_index."""
-    from backend.services.lighter_client import LighterClient
-
-    pk = decrypt(cred.private_key_encrypted)
-    client = LighterClient(
-        host=cred.lighter_host,
-        private_key=pk,
-        api_key_index=cred.api_key_index,
-        account_index=cred.account_index,
-    )
-    try:
-        raw = await client.get_positions()
-        return {p["market_index"]: p for p in raw}
-    finally:
-        await client.close()
+    """Fetch exchange positions for a credential, keyed by market_index.
+
+    Uses the shared per-credential client so each guardian tick doesn't pay
+    for a fresh client handshake.
+    """
+    from backend.engine.pair_job import _get_lighter_client
+
+    client = await _get_lighter_client(cred.id)
+    if client is None:
+        return {}
+    raw = await client.get_positions()
+    return {p["market_index"]: p for p in raw}
 
 
 async def _guardian_exit(pair, pos, price_a, price_b, execute_exit, _log_cycle):
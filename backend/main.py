@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -8,34 +9,51 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from backend.config import settings
-from backend.database import create_db_and_tables
+from backend.database import create_db_and_tables, dispose_engines
 from backend.utils.logging import setup_logging
+from backend.api.pagination import NEXT_CURSOR_HEADER
+from backend.api.responses import OrjsonResponse
 from backend.api import auth, pairs, credentials, trades, positions, dashboard, system, markets, guardian, quick_trades
 
 
+def _start_telegram_bot(main_loop: asyncio.AbstractEventLoop):
+    """Import, create and start the Telegram bot (runs in a worker thread)."""
+    from backend.services.telegram_bot import init_bot
+    bot = init_bot(main_loop)
+    bot.start()
+    return bot
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     setup_logging()
     create_db_and_tables()
-    # Sync DB positions against exchange state before starting jobs
+    # Sync DB positions against exchange state before starting jobs. The
+    # Telegram bot does not depend on the sync, so it starts alongside it.
     from backend.engine.position_sync import sync_positions_on_startup
-    await sync_positions_on_startup()
-    from backend.engine.scheduler import start_scheduler, stop_scheduler
-    start_scheduler()
-
-    # Start Telegram bot if configured
     telegram_bot = None
     if settings.telegram_bot_token:
-        from backend.services.telegram_bot import init_bot
-        telegram_bot = init_bot()
-        telegram_bot.start()
+        _, telegram_bot = await asyncio.gather(
+            sync_positions_on_startup(),
+            asyncio.to_thread(_start_telegram_bot, asyncio.get_running_loop()),
+        )
+    else:
+        await sync_positions_on_startup()
+    from backend.engine.scheduler import start_scheduler, stop_scheduler
+    start_scheduler()
 
     yield
 
     if telegram_bot:
         telegram_bot.stop()
     stop_scheduler()
+    from backend.engine.pair_job import close_lighter_clients, stop_job_log_writer
+    await stop_job_log_writer()
+    await close_lighter_clients()
+    from backend.services.market_data import close_api_clients
+    await close_api_clients()
+    await dispose_engines()
 
 
 app = FastAPI(
@@ -43,6 +61,7 @@ app = FastAPI(
     description="Lighter DEX pair trading service with admin panel",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
 app.add_middleware(
@@ -51,6 +70,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Mount routers
@@ -74,9 +94,15 @@ if _frontend_dist.exists() and not _is_dev:
 
     app.mount("/assets", StaticFiles(directory=str(_frontend_dist / "assets")), name="static-assets")
 
+    # The build is immutable for the life of the process, so list it once
+    # instead of a stat() per request. Only listed files are ever served.
+    _spa_files = frozenset(
+        p.relative_to(_frontend_dist).as_posix() for p in _frontend_dist.rglob("*") if p.is_file()
+    )
+    _spa_index = str(_frontend_dist / "index.html")
+
     @app.get("/{path:path}")
     async def serve_spa(path: str):
-        file = _frontend_dist / path
-        if file.is_file():
-            return FileResponse(str(file))
-        return FileResponse(str(_frontend_dist / "index.html"))
+        if path in _spa_files:
+            return FileResponse(str(_frontend_dist / path))
+        return FileResponse(_spa_index)
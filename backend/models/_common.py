@@ -0,0 +1,8 @@
+"""Helpers shared by the table models."""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time; the default for timestamp columns."""
+    return datetime.now(timezone.utc)
@@ -1,8 +1,10 @@
 """Credential model — encrypted Lighter DEX API credentials."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlmodel import SQLModel, Field
 
+from backend.models._common import utcnow
+
 
 class Credential(SQLModel, table=True):
     __tablename__ = "credential"
@@ -14,4 +16,4 @@ class Credential(SQLModel, table=True):
     private_key_encrypted: str = ""  # Fernet-encrypted hex private key
     account_index: str = "0"
     is_active: bool = True
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
@@ -1,8 +1,10 @@
 """GuardianSettings model — single-row config for the stop-loss guardian job."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlmodel import SQLModel, Field
 
+from backend.models._common import utcnow
+
 
 class GuardianSettings(SQLModel, table=True):
     __tablename__ = "guardian_settings"
@@ -11,4 +13,4 @@ class GuardianSettings(SQLModel, table=True):
     enabled: bool = True
     interval_minutes: int = 1
     stop_loss_pct_override: float | None = None
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=utcnow)
@@ -1,10 +1,13 @@
 """JobLog model — per-cycle execution log for each pair."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
+
+from backend.models._common import utcnow
 
 
 class JobLog(SQLModel, table=True):
@@ -12,7 +15,7 @@ class JobLog(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     pair_id: int = Field(foreign_key="trading_pair.id", index=True)
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=utcnow)
     status: str  # "success", "error", "skipped"
     z_score: float | None = None
     hedge_ratio: float | None = None
@@ -23,4 +26,10 @@ class JobLog(SQLModel, table=True):
     close_a: float | None = None
     close_b: float | None = None
     message: str | None = None
-    market_data: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
+    # Binary jsonb on PostgreSQL (parsed once on write); plain JSON elsewhere
+    market_data: dict[str, Any] | None = Field(
+        default=None, sa_column=Column(JSON().with_variant(JSONB(), "postgresql"))
+    )
+    # Raw float64 closes (prices_a, prices_b, train_a, train_b concatenated;
+    # split by the counts in market_data) when the pair has replay enabled.
+    market_blob: bytes | None = Field(default=None, sa_column=Column(LargeBinary))
@@ -1,7 +1,14 @@
 """OpenPosition model — persists open position state across restarts."""
 
-from datetime import datetime, timezone
-from sqlmodel import SQLModel, Field
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlmodel import SQLModel, Field, Relationship
+
+from backend.models._common import utcnow
+
+if TYPE_CHECKING:
+    from backend.models.trading_pair import TradingPair
 
 
 class OpenPosition(SQLModel, table=True):
@@ -16,10 +23,13 @@ class OpenPosition(SQLModel, table=True):
     entry_price_b: float
     entry_hedge_ratio: float
     entry_notional: float
-    entry_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    entry_time: datetime = Field(default_factory=utcnow)
     lighter_order_id_a: str | None = None
     lighter_order_id_b: str | None = None
     fill_price_a: float | None = None
     fill_price_b: float | None = None
     fill_amount_a: float | None = None
     fill_amount_b: float | None = None
+
+    # Read-only link for eager loading (selectinload); no backref on TradingPair.
+    pair: Optional["TradingPair"] = Relationship()
@@ -1,8 +1,10 @@
 """SimplePairTrade model — tracks quick pair trades from open to close."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlmodel import SQLModel, Field
 
+from backend.models._common import utcnow
+
 
 class SimplePairTrade(SQLModel, table=True):
     __tablename__ = "simple_pair_trade"
@@ -40,4 +42,4 @@ class SimplePairTrade(SQLModel, table=True):
     pnl: float | None = None
     pnl_pct: float | None = None
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
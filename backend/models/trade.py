@@ -1,8 +1,10 @@
 """Trade model — immutable record of every completed trade."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlmodel import SQLModel, Field
 
+from backend.models._common import utcnow
+
 
 class Trade(SQLModel, table=True):
     __tablename__ = "trade"
@@ -11,7 +13,7 @@ class Trade(SQLModel, table=True):
     pair_id: int = Field(foreign_key="trading_pair.id", index=True)
     direction: str  # "Long A / Short B" or "Short A / Long B"
     entry_time: datetime
-    exit_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    exit_time: datetime = Field(default_factory=utcnow)
     entry_price_a: float
     exit_price_a: float
     entry_price_b: float
@@ -1,8 +1,10 @@
 """TradingPair model — stores all configuration for a pair trading strategy."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlmodel import SQLModel, Field
 
+from backend.models._common import utcnow
+
 
 class TradingPair(SQLModel, table=True):
     __tablename__ = "trading_pair"
@@ -61,11 +63,12 @@ class TradingPair(SQLModel, table=True):
     use_exit_schedule: bool = False
     is_enabled: bool = True
     guardian_excluded: bool = False
+    debug_replay_enabled: bool = False  # store raw closes in JobLog for replay
 
     # Credential assignment (None = use first active credential)
     credential_id: int | None = Field(default=None, foreign_key="credential.id")
 
     # Runtime state
     current_equity: float = 0.0
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
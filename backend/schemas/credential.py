@@ -1,11 +1,46 @@
 """Pydantic schemas for Credential API."""
 
 from datetime import datetime
-import re
 
 from pydantic import BaseModel, Field, field_validator
 
-_HEX_KEY_RE = re.compile(r"^(0x)?[0-9a-fA-F]{64,}$")
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+_MIN_KEY_HEX_CHARS = 64
+_HOST_PREFIXES = ("http://", "https://")
+
+
+def _is_hex_key(key: str) -> bool:
+    """True for an optional 0x prefix followed by at least 64 hex digits."""
+    digits = key[2:] if key.startswith("0x") else key
+    # strip() with a character set is a single C-level scan; anything left
+    # over means a non-hex character was present
+    return len(digits) >= _MIN_KEY_HEX_CHARS and not digits.strip(_HEX_DIGITS)
+
+
+def _clean_name(value: str) -> str:
+    text = value.strip()
+    if not text:
+        raise ValueError("must not be empty")
+    return text
+
+
+def _clean_private_key(value: str) -> str:
+    key = value.strip()
+    if not key:
+        raise ValueError("must not be empty")
+    if not _is_hex_key(key):
+        raise ValueError("must be a hex string (at least 64 chars), with optional 0x prefix")
+    return key
+
+
+def _clean_host(value: str) -> str:
+    """Trim and validate a Lighter host URL, dropping any trailing slash."""
+    host = value.strip()
+    if not host:
+        raise ValueError("must not be empty")
+    if not host.startswith(_HOST_PREFIXES):
+        raise ValueError("must start with http:// or https://")
+    return host.rstrip("/")
 
 
 class CredentialCreate(BaseModel):
@@ -18,30 +53,17 @@ class CredentialCreate(BaseModel):
     @field_validator("name")
     @classmethod
     def _trim_name(cls, value: str) -> str:
-        text = value.strip()
-        if not text:
-            raise ValueError("must not be empty")
-        return text
+        return _clean_name(value)
 
     @field_validator("lighter_host")
     @classmethod
     def _validate_host(cls, value: str) -> str:
-        host = value.strip()
-        if not host:
-            raise ValueError("must not be empty")
-        if not (host.startswith("http://") or host.startswith("https://")):
-            raise ValueError("must start with http:// or https://")
-        return host.rstrip("/")
+        return _clean_host(value)
 
     @field_validator("private_key")
     @classmethod
     def _validate_private_key(cls, value: str) -> str:
-        key = value.strip()
-        if not key:
-            raise ValueError("must not be empty")
-        if not _HEX_KEY_RE.fullmatch(key):
-            raise ValueError("must be a hex string (at least 64 chars), with optional 0x prefix")
-        return key
+        return _clean_private_key(value)
 
 
 class CredentialUpdate(BaseModel):
@@ -57,34 +79,21 @@ class CredentialUpdate(BaseModel):
     def _trim_optional_name(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        text = value.strip()
-        if not text:
-            raise ValueError("must not be empty")
-        return text
+        return _clean_name(value)
 
     @field_validator("lighter_host")
     @classmethod
     def _validate_optional_host(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        host = value.strip()
-        if not host:
-            raise ValueError("must not be empty")
-        if not (host.startswith("http://") or host.startswith("https://")):
-            raise ValueError("must start with http:// or https://")
-        return host.rstrip("/")
+        return _clean_host(value)
 
     @field_validator("private_key")
     @classmethod
     def _validate_optional_private_key(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        key = value.strip()
-        if not key:
-            raise ValueError("must not be empty")
-        if not _HEX_KEY_RE.fullmatch(key):
-            raise ValueError("must be a hex string (at least 64 chars), with optional 0x prefix")
-        return key
+        return _clean_private_key(value)
 
 
 class CredentialRead(BaseModel):
@@ -98,3 +107,8 @@ class CredentialRead(BaseModel):
     # private_key is NEVER exposed
 
     model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_trusted(cls, row) -> "CredentialRead":
+        """Build from a DB row without re-running validation (data is trusted)."""
+        return cls.model_construct(**{f: getattr(row, f) for f in cls.model_fields})
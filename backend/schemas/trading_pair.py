@@ -1,10 +1,39 @@
 """Pydantic schemas for TradingPair API."""
 
+import re
 from datetime import datetime
 from typing import Literal
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from backend.utils.constants import VALID_INTERVALS
+from backend.utils.constants import VALID_INTERVALS, VALID_INTERVALS_SET
+
+_INTERVALS_MSG = "must be one of: " + ", ".join(VALID_INTERVALS)
+_SCHEDULE_INTERVAL_RE = re.compile(r"^\d+m$")
+# Fields the cross-field checks compare
+_RELATIONSHIP_FIELDS = frozenset({"rsi_lower", "rsi_upper", "window_candles", "train_candles"})
+
+
+# Shared by the Create (required) and Update (optional) validators below.
+def _clean_text(value: str) -> str:
+    text = value.strip()
+    if not text:
+        raise ValueError("must not be empty")
+    return text
+
+
+def _clean_interval(value: str) -> str:
+    if value not in VALID_INTERVALS_SET:
+        raise ValueError(_INTERVALS_MSG)
+    return value
+
+
+def _clean_schedule_interval(value: str) -> str:
+    if not _SCHEDULE_INTERVAL_RE.match(value):
+        raise ValueError("must be in format '<number>m', e.g. '10m'")
+    minutes = int(value[:-1])
+    if minutes < 1:
+        raise ValueError("must be at least 1m")
+    return value
 
 
 class TradingPairCreate(BaseModel):
@@ -45,34 +74,23 @@ class TradingPairCreate(BaseModel):
     use_exit_schedule: bool = False
     is_enabled: bool = True
     guardian_excluded: bool = False
+    debug_replay_enabled: bool = False
     credential_id: int | None = None
 
     @field_validator("asset_a", "asset_b")
     @classmethod
     def _trim_required_text(cls, value: str) -> str:
-        text = value.strip()
-        if not text:
-            raise ValueError("must not be empty")
-        return text
+        return _clean_text(value)
 
     @field_validator("window_interval", "train_interval")
     @classmethod
     def _validate_interval(cls, value: str) -> str:
-        if value not in VALID_INTERVALS:
-            allowed = ", ".join(VALID_INTERVALS)
-            raise ValueError(f"must be one of: {allowed}")
-        return value
+        return _clean_interval(value)
 
     @field_validator("schedule_interval", "exit_schedule_interval")
     @classmethod
     def _validate_schedule_interval(cls, value: str) -> str:
-        import re
-        if not re.match(r"^\d+m$", value):
-            raise ValueError("must be in format '<number>m', e.g. '10m'")
-        minutes = int(value[:-1])
-        if minutes < 1:
-            raise ValueError("must be at least 1m")
-        return value
+        return _clean_schedule_interval(value)
 
     @model_validator(mode="after")
     def _validate_relationships(self):
@@ -121,6 +139,7 @@ class TradingPairUpdate(BaseModel):
     use_exit_schedule: bool | None = None
     is_enabled: bool | None = None
     guardian_excluded: bool | None = None
+    debug_replay_enabled: bool | None = None
     credential_id: int | None = None
 
     @field_validator("name", "asset_a", "asset_b")
@@ -128,36 +147,27 @@ class TradingPairUpdate(BaseModel):
     def _trim_optional_text(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        text = value.strip()
-        if not text:
-            raise ValueError("must not be empty")
-        return text
+        return _clean_text(value)
 
     @field_validator("window_interval", "train_interval")
     @classmethod
     def _validate_optional_interval(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        if value not in VALID_INTERVALS:
-            allowed = ", ".join(VALID_INTERVALS)
-            raise ValueError(f"must be one of: {allowed}")
-        return value
+        return _clean_interval(value)
 
     @field_validator("schedule_interval", "exit_schedule_interval")
     @classmethod
     def _validate_optional_schedule_interval(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        import re
-        if not re.match(r"^\d+m$", value):
-            raise ValueError("must be in format '<number>m', e.g. '10m'")
-        minutes = int(value[:-1])
-        if minutes < 1:
-            raise ValueError("must be at least 1m")
-        return value
+        return _clean_schedule_interval(value)
 
     @model_validator(mode="after")
     def _validate_optional_relationships(self):
+        # Partial updates usually touch none of these (e.g. toggling is_enabled)
+        if self.model_fields_set.isdisjoint(_RELATIONSHIP_FIELDS):
+            return self
         if (
             self.rsi_lower is not None
             and self.rsi_upper is not None
@@ -212,9 +222,15 @@ class TradingPairRead(BaseModel):
     use_exit_schedule: bool
     is_enabled: bool
     guardian_excluded: bool
+    debug_replay_enabled: bool
     credential_id: int | None
     current_equity: float
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_trusted(cls, row) -> "TradingPairRead":
+        """Build from a DB row without re-running validation (data is trusted)."""
+        return cls.model_construct(**{f: getattr(row, f) for f in cls.model_fields})
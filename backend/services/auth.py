@@ -1,6 +1,8 @@
 """Authentication utilities: password hashing, JWT tokens, TOTP verification."""
 
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import bcrypt
 from jose import JWTError, jwt
@@ -8,10 +10,20 @@ import pyotp
 
 from backend.config import settings
 
+# Built once; jwt.decode only reads it
+_JWT_ALGORITHMS = [settings.jwt_algorithm]
 
+# token -> (exp epoch seconds, subject). A verified token's claims cannot
+# change before it expires, so repeat requests skip the HMAC + JSON decode.
+_DECODED_TOKEN_MAX = 1024
+_decoded_tokens: dict[str, tuple[float, str]] = {}
+
+
+# bcrypt is deliberately slow (and releases the GIL), so async callers run
+# these in a worker thread, as the login endpoint does.
 def hash_password(password: str) -> str:
     pw = password.encode("utf-8")[:72]
-    return bcrypt.hashpw(pw, bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(pw, bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -27,16 +39,32 @@ def create_access_token(subject: str) -> str:
 
 def decode_access_token(token: str) -> str | None:
     """Decode JWT and return the subject (username). Returns None on failure."""
+    cached = _decoded_tokens.get(token)
+    if cached is not None:
+        if cached[0] > time.time():
+            return cached[1]
+        _decoded_tokens.pop(token, None)
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        return payload.get("sub")
+        payload = jwt.decode(token, settings.jwt_secret, algorithms=_JWT_ALGORITHMS)
     except JWTError:
         return None
+    subject = payload.get("sub")
+    exp = payload.get("exp")
+    if subject is not None and isinstance(exp, (int, float)):
+        if len(_decoded_tokens) >= _DECODED_TOKEN_MAX:
+            _decoded_tokens.clear()
+        _decoded_tokens[token] = (exp, subject)
+    return subject
+
+
+@lru_cache(maxsize=256)
+def _totp(secret: str) -> pyotp.TOTP:
+    """One TOTP object per secret; verify() and provisioning_uri() are stateless."""
+    return pyotp.TOTP(secret)
 
 
 def verify_totp(secret: str, code: str) -> bool:
-    totp = pyotp.TOTP(secret)
-    return totp.verify(code, valid_window=1)
+    return _totp(secret).verify(code, valid_window=1)
 
 
 def generate_totp_secret() -> str:
@@ -44,7 +72,7 @@ def generate_totp_secret() -> str:
 
 
 def get_totp_uri(secret: str, username: str) -> str:
-    return pyotp.TOTP(secret).provisioning_uri(
+    return _totp(secret).provisioning_uri(
         name=username,
         issuer_name="Trading Service",
     )
@@ -1,17 +1,22 @@
 """Emergency stop: close all positions and optionally disable all pairs."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
+from sqlalchemy import func, or_, update
 from sqlmodel import Session, select
 
 from backend.database import engine
+from backend.engine.pair_job import _get_lighter_client
+from backend.engine.scheduler import remove_pair_job
 from backend.models.position import OpenPosition
 from backend.models.trade import Trade
 from backend.models.trading_pair import TradingPair
 from backend.models.equity_snapshot import EquitySnapshot
 from backend.models.credential import Credential
-from backend.services.encryption import decrypt
+from backend.services.market_data import fetch_pair_data
+from backend.utils.constants import CLOSE_IS_ASK, DIRECTION_LABELS, INTERVAL_HOURS
 
 logger = logging.getLogger(__name__)
 
@@ -29,169 +34,180 @@ async def run_emergency_stop(
     if close_positions:
         with Session(engine) as session:
             positions = session.exec(select(OpenPosition)).all()
+            # Load every pair and credential the positions need up front
+            # instead of two lookups per position
+            pair_ids = {pos.pair_id for pos in positions}
+            pairs_by_id = {
+                p.id: p
+                for p in session.exec(select(TradingPair).where(TradingPair.id.in_(pair_ids))).all()
+            }
+            cred_ids = {p.credential_id for p in pairs_by_id.values() if p.credential_id}
+            creds = session.exec(
+                select(Credential).where(
+                    or_(Credential.id.in_(cred_ids), Credential.is_active == True)
+                )
+            ).all()
+        creds_by_id = {c.id: c for c in creds}
+        default_cred = next((c for c in creds if c.is_active), None)
 
+        closes = []
         for pos in positions:
-            try:
-                await _close_position(pos)
-                result["positions_closed"] += 1
-            except Exception as e:
-                error_msg = f"Failed to close position {pos.id} (pair {pos.pair_id}): {e}"
+            pair = pairs_by_id.get(pos.pair_id)
+            cred = None
+            if pair:
+                cred = creds_by_id.get(pair.credential_id) if pair.credential_id else default_cred
+            closes.append(_close_position(pos, pair, cred))
+
+        # Close every position concurrently; orders on a shared credential
+        # still serialize on that client's signing lock
+        outcomes = await asyncio.gather(*closes, return_exceptions=True)
+        for pos, outcome in zip(positions, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                error_msg = f"Failed to close position {pos.id} (pair {pos.pair_id}): {outcome}"
                 logger.error(error_msg)
                 result["errors"].append(error_msg)
+            else:
+                result["positions_closed"] += 1
 
     if disable_pairs:
-        from backend.engine.scheduler import remove_pair_job
-
+        # One UPDATE for every enabled pair; RETURNING gives the ids whose
+        # jobs need removing
         with Session(engine) as session:
-            pairs = session.exec(
-                select(TradingPair).where(TradingPair.is_enabled == True)
-            ).all()
-
-            for pair in pairs:
-                pair.is_enabled = False
-                pair.updated_at = datetime.now(timezone.utc)
-                session.add(pair)
-                remove_pair_job(pair.id)
-                result["pairs_disabled"] += 1
-
+            disabled_ids = session.exec(
+                update(TradingPair)
+                .where(TradingPair.is_enabled == True)
+                .values(is_enabled=False, updated_at=datetime.now(timezone.utc))
+                .returning(TradingPair.id)
+            ).scalars().all()
             session.commit()
 
+        for pair_id in disabled_ids:
+            remove_pair_job(pair_id)
+        result["pairs_disabled"] = len(disabled_ids)
+
     return result
 
 
-async def _close_position(position: OpenPosition):
+async def _close_position(
+    position: OpenPosition,
+    pair: TradingPair | None,
+    cred: Credential | None,
+):
     """Close a single position by placing reverse orders."""
-    from backend.services.lighter_client import LighterClient
+    if not pair:
+        raise ValueError(f"Pair {position.pair_id} not found")
+    if not cred:
+        raise ValueError("No active credential")
+
+    # Shared per-credential client: no handshake per position, and its
+    # signing lock serializes these orders with any running pair job
+    client = await _get_lighter_client(cred.id)
+    if client is None:
+        raise ValueError(f"Credential {cred.id} not found")
+
+    data = await fetch_pair_data(
+        asset_a=pair.asset_a,
+        asset_b=pair.asset_b,
+        window_interval=pair.window_interval,
+        window_candles=5,
+        train_interval=pair.train_interval,
+        train_candles=5,
+        market_id_a=pair.lighter_market_a,
+        market_id_b=pair.lighter_market_b,
+    )
+    current_price_a = float(data["prices_a"].to_numpy()[-1])
+    current_price_b = float(data["prices_b"].to_numpy()[-1])
+
+    dollar_per_unit = position.entry_price_a + abs(position.entry_hedge_ratio) * position.entry_price_b
+    units = position.entry_notional / dollar_per_unit if dollar_per_unit > 0 else 0
+
+    # Reverse directions for close
+    is_ask_a, is_ask_b = CLOSE_IS_ASK[position.direction]
+
+    size_a = abs(units)
+    size_b = abs(units * position.entry_hedge_ratio)
+
+    # Both legs signed together and sent in one batch call
+    pair_result = await client.place_pair_orders(
+        market_index_a=pair.lighter_market_a,
+        base_amount_a=size_a,
+        price_a=current_price_a,
+        is_ask_a=is_ask_a,
+        market_index_b=pair.lighter_market_b,
+        base_amount_b=size_b,
+        price_b=current_price_b,
+        is_ask_b=is_ask_b,
+    )
+    result_a, result_b = pair_result.result_a, pair_result.result_b
+
+    if not pair_result.success:
+        err = pair_result.error or result_a.error or result_b.error
+        raise RuntimeError(f"Close order failed: {err}")
+
+    # Compute PnL
+    spread_change = (
+        (current_price_a - position.entry_hedge_ratio * current_price_b)
+        - position.entry_spread
+    )
+    pnl = position.direction * spread_change * units
+    pnl_pct = pnl / pair.current_equity * 100 if pair.current_equity > 0 else 0
+
+    direction_str = DIRECTION_LABELS[position.direction]
+
+    # One clock read after the fill for duration, exit_time and updated_at
+    now = datetime.now(timezone.utc)
+
+    # Compute duration in candles
+    et = position.entry_time if position.entry_time.tzinfo else position.entry_time.replace(tzinfo=timezone.utc)
+    elapsed = (now - et).total_seconds()
+    interval_sec = INTERVAL_HOURS.get(pair.window_interval, 1.0) * 3600
+    duration = int(elapsed / interval_sec) if interval_sec > 0 else 0
 
     with Session(engine) as session:
-        pair = session.get(TradingPair, position.pair_id)
-        if not pair:
-            raise ValueError(f"Pair {position.pair_id} not found")
-
-        if pair.credential_id:
-            cred = session.get(Credential, pair.credential_id)
-        else:
-            cred = session.exec(
-                select(Credential).where(Credential.is_active == True)
-            ).first()
-        if not cred:
-            raise ValueError("No active credential")
-
-        pk = decrypt(cred.private_key_encrypted)
-        client = LighterClient(
-            host=cred.lighter_host,
-            private_key=pk,
-            api_key_index=cred.api_key_index,
-            account_index=cred.account_index,
+        trade = Trade(
+            pair_id=pair.id,
+            direction=direction_str,
+            entry_time=position.entry_time,
+            exit_time=now,
+            entry_price_a=position.entry_price_a,
+            exit_price_a=current_price_a,
+            entry_price_b=position.entry_price_b,
+            exit_price_b=current_price_b,
+            size_a=round(size_a, 4),
+            size_b=round(size_b, 4),
+            hedge_ratio=position.entry_hedge_ratio,
+            pnl=round(pnl, 2),
+            pnl_pct=round(pnl_pct, 2),
+            exit_reason="emergency_stop",
+            duration_candles=duration,
         )
-
-    try:
-        from backend.services.market_data import fetch_pair_data
-
-        data = await fetch_pair_data(
-            asset_a=pair.asset_a,
-            asset_b=pair.asset_b,
-            window_interval=pair.window_interval,
-            window_candles=5,
-            train_interval=pair.train_interval,
-            train_candles=5,
-            market_id_a=pair.lighter_market_a,
-            market_id_b=pair.lighter_market_b,
+        session.add(trade)
+
+        db_pair = session.get(TradingPair, pair.id)
+        db_pair.current_equity += pnl
+        db_pair.updated_at = now
+        session.add(db_pair)
+
+        peak_equity = session.exec(
+            select(func.max(EquitySnapshot.equity))
+            .where(EquitySnapshot.pair_id == pair.id)
+        ).one_or_none() or db_pair.current_equity
+        new_equity = round(db_pair.current_equity, 2)
+        dd_pct = round((new_equity - peak_equity) / peak_equity * 100, 2) if peak_equity > 0 else 0.0
+
+        snapshot = EquitySnapshot(
+            pair_id=pair.id,
+            equity=new_equity,
+            drawdown_pct=min(dd_pct, 0.0),
         )
-        current_price_a = float(data["prices_a"].iloc[-1])
-        current_price_b = float(data["prices_b"].iloc[-1])
-
-        dollar_per_unit = position.entry_price_a + abs(position.entry_hedge_ratio) * position.entry_price_b
-        units = position.entry_notional / dollar_per_unit if dollar_per_unit > 0 else 0
-
-        # Reverse directions for close
-        is_ask_a = position.direction == 1
-        is_ask_b = position.direction == -1
-
-        size_a = abs(units)
-        size_b = abs(units * position.entry_hedge_ratio)
+        session.add(snapshot)
 
-        result_a = await client.place_order(
-            market_index=pair.lighter_market_a,
-            base_amount=size_a,
-            price=current_price_a,
-            is_ask=is_ask_a,
-        )
-        result_b = await client.place_order(
-            market_index=pair.lighter_market_b,
-            base_amount=size_b,
-            price=current_price_b,
-            is_ask=is_ask_b,
-        )
-
-        if not result_a.success or not result_b.success:
-            err = result_a.error or result_b.error
-            raise RuntimeError(f"Close order failed: {err}")
-
-        # Compute PnL
-        spread_change = (
-            (current_price_a - position.entry_hedge_ratio * current_price_b)
-            - position.entry_spread
-        )
-        pnl = position.direction * spread_change * units
-        pnl_pct = pnl / pair.current_equity * 100 if pair.current_equity > 0 else 0
-
-        direction_str = "Long A / Short B" if position.direction == 1 else "Short A / Long B"
-
-        # Compute duration in candles
-        from backend.utils.constants import INTERVAL_HOURS
-        et = position.entry_time if position.entry_time.tzinfo else position.entry_time.replace(tzinfo=timezone.utc)
-        elapsed = (datetime.now(timezone.utc) - et).total_seconds()
-        interval_sec = INTERVAL_HOURS.get(pair.window_interval, 1.0) * 3600
-        duration = int(elapsed / interval_sec) if interval_sec > 0 else 0
-
-        with Session(engine) as session:
-            trade = Trade(
-                pair_id=pair.id,
-                direction=direction_str,
-                entry_time=position.entry_time,
-                exit_time=datetime.now(timezone.utc),
-                entry_price_a=position.entry_price_a,
-                exit_price_a=current_price_a,
-                entry_price_b=position.entry_price_b,
-                exit_price_b=current_price_b,
-                size_a=round(size_a, 4),
-                size_b=round(size_b, 4),
-                hedge_ratio=position.entry_hedge_ratio,
-                pnl=round(pnl, 2),
-                pnl_pct=round(pnl_pct, 2),
-                exit_reason="emergency_stop",
-                duration_candles=duration,
-            )
-            session.add(trade)
-
-            db_pair = session.get(TradingPair, pair.id)
-            db_pair.current_equity += pnl
-            db_pair.updated_at = datetime.now(timezone.utc)
-            session.add(db_pair)
-
-            from sqlalchemy import func
-            peak_equity = session.exec(
-                select(func.max(EquitySnapshot.equity))
-                .where(EquitySnapshot.pair_id == pair.id)
-            ).one_or_none() or db_pair.current_equity
-            new_equity = round(db_pair.current_equity, 2)
-            dd_pct = round((new_equity - peak_equity) / peak_equity * 100, 2) if peak_equity > 0 else 0.0
-
-            snapshot = EquitySnapshot(
-                pair_id=pair.id,
-                equity=new_equity,
-                drawdown_pct=min(dd_pct, 0.0),
-            )
-            session.add(snapshot)
-
-            db_pos = session.get(OpenPosition, position.id)
-            if db_pos:
-                session.delete(db_pos)
-
-            session.commit()
+        db_pos = session.get(OpenPosition, position.id)
+        if db_pos:
+            session.delete(db_pos)
 
-        logger.info(f"[emergency_stop] Closed position for pair {pair.name}: PnL=${pnl:.2f}")
+        session.commit()
 
-    finally:
-        await client.close()
+    logger.info(f"[emergency_stop] Closed position for pair {pair.name}: PnL=${pnl:.2f}")
@@ -1,23 +1,43 @@
 """Fernet symmetric encryption for storing credentials."""
 
+import threading
+from functools import cache
+
 from cryptography.fernet import Fernet
 
 from backend.config import settings
 
-_fernet: Fernet | None = None
 
+def _build_fernet(key: str | bytes) -> Fernet:
+    return Fernet(key.encode() if isinstance(key, str) else key)
+
+
+# credential id -> (ciphertext, plaintext). Keyed on the ciphertext too so a
+# re-encrypted key is never served stale even if invalidation is missed.
+_pk_cache: dict[int, tuple[str, str]] = {}
+_pk_cache_lock = threading.Lock()
 
+
+@cache
 def _get_fernet() -> Fernet:
-    global _fernet
-    if _fernet is None:
-        key = settings.encryption_key
-        if not key:
-            raise RuntimeError(
-                "TS_ENCRYPTION_KEY not set. Generate one with: "
-                "python -c \"from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())\""
-            )
-        _fernet = Fernet(key.encode() if isinstance(key, str) else key)
-    return _fernet
+    # Cached after the first successful build; a missing or bad key raises
+    # and is retried on the next call.
+    key = settings.encryption_key
+    if not key:
+        raise RuntimeError(
+            "TS_ENCRYPTION_KEY not set. Generate one with: "
+            "python -c \"from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())\""
+        )
+    return _build_fernet(key)
+
+
+# Warm the cache at import when the key is configured. A bad key is left for
+# _get_fernet() to report on first use.
+if settings.encryption_key:
+    try:
+        _get_fernet()
+    except ValueError:
+        pass
 
 
 def encrypt(plaintext: str) -> str:
@@ -27,4 +47,24 @@ def encrypt(plaintext: str) -> str:
 
 def decrypt(ciphertext: str) -> str:
     """Decrypt a base64-encoded ciphertext and return plaintext."""
-    return _get_fernet().decrypt(ciphertext.encode()).decode()
+    # Fernet base64-decodes str tokens itself; no ttl means no timestamp check
+    return _get_fernet().decrypt(ciphertext).decode()
+
+
+def get_decrypted_pk(cred) -> str:
+    """Return the decrypted private key for a Credential, memoized per id."""
+    ciphertext = cred.private_key_encrypted
+    with _pk_cache_lock:
+        cached = _pk_cache.get(cred.id)
+    if cached is not None and cached[0] == ciphertext:
+        return cached[1]
+    plaintext = decrypt(ciphertext)
+    with _pk_cache_lock:
+        _pk_cache[cred.id] = (ciphertext, plaintext)
+    return plaintext
+
+
+def invalidate_decrypted_pk(credential_id: int):
+    """Forget a cached key when its credential is updated or deleted."""
+    with _pk_cache_lock:
+        _pk_cache.pop(credential_id, None)
@@ -8,10 +8,26 @@ import logging
 import time
 from dataclasses import dataclass, field
 
+try:
+    import lighter
+except ImportError:  # LighterClient falls back to mock mode
+    lighter = None
+
 logger = logging.getLogger(__name__)
 
+# How long an account snapshot is reused across balance/position reads
+ACCOUNT_CACHE_TTL = 1.0
+
+
+def _to_ticks(value: float, scale: int) -> int:
+    """Encode a price/size as integer ticks, rounding half away from zero.
+
+    round() rounds ties to even, so half-ticks would alternate direction.
+    """
+    return int(value * scale + (0.5 if value >= 0 else -0.5))
 
-@dataclass
+
+@dataclass(slots=True)
 class OrderResult:
     success: bool
     order_id: str | None = None
@@ -19,10 +35,12 @@ class OrderResult:
     filled_price: float | None = None
     filled_amount: float | None = None
     order_status: str | None = None
-    raw_response: str | None = None
+    # SDK response object, kept as-is so the order path never pays for str();
+    # stringified by whoever persists it
+    raw_response: object | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PairOrderResult:
     success: bool
     result_a: OrderResult
@@ -47,8 +65,11 @@ class LighterClient:
         self._api_client = None
         self._signer_client = None
         self._mock_mode = False
-        self._market_meta: dict[int, dict] = {}  # market_index → {price_decimals, size_decimals}
+        self._market_meta: dict[int, dict] = {}  # market_index → {price/size_decimals, price/size_scale}
         self._sign_lock = asyncio.Lock()
+        self._market_meta_lock = asyncio.Lock()
+        self._meta_prefetch: asyncio.Future | None = None
+        self._account_cache: tuple[float, object] | None = None  # (fetched_at, account)
         self._last_sign_ts: float = 0.0
         self.min_sign_interval: float = 1.1  # 60 req/min rate limit → ~1s between signed txs
 
@@ -57,9 +78,12 @@ class LighterClient:
         if self._api_client is not None:
             return
 
-        try:
-            import lighter
+        if lighter is None:
+            logger.warning("lighter-sdk not installed; using mock mode")
+            self._mock_mode = True
+            return
 
+        try:
             config = lighter.Configuration(host=self.host)
             self._api_client = lighter.ApiClient(configuration=config)
             self._signer_client = lighter.SignerClient(
@@ -68,9 +92,9 @@ class LighterClient:
                 api_private_keys={self.api_key_index: self.private_key},
             )
             logger.info("Lighter SDK clients initialized")
-        except ImportError:
-            logger.warning("lighter-sdk not installed; using mock mode")
-            self._mock_mode = True
+            # Warm the market metadata cache in the background so the first
+            # order doesn't wait on it
+            self._meta_prefetch = asyncio.ensure_future(self._prefetch_market_meta())
         except Exception as e:
             logger.error(f"Failed to initialize Lighter clients: {e}")
             raise
@@ -99,7 +123,6 @@ class LighterClient:
                     await old.close()
                 except Exception as e:
                     logger.debug(f"Ignoring error closing old signer: {e}")
-            import lighter
             self._signer_client = lighter.SignerClient(
                 url=self.host,
                 account_index=self.account_index,
@@ -120,25 +143,47 @@ class LighterClient:
             or "nonce" in e
         )
 
-    async def _get_market_meta(self, market_index: int) -> dict:
-        """Fetch and cache price/size decimal info for a market."""
-        if market_index in self._market_meta:
-            return self._market_meta[market_index]
-
-        import lighter
+    async def _load_market_meta(self):
+        """Load price/size decimals for every market in one request (call while holding _market_meta_lock)."""
         order_api = lighter.OrderApi(self._api_client)
-        resp = await order_api.order_book_details(market_id=market_index)
+        resp = await order_api.order_book_details()
         # resp.order_book_details = perps markets, resp.spot_order_book_details = spot
         for book in (resp.order_book_details or []) + (resp.spot_order_book_details or []):
-            if book.market_id == market_index:
-                meta = {
-                    "price_decimals": int(book.supported_price_decimals),
-                    "size_decimals": int(book.supported_size_decimals),
-                }
-                self._market_meta[market_index] = meta
-                logger.info(f"Market {market_index} meta: {meta}")
-                return meta
-        raise ValueError(f"Could not find market metadata for market_index={market_index}")
+            price_decimals = int(book.supported_price_decimals)
+            size_decimals = int(book.supported_size_decimals)
+            self._market_meta[book.market_id] = {
+                "price_decimals": price_decimals,
+                "size_decimals": size_decimals,
+                "price_scale": 10 ** price_decimals,
+                "size_scale": 10 ** size_decimals,
+            }
+        logger.info(f"Loaded metadata for {len(self._market_meta)} markets")
+
+    async def _prefetch_market_meta(self):
+        try:
+            async with self._market_meta_lock:
+                await self._load_market_meta()
+        except Exception as e:
+            logger.warning(f"Market metadata prefetch failed: {e}")
+
+    async def _get_market_meta(self, market_index: int) -> dict:
+        """Return cached price/size decimal info for a market.
+
+        The cache is filled by the prefetch started in _ensure_clients; a
+        miss (e.g. a market listed since) reloads every market's details.
+        """
+        meta = self._market_meta.get(market_index)
+        if meta is not None:
+            return meta
+
+        async with self._market_meta_lock:
+            meta = self._market_meta.get(market_index)
+            if meta is None:
+                await self._load_market_meta()
+                meta = self._market_meta.get(market_index)
+        if meta is None:
+            raise ValueError(f"Could not find market metadata for market_index={market_index}")
+        return meta
 
     async def test_connection(self) -> dict:
         """Test connectivity to Lighter."""
@@ -148,8 +193,6 @@ class LighterClient:
             return {"status": "mock", "message": "lighter-sdk not installed"}
 
         try:
-            import lighter
-
             account_api = lighter.AccountApi(self._api_client)
             account = await account_api.account(
                 by="index", value=str(self.account_index)
@@ -193,12 +236,13 @@ class LighterClient:
 
         try:
             meta = await self._get_market_meta(market_index)
-            price_int = int(round(price * 10 ** meta["price_decimals"]))
-            amount_int = int(round(base_amount * 10 ** meta["size_decimals"]))
-            logger.debug(
-                f"Order encode: price={price} → {price_int} ({meta['price_decimals']}dp), "
-                f"amount={base_amount} → {amount_int} ({meta['size_decimals']}dp)"
-            )
+            price_int = _to_ticks(price, meta["price_scale"])
+            amount_int = _to_ticks(base_amount, meta["size_scale"])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Order encode: price={price} → {price_int} ({meta['price_decimals']}dp), "
+                    f"amount={base_amount} → {amount_int} ({meta['size_decimals']}dp)"
+                )
 
             async with self._sign_lock:
                 await self._throttle()
@@ -229,15 +273,15 @@ class LighterClient:
                     logger.error(f"Order rejected: {error}")
                     if self._is_sign_error(str(error)):
                         await self.reinit_signer()
-                    return OrderResult(success=False, error=str(error), raw_response=str(resp) if resp else None)
+                    return OrderResult(success=False, error=str(error), raw_response=resp)
             order_id = str(client_order_index)
             # avg_execution_price is the actual fill; order.price is the limit/worst we submitted
             raw_price = getattr(order, "avg_execution_price", None) or getattr(order, "price", None)
             raw_amount = getattr(order, "filled_amount", None) or getattr(order, "base_amount", None)
             order_status = getattr(order, "status", None)
             # Decode raw integer values back to human-readable using market decimals
-            filled_price = float(raw_price) / 10 ** meta["price_decimals"] if raw_price is not None else None
-            filled_amount = float(raw_amount) / 10 ** meta["size_decimals"] if raw_amount is not None else None
+            filled_price = float(raw_price) / meta["price_scale"] if raw_price is not None else None
+            filled_amount = float(raw_amount) / meta["size_scale"] if raw_amount is not None else None
             logger.info(f"Order placed: {order_id} ({'market' if market else 'limit'}), fill_price={filled_price}, fill_amount={filled_amount}")
             return OrderResult(
                 success=True,
@@ -245,7 +289,7 @@ class LighterClient:
                 filled_price=filled_price,
                 filled_amount=filled_amount,
                 order_status=str(order_status) if order_status is not None else None,
-                raw_response=str(resp) if resp else None,
+                raw_response=resp,
             )
         except Exception as e:
             logger.error(f"Order failed: {e}")
@@ -298,13 +342,15 @@ class LighterClient:
         api_key_idx = self.api_key_index
 
         try:
-            meta_a = await self._get_market_meta(market_index_a)
-            meta_b = await self._get_market_meta(market_index_b)
+            meta_a, meta_b = await asyncio.gather(
+                self._get_market_meta(market_index_a),
+                self._get_market_meta(market_index_b),
+            )
 
-            price_int_a = int(round(price_a * 10 ** meta_a["price_decimals"]))
-            amount_int_a = int(round(base_amount_a * 10 ** meta_a["size_decimals"]))
-            price_int_b = int(round(price_b * 10 ** meta_b["price_decimals"]))
-            amount_int_b = int(round(base_amount_b * 10 ** meta_b["size_decimals"]))
+            price_int_a = _to_ticks(price_a, meta_a["price_scale"])
+            amount_int_a = _to_ticks(base_amount_a, meta_a["size_scale"])
+            price_int_b = _to_ticks(price_b, meta_b["price_scale"])
+            amount_int_b = _to_ticks(base_amount_b, meta_b["size_scale"])
 
             order_type = 1 if market else 0
             time_in_force = 0 if market else 1
@@ -378,7 +424,6 @@ class LighterClient:
             filled_amount_a = base_amount_a
             filled_price_b = price_b
             filled_amount_b = base_amount_b
-            raw = str(batch_resp)
 
             logger.info(
                 f"Batch placed: A={client_order_index_a} (market{market_index_a}), "
@@ -388,11 +433,11 @@ class LighterClient:
                 success=True,
                 result_a=OrderResult(
                     success=True, order_id=str(client_order_index_a),
-                    filled_price=filled_price_a, filled_amount=filled_amount_a, raw_response=raw,
+                    filled_price=filled_price_a, filled_amount=filled_amount_a, raw_response=batch_resp,
                 ),
                 result_b=OrderResult(
                     success=True, order_id=str(client_order_index_b),
-                    filled_price=filled_price_b, filled_amount=filled_amount_b, raw_response=raw,
+                    filled_price=filled_price_b, filled_amount=filled_amount_b, raw_response=batch_resp,
                 ),
             )
 
@@ -457,25 +502,73 @@ class LighterClient:
                     await self.reinit_signer()
             return False
 
+    async def cancel_orders(self, market_index: int, order_ids: list[str]) -> bool:
+        """Cancel several orders on one market with a single signed batch.
+
+        Same nonce handling as place_pair_orders: every cancel is signed under
+        one _sign_lock hold and sent in one send_tx_batch, so N cancels cost
+        one throttle slot and one round trip.
+        """
+        if len(order_ids) <= 1:
+            return await self.cancel_order(market_index, order_ids[0]) if order_ids else True
+
+        await self._ensure_clients()
+        if self._mock_mode:
+            logger.info(f"MOCK cancel: market={market_index}, orders={order_ids}")
+            return True
+
+        nm = None
+        nonces_obtained = 0
+        api_key_idx = self.api_key_index
+        try:
+            async with self._sign_lock:
+                await self._throttle()
+
+                nm = self._signer_client.nonce_manager
+                tx_types, tx_infos = [], []
+                for order_id in order_ids:
+                    api_key_idx, nonce = nm.next_nonce(api_key=self.api_key_index)
+                    nonces_obtained += 1
+                    tx_type, tx_info, _tx_hash, err = self._signer_client.sign_cancel_order(
+                        market_index=market_index,
+                        order_index=int(order_id),
+                        nonce=nonce,
+                        api_key_index=api_key_idx,
+                    )
+                    if err is not None:
+                        raise RuntimeError(f"sign cancel {order_id}: {err}")
+                    tx_types.append(tx_type)
+                    tx_infos.append(tx_info)
+
+                batch_resp = await self._signer_client.send_tx_batch(
+                    tx_types=tx_types, tx_infos=tx_infos,
+                )
+                if batch_resp.code != 200:
+                    raise RuntimeError(batch_resp.message or f"code {batch_resp.code}")
+            return True
+        except Exception as e:
+            logger.error(f"Batch cancel failed: {e}")
+            if nm:
+                for _ in range(nonces_obtained):
+                    nm.acknowledge_failure(api_key_idx)
+            if self._is_sign_error(str(e)):
+                async with self._sign_lock:
+                    await self.reinit_signer()
+            return False
+
     async def get_balance(self) -> float:
         """Get available USDC balance."""
         await self._ensure_clients()
         if self._mock_mode:
             return 99999.0
         try:
-            import lighter
-
-            account_api = lighter.AccountApi(self._api_client)
-            resp = await account_api.account(
-                by="index", value=str(self.account_index)
-            )
-            logger.debug(f"Balance response type={type(resp).__name__}, value={resp}")
-            if hasattr(resp, "accounts") and resp.accounts:
-                balance = resp.accounts[0].available_balance
-            elif hasattr(resp, "available_balance"):
-                balance = resp.available_balance
+            account = await self._get_account()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Balance response type={type(account).__name__}, value={account}")
+            if hasattr(account, "available_balance"):
+                balance = account.available_balance
             else:
-                logger.error(f"Balance fetch: unexpected response structure: {resp}")
+                logger.error(f"Balance fetch: unexpected response structure: {account}")
                 return 0.0
             logger.info(f"Balance fetched: {balance}")
             return float(balance)
@@ -483,28 +576,34 @@ class LighterClient:
             logger.error(f"Balance fetch failed: {e}", exc_info=True)
             return 0.0
 
-    async def _get_account(self):
-        """Fetch the account object from Lighter."""
-        import lighter
+    async def _get_account(self, fresh: bool = False):
+        """Fetch the account object from Lighter.
+
+        Reused for ACCOUNT_CACHE_TTL so a balance and positions read in the
+        same poll share one request. A fetch that started before the latest
+        signed tx is never reused; ``fresh=True`` always refetches (and
+        refreshes the cache).
+        """
+        cached = self._account_cache
+        now = time.time()
+        if (
+            not fresh
+            and cached is not None
+            and cached[0] > self._last_sign_ts
+            and now - cached[0] < ACCOUNT_CACHE_TTL
+        ):
+            return cached[1]
 
         account_api = lighter.AccountApi(self._api_client)
         resp = await account_api.account(
             by="index", value=str(self.account_index)
         )
-        if hasattr(resp, "accounts") and resp.accounts:
-            return resp.accounts[0]
-        return resp
-
-    async def get_positions(self) -> list[dict]:
-        """Get all open positions from the Lighter exchange.
-
-        Returns a list of dicts with keys: market_index, side, size, entry_price, realized_pnl.
-        """
-        await self._ensure_clients()
-        if self._mock_mode:
-            return []
+        account = resp.accounts[0] if hasattr(resp, "accounts") and resp.accounts else resp
+        self._account_cache = (now, account)
+        return account
 
-        account = await self._get_account()
+    @staticmethod
+    def _parse_positions(account) -> list[dict]:
         positions = []
         raw_positions = getattr(account, "positions", None) or []
         for pos in raw_positions:
@@ -521,16 +620,8 @@ class LighterClient:
             })
         return positions
 
-    async def get_realized_pnl(self, market_indices: list[int]) -> dict[int, float]:
-        """Get realized PnL for specific markets (works even with zero-size positions).
-
-        Returns {market_index: realized_pnl}.
-        """
-        await self._ensure_clients()
-        if self._mock_mode:
-            return {m: 0.0 for m in market_indices}
-
-        account = await self._get_account()
+    @staticmethod
+    def _parse_realized_pnl(account, market_indices: list[int]) -> dict[int, float]:
         result = {}
         raw_positions = getattr(account, "positions", None) or []
         for pos in raw_positions:
@@ -543,8 +634,48 @@ class LighterClient:
                 result[m] = 0.0
         return result
 
+    async def get_positions(self, fresh: bool = False) -> list[dict]:
+        """Get all open positions from the Lighter exchange.
+
+        Returns a list of dicts with keys: market_index, side, size, entry_price, realized_pnl.
+        Pass ``fresh=True`` to bypass the short account cache, e.g. when
+        polling for an order to settle.
+        """
+        await self._ensure_clients()
+        if self._mock_mode:
+            return []
+
+        account = await self._get_account(fresh=fresh)
+        return self._parse_positions(account)
+
+    async def get_realized_pnl(self, market_indices: list[int]) -> dict[int, float]:
+        """Get realized PnL for specific markets (works even with zero-size positions).
+
+        Returns {market_index: realized_pnl}.
+        """
+        await self._ensure_clients()
+        if self._mock_mode:
+            return {m: 0.0 for m in market_indices}
+
+        account = await self._get_account()
+        return self._parse_realized_pnl(account, market_indices)
+
+    async def get_positions_and_realized_pnl(
+        self, market_indices: list[int]
+    ) -> tuple[list[dict], dict[int, float]]:
+        """get_positions() and get_realized_pnl() from a single account fetch."""
+        await self._ensure_clients()
+        if self._mock_mode:
+            return [], {m: 0.0 for m in market_indices}
+
+        account = await self._get_account()
+        return self._parse_positions(account), self._parse_realized_pnl(account, market_indices)
+
     async def close(self):
         """Close SDK clients."""
+        if self._meta_prefetch is not None:
+            self._meta_prefetch.cancel()
+            self._meta_prefetch = None
         if self._api_client and not self._mock_mode:
             try:
                 await self._api_client.close()
@@ -554,3 +685,4 @@ class LighterClient:
         self._signer_client = None
         self._mock_mode = False
         self._market_meta = {}
+        self._account_cache = None
@@ -5,13 +5,23 @@ Longer intervals (2h, 4h, 8h, etc.) use Hyperliquid.
 Orderbook and market listing still use Lighter.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
+import orjson
 import pandas as pd
 from hyperliquid.info import Info
 
+try:
+    import lighter
+    from lighter.api import CandlestickApi, OrderApi
+except ImportError:  # reported by _get_api_client on first use
+    lighter = CandlestickApi = OrderApi = None
+
 from backend.utils.constants import LIGHTER_CANDLE_INTERVALS
 
 logger = logging.getLogger(__name__)
@@ -19,10 +29,35 @@ logger = logging.getLogger(__name__)
 # Reusable Hyperliquid Info client (no auth needed for public data)
 _hl_info = Info(skip_ws=True)
 
-# Cached Lighter ApiClient for candle data (no auth needed)
-_lighter_candle_client = None
-
-
+# Shared Lighter ApiClients (no auth needed), one per event loop since the
+# underlying aiohttp session is bound to the loop that created it.
+_api_clients: dict[int, "lighter.ApiClient"] = {}
+
+# Cap on concurrent candle requests across all pair jobs, so a burst of jobs
+# firing on the same candle boundary stays under provider rate limits.
+# Semaphores are per event loop for the same reason as the clients.
+CANDLE_FETCH_CONCURRENCY = 8
+_candle_semaphores: dict[int, asyncio.Semaphore] = {}
+
+# Hyperliquid candle calls are blocking requests; they get their own threads
+# (one per concurrent fetch slot) instead of competing in the default
+# executor. Info already reuses a single requests.Session.
+_hl_executor = ThreadPoolExecutor(
+    max_workers=CANDLE_FETCH_CONCURRENCY, thread_name_prefix="hl-info"
+)
+
+# Short-lived caches for public Lighter data. Market listings barely change;
+# orderbooks are polled by several endpoints/jobs within the same second.
+MARKETS_CACHE_TTL = 300.0
+ORDERBOOK_CACHE_TTL = 0.5
+_markets_cache: tuple[float, list[dict]] | None = None
+_orderbook_cache: dict[int, tuple[float, dict]] = {}
+# In-flight fetches keyed by (event loop, key) so concurrent misses share one
+# request. The Telegram bot runs its own loop, hence the loop in the key.
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+@lru_cache(maxsize=256)
 def _to_hl_ticker(asset: str) -> str:
     """Convert asset name to Hyperliquid ticker format.
 
@@ -33,15 +68,6 @@ def _to_hl_ticker(asset: str) -> str:
     return asset
 
 
-def _get_lighter_candle_client():
-    """Get or create a reusable Lighter ApiClient for candle data."""
-    global _lighter_candle_client
-    if _lighter_candle_client is None:
-        import lighter
-        _lighter_candle_client = lighter.ApiClient()
-    return _lighter_candle_client
-
-
 async def fetch_candles_lighter(
     market_id: int,
     resolution: str,
@@ -60,16 +86,9 @@ async def fetch_candles_lighter(
     Returns:
         pd.Series of close prices with datetime index.
     """
-    from lighter.api import CandlestickApi
-
-    client = _get_lighter_candle_client()
-    interval_seconds = _resolution_to_seconds(resolution)
-    now = datetime.now(timezone.utc)
+    client = _get_api_client()
     buffer_candles = int(candles_needed * 1.2)
-    start_time = now - timedelta(seconds=buffer_candles * interval_seconds)
-
-    start_ms = int(start_time.timestamp() * 1000)
-    end_ms = int(now.timestamp() * 1000)
+    start_ms, end_ms = _candle_window_ms(resolution, buffer_candles)
 
     try:
         api = CandlestickApi(client)
@@ -83,7 +102,7 @@ async def fetch_candles_lighter(
             end_timestamp=end_ms,
             count_back=buffer_candles,
         )
-        raw = await resp.json()
+        raw = await resp.json(loads=orjson.loads)
         candles = raw.get("c", [])
         series = _parse_lighter_candles(candles)
         logger.debug(
@@ -117,25 +136,32 @@ async def fetch_candles(
     Returns:
         pd.Series of close prices with datetime index.
     """
+    loop_id = id(asyncio.get_running_loop())
+    sem = _candle_semaphores.get(loop_id)
+    if sem is None:
+        sem = _candle_semaphores[loop_id] = asyncio.Semaphore(CANDLE_FETCH_CONCURRENCY)
+    async with sem:
+        return await _fetch_candles(ticker, resolution, candles_needed, market_id)
+
+
+async def _fetch_candles(
+    ticker: str,
+    resolution: str,
+    candles_needed: int,
+    market_id: int | None,
+) -> pd.Series:
     # Route to Lighter for short intervals when market_id is available
     if market_id is not None and resolution in LIGHTER_CANDLE_INTERVALS:
         return await fetch_candles_lighter(market_id, resolution, candles_needed)
 
-    import asyncio
-
     hl_ticker = _to_hl_ticker(ticker)
-    interval_seconds = _resolution_to_seconds(resolution)
-    now = datetime.now(timezone.utc)
     buffer_candles = int(candles_needed * 1.2)  # 20% buffer
-    start_time = now - timedelta(seconds=buffer_candles * interval_seconds)
-
-    start_ms = int(start_time.timestamp() * 1000)
-    end_ms = int(now.timestamp() * 1000)
+    start_ms, end_ms = _candle_window_ms(resolution, buffer_candles)
 
     try:
         # candles_snapshot is synchronous — run in executor to avoid blocking
-        candles = await asyncio.get_event_loop().run_in_executor(
-            None, _hl_info.candles_snapshot, hl_ticker, resolution, start_ms, end_ms
+        candles = await asyncio.get_running_loop().run_in_executor(
+            _hl_executor, _hl_info.candles_snapshot, hl_ticker, resolution, start_ms, end_ms
         )
         return _parse_candles(candles)
     except Exception as e:
@@ -143,10 +169,51 @@ async def fetch_candles(
         return pd.Series(dtype=float)
 
 
-async def _get_api_client():
-    """Create a Lighter ApiClient (used for orderbook/markets)."""
-    import lighter
-    return lighter.ApiClient()
+def _get_api_client():
+    """Get the shared Lighter ApiClient for the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    client = _api_clients.get(loop_id)
+    if client is None:
+        if lighter is None:
+            raise ImportError("lighter-sdk not installed")
+        client = _api_clients[loop_id] = lighter.ApiClient()
+    return client
+
+
+async def close_api_clients():
+    """Close the shared Lighter ApiClient on shutdown."""
+    client = _api_clients.pop(id(asyncio.get_running_loop()), None)
+    # Clients owned by other loops (e.g. the Telegram bot's) die with them
+    _api_clients.clear()
+    if client is not None:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Lighter ApiClient: {e}")
+
+
+async def _single_flight(key, factory):
+    """Run factory() once for concurrent callers sharing the same key."""
+    full_key = (id(asyncio.get_running_loop()), key)
+    task = _inflight.get(full_key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[full_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(full_key, None))
+    return await asyncio.shield(task)
+
+
+def _cached_orderbook(market_id: int) -> dict | None:
+    entry = _orderbook_cache.get(market_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return dict(entry[1])
+    return None
+
+
+def _store_orderbook(market_id: int, book: dict):
+    # Don't cache the zeroed fallback returned on errors
+    if book["mid_price"]:
+        _orderbook_cache[market_id] = (time.monotonic() + ORDERBOOK_CACHE_TTL, book)
 
 
 async def fetch_orderbook(market_id: int) -> dict:
@@ -154,36 +221,77 @@ async def fetch_orderbook(market_id: int) -> dict:
 
     Returns dict with 'mid_price', 'best_bid', 'best_ask'.
     """
-    import lighter
-    from lighter.api import OrderApi
+    cached = _cached_orderbook(market_id)
+    if cached is not None:
+        return cached
 
-    client = await _get_api_client()
+    async def _fetch():
+        book = await _fetch_orderbook_with(OrderApi(_get_api_client()), market_id)
+        _store_orderbook(market_id, book)
+        return book
+
+    return dict(await _single_flight(("orderbook", market_id), _fetch))
+
+
+async def fetch_orderbooks_batch(market_ids) -> dict[int, dict]:
+    """Fetch orderbooks for several markets in one go.
+
+    Lighter has no multi-market top-of-book endpoint, so this dedupes the
+    IDs and issues the requests concurrently over the shared ApiClient.
+
+    Returns {market_id: {'mid_price', 'best_bid', 'best_ask'}}.
+    """
+    result: dict[int, dict] = {}
+    missing = []
+    for mid in dict.fromkeys(market_ids):
+        cached = _cached_orderbook(mid)
+        if cached is not None:
+            result[mid] = cached
+        else:
+            missing.append(mid)
+    if not missing:
+        return result
+
+    api = OrderApi(_get_api_client())
+    books = await asyncio.gather(
+        *(_fetch_orderbook_with(api, mid) for mid in missing)
+    )
+    for mid, book in zip(missing, books):
+        _store_orderbook(mid, book)
+        result[mid] = dict(book)
+    return result
+
+
+async def _fetch_orderbook_with(api, market_id: int) -> dict:
     try:
-        api = OrderApi(client)
         result = await api.order_book_orders(market_id=market_id, limit=1)
         return _parse_orderbook(result)
     except Exception as e:
         logger.error(f"Error fetching orderbook for market {market_id}: {e}")
         return {"mid_price": 0.0, "best_bid": 0.0, "best_ask": 0.0}
-    finally:
-        await client.close()
 
 
 async def fetch_markets() -> list[dict]:
-    """Fetch all available markets from Lighter."""
-    import lighter
-    from lighter.api import OrderApi
+    """Fetch all available markets from Lighter (cached for MARKETS_CACHE_TTL)."""
+    cached = _markets_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return list(cached[1])
+    return list(await _single_flight("markets", _fetch_markets_uncached))
+
+
+async def _fetch_markets_uncached() -> list[dict]:
+    global _markets_cache
 
-    client = await _get_api_client()
     try:
-        api = OrderApi(client)
+        api = OrderApi(_get_api_client())
         result = await api.order_books()
-        return _parse_markets(result.order_books)
+        markets = _parse_markets(result.order_books)
     except Exception as e:
         logger.error(f"Error fetching markets: {e}")
         return []
-    finally:
-        await client.close()
+    if markets:
+        _markets_cache = (time.monotonic() + MARKETS_CACHE_TTL, markets)
+    return markets
 
 
 async def fetch_pair_data(
@@ -203,8 +311,6 @@ async def fetch_pair_data(
 
     Returns dict with keys: 'prices_a', 'prices_b', 'train_a', 'train_b'.
     """
-    import asyncio
-
     if train_interval != window_interval:
         # Different intervals — fetch window and training data separately
         tasks = [
@@ -245,21 +351,45 @@ async def fetch_pair_data(
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _resolution_to_seconds(resolution: str) -> int:
-    mapping = {
-        "1m": 60,
-        "5m": 300,
-        "15m": 900,
-        "30m": 1800,
-        "1h": 3600,
-        "2h": 7200,
-        "4h": 14400,
-        "8h": 28800,
-        "12h": 43200,
-        "1d": 86400,
-        "1w": 604800,
-    }
-    return mapping.get(resolution, 14400)
+_RESOLUTION_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "1w": 604_800_000,
+}
+_DEFAULT_RESOLUTION_MS = _RESOLUTION_MS["4h"]
+
+
+def _candle_window_ms(resolution: str, candles: int) -> tuple[int, int]:
+    """(start_ms, end_ms) covering the last `candles` candles up to now."""
+    end_ms = int(time.time() * 1000)
+    return end_ms - candles * _RESOLUTION_MS.get(resolution, _DEFAULT_RESOLUTION_MS), end_ms
+
+
+def _build_close_series(timestamps: list, closes: list) -> pd.Series:
+    """Build a time-sorted close price Series from ms timestamps and raw closes.
+
+    Unparseable closes are dropped, matching pd.to_numeric(errors="coerce")
+    followed by dropna().
+    """
+    ts = np.asarray(timestamps, dtype=np.int64)
+    vals = pd.to_numeric(np.asarray(closes, dtype=object), errors="coerce").astype(np.float64)
+    keep = ~np.isnan(vals)
+    if not keep.all():
+        ts, vals = ts[keep], vals[keep]
+    # Both providers return candles in time order; only sort when they don't
+    if (ts[1:] < ts[:-1]).any():
+        order = np.argsort(ts, kind="stable")
+        ts, vals = ts[order], vals[order]
+    index = pd.DatetimeIndex(pd.to_datetime(ts, unit="ms", utc=True), name="t")
+    return pd.Series(vals, index=index, name="close")
 
 
 def _parse_candles(candles: list[dict]) -> pd.Series:
@@ -269,19 +399,17 @@ def _parse_candles(candles: list[dict]) -> pd.Series:
                        "o": "87.212", "c": "87.498", "h": "87.811", "l": "87.212", ...}
     """
     try:
-        if not candles:
+        timestamps = []
+        closes = []
+        for c in candles or ():
+            close = c.get("c")
+            if close is not None:
+                timestamps.append(c["t"])
+                closes.append(close)
+
+        if not closes:
             return pd.Series(dtype=float)
-
-        records = [{"t": c["t"], "close": c["c"]} for c in candles if c.get("c") is not None]
-
-        df = pd.DataFrame(records)
-        if df.empty:
-            return pd.Series(dtype=float)
-
-        df["t"] = pd.to_datetime(df["t"], unit="ms", utc=True)
-        df["close"] = pd.to_numeric(df["close"], errors="coerce")
-        df = df.set_index("t").sort_index()
-        return df["close"].dropna()
+        return _build_close_series(timestamps, closes)
     except Exception as e:
         logger.error(f"Failed to parse candles: {e}")
         return pd.Series(dtype=float)
@@ -294,30 +422,30 @@ def _parse_lighter_candles(candles: list[dict]) -> pd.Series:
     L (low), C (close), V (volume). We use 'C' for close price.
     """
     try:
-        if not candles:
-            return pd.Series(dtype=float)
-
-        records = []
-        for c in candles:
+        timestamps = []
+        closes = []
+        for c in candles or ():
             # Close price is in 'C' (aliased field in SDK)
             close = c.get("C") or c.get("c")
             ts = c.get("t")
             if close is not None and ts is not None:
-                records.append({"t": ts, "close": close})
+                timestamps.append(ts)
+                closes.append(close)
 
-        if not records:
+        if not closes:
             return pd.Series(dtype=float)
-
-        df = pd.DataFrame(records)
-        df["t"] = pd.to_datetime(df["t"], unit="ms", utc=True)
-        df["close"] = pd.to_numeric(df["close"], errors="coerce")
-        df = df.set_index("t").sort_index()
-        return df["close"].dropna()
+        return _build_close_series(timestamps, closes)
     except Exception as e:
         logger.error(f"Failed to parse Lighter candles: {e}")
         return pd.Series(dtype=float)
 
 
+def _order_price(order) -> float:
+    if isinstance(order, dict):
+        return float(order["price"])
+    return float(order.price)
+
+
 def _parse_orderbook(details) -> dict:
     """Parse orderbook details into mid/bid/ask prices."""
     try:
@@ -328,13 +456,13 @@ def _parse_orderbook(details) -> dict:
             bids = getattr(details, "bids", [])
             asks = getattr(details, "asks", [])
 
-        def _get_price(order):
-            if isinstance(order, dict):
-                return float(order["price"])
-            return float(order.price)
-
-        best_bid = _get_price(bids[0]) if bids else 0.0
-        best_ask = _get_price(asks[0]) if asks else 0.0
+        try:
+            # Common case: both sides quoted
+            best_bid = _order_price(bids[0])
+            best_ask = _order_price(asks[0])
+        except (IndexError, TypeError):
+            best_bid = _order_price(bids[0]) if bids else 0.0
+            best_ask = _order_price(asks[0]) if asks else 0.0
         mid = (best_bid + best_ask) / 2 if best_bid and best_ask else best_bid or best_ask
 
         return {"mid_price": mid, "best_bid": best_bid, "best_ask": best_ask}
@@ -4,21 +4,40 @@ Ported from hedge-fund-claude/analysis/backtester.py and spread.py.
 All functions are pure computation — no I/O, no database access.
 """
 
+import math
 from dataclasses import dataclass
 
 import numpy as np
-import pandas as pd
 
 
 # ---------------------------------------------------------------------------
 # Core computation helpers (ported from backtester.py)
 # ---------------------------------------------------------------------------
 
+def _as_f64(values: np.ndarray) -> np.ndarray:
+    """C-contiguous float64 view of values; no copy when it already is one."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _ols_slope(x: np.ndarray, y: np.ndarray) -> float | None:
+    """Slope of y = beta * x + alpha, or None when x has no variance.
+
+    Closed form cov(x, y) / var(x); np.polyfit would build a Vandermonde
+    matrix and run lstsq for the same number.
+    """
+    dx = x - x.mean()
+    var = float(dx @ dx)
+    if var == 0:
+        return None
+    return float(dx @ (y - y.mean())) / var
+
+
 def compute_hedge_ratio(prices_a: np.ndarray, prices_b: np.ndarray) -> float:
     """OLS hedge ratio: a = beta * b + alpha."""
     if len(prices_a) < 2:
         return 1.0
-    return float(np.polyfit(prices_b, prices_a, 1)[0])
+    beta = _ols_slope(prices_b, prices_a)
+    return 1.0 if beta is None else beta
 
 
 def compute_zscore_value(
@@ -32,12 +51,21 @@ def compute_zscore_value(
     Returns: (z_score, current_spread, spread_mean, spread_std)
     """
     spread = prices_a - hedge_ratio * prices_b
-    spread_window = spread[-window:]
-    mean = float(np.mean(spread_window))
-    std = float(np.std(spread_window, ddof=1))
-    current = float(spread[-1])
+    return _zscore_from_spread(spread[-window:])
+
 
-    if std == 0 or np.isnan(std):
+def _zscore_from_spread(spread_window: np.ndarray) -> tuple[float, float, float, float]:
+    n = len(spread_window)
+    mean = float(spread_window.mean())
+    current = float(spread_window[-1])
+    if n > 1:
+        # Sample std (ddof=1) from one deviation pass and a scalar sqrt
+        dev = spread_window - mean
+        std = math.sqrt(float(dev @ dev) / (n - 1))
+    else:
+        std = float("nan")
+
+    if std == 0 or math.isnan(std):
         return 0.0, current, mean, std
     z = (current - mean) / std
     return z, current, mean, std
@@ -49,10 +77,10 @@ def rolling_half_life(spread: np.ndarray) -> float:
         return float("inf")
     lag = spread[:-1]
     delta = np.diff(spread)
-    beta = float(np.polyfit(lag, delta, 1)[0])
-    if beta >= 0:
+    beta = _ols_slope(lag, delta)
+    if beta is None or beta >= 0:
         return float("inf")
-    return -np.log(2) / beta
+    return -math.log(2) / beta
 
 
 def compute_rsi(values: np.ndarray, period: int = 14) -> float:
@@ -63,14 +91,22 @@ def compute_rsi(values: np.ndarray, period: int = 14) -> float:
 
     deltas = np.diff(values)
     gains = np.maximum(deltas, 0.0)
-    losses = np.maximum(-deltas, 0.0)
+    # max(-d, 0) == max(d, 0) - d exactly, without the temporary for -deltas
+    losses = gains - deltas
 
     avg_gain = float(np.mean(gains[:period]))
     avg_loss = float(np.mean(losses[:period]))
 
-    for i in range(period, len(deltas)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    # Wilder smoothing avg = avg * (p-1)/p + x/p is a linear recurrence, so
+    # after m steps it equals decay**m * avg + sum(decay**(m-1-j) * x_j) / p.
+    # Evaluated as one dot product instead of a Python loop over the window.
+    m = len(deltas) - period
+    if m > 0:
+        decay = (period - 1) / period
+        weights = decay ** np.arange(m - 1, -1, -1, dtype=np.float64)
+        scale = decay ** m
+        avg_gain = scale * avg_gain + float(weights @ gains[period:]) / period
+        avg_loss = scale * avg_loss + float(weights @ losses[period:]) / period
 
     if avg_loss == 0:
         return 100.0
@@ -82,7 +118,7 @@ def compute_rsi(values: np.ndarray, period: int = 14) -> float:
 # Signal result types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SignalResult:
     """Result of signal computation for a single point in time."""
     z_score: float
@@ -96,16 +132,16 @@ class SignalResult:
     spread_std: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntrySignal:
-    """Entry decision."""
+    """Entry decision (immutable; the rejection results below are shared)."""
     should_enter: bool
     direction: int = 0  # 1 = long spread, -1 = short spread
     skip_reason: str | None = None  # "no_signal", "half_life", "rsi", "equity_floor"
     notional: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExitSignal:
     """Exit decision."""
     should_exit: bool
@@ -114,6 +150,13 @@ class ExitSignal:
     unrealized_pct: float = 0.0
 
 
+_SKIP_NO_SIGNAL = EntrySignal(should_enter=False, skip_reason="no_signal")
+_SKIP_HALF_LIFE = EntrySignal(should_enter=False, skip_reason="half_life")
+_SKIP_RSI = EntrySignal(should_enter=False, skip_reason="rsi")
+_SKIP_RSI_ASSET = EntrySignal(should_enter=False, skip_reason="rsi_asset")
+_SKIP_EQUITY_FLOOR = EntrySignal(should_enter=False, skip_reason="equity_floor")
+
+
 # ---------------------------------------------------------------------------
 # Main signal functions
 # ---------------------------------------------------------------------------
@@ -126,6 +169,7 @@ def compute_signals(
     window_candles: int,
     train_candles: int,
     rsi_period: int = 14,
+    asset_rsi: bool = True,
 ) -> SignalResult:
     """Compute all signal values for the current moment.
 
@@ -135,32 +179,39 @@ def compute_signals(
         window_candles: Number of candles for z-score window.
         train_candles: Number of candles for hedge ratio training.
         rsi_period: RSI lookback period.
+        asset_rsi: Compute the per-asset RSIs. They only feed the entry
+            filters and are not logged, so in-position cycles skip them
+            (returned as NaN).
     """
-    # Hedge ratio from training data
-    hr = compute_hedge_ratio(
-        train_prices_a[-train_candles:],
-        train_prices_b[-train_candles:],
-    )
-
-    # Z-score from trading data
-    z, spread_now, spread_mean, spread_std = compute_zscore_value(
-        prices_a[-window_candles:],
-        prices_b[-window_candles:],
-        hr,
-        window_candles,
-    )
+    prices_a = _as_f64(prices_a)
+    prices_b = _as_f64(prices_b)
+    train_prices_a = _as_f64(train_prices_a)
+    train_prices_b = _as_f64(train_prices_b)
+
+    # A zero price or flat window yields inf/NaN, which the result carries
+    # and the entry filters handle; don't route it through warnings per call
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Hedge ratio from training data
+        hr = compute_hedge_ratio(
+            train_prices_a[-train_candles:],
+            train_prices_b[-train_candles:],
+        )
 
-    # Half-life on the trading window spread
-    spread_window = prices_a[-window_candles:] - hr * prices_b[-window_candles:]
-    hl = rolling_half_life(spread_window)
+        # Z-score and half-life share one pass over the trading window spread
+        spread_window = prices_a[-window_candles:] - hr * prices_b[-window_candles:]
+        z, spread_now, spread_mean, spread_std = _zscore_from_spread(spread_window)
+        hl = rolling_half_life(spread_window)
 
-    # RSI on price ratio
-    ratio = prices_a / prices_b
-    rsi = compute_rsi(ratio, period=rsi_period)
+        # RSI on price ratio
+        ratio = prices_a / prices_b
+        rsi = compute_rsi(ratio, period=rsi_period)
 
-    # Per-asset RSI
-    rsi_a = compute_rsi(prices_a, period=rsi_period)
-    rsi_b = compute_rsi(prices_b, period=rsi_period)
+        # Per-asset RSI
+        if asset_rsi:
+            rsi_a = compute_rsi(prices_a, period=rsi_period)
+            rsi_b = compute_rsi(prices_b, period=rsi_period)
+        else:
+            rsi_a = rsi_b = float("nan")
 
     return SignalResult(
         z_score=z,
@@ -198,30 +249,30 @@ def evaluate_entry(
     # Check for signal
     has_signal = abs(z) > entry_z
     if not has_signal:
-        return EntrySignal(should_enter=False, skip_reason="no_signal")
+        return _SKIP_NO_SIGNAL
 
     # Half-life filter
     use_hl = max_half_life > 0
     if use_hl and not (0 < signals.half_life <= max_half_life):
-        return EntrySignal(should_enter=False, skip_reason="half_life")
+        return _SKIP_HALF_LIFE
 
     # RSI filter (ratio)
     use_rsi = rsi_lower > 0 or rsi_upper < 100
-    if use_rsi and not np.isnan(signals.rsi):
+    if use_rsi and not math.isnan(signals.rsi):
         if signals.rsi < rsi_lower or signals.rsi > rsi_upper:
-            return EntrySignal(should_enter=False, skip_reason="rsi")
+            return _SKIP_RSI
 
     # Per-asset RSI filter
     use_rsi_asset = rsi_a_lower > 0 or rsi_a_upper < 100 or rsi_b_lower > 0 or rsi_b_upper < 100
     if use_rsi_asset:
-        if not np.isnan(signals.rsi_a) and (signals.rsi_a < rsi_a_lower or signals.rsi_a > rsi_a_upper):
-            return EntrySignal(should_enter=False, skip_reason="rsi_asset")
-        if not np.isnan(signals.rsi_b) and (signals.rsi_b < rsi_b_lower or signals.rsi_b > rsi_b_upper):
-            return EntrySignal(should_enter=False, skip_reason="rsi_asset")
+        if not math.isnan(signals.rsi_a) and (signals.rsi_a < rsi_a_lower or signals.rsi_a > rsi_a_upper):
+            return _SKIP_RSI_ASSET
+        if not math.isnan(signals.rsi_b) and (signals.rsi_b < rsi_b_lower or signals.rsi_b > rsi_b_upper):
+            return _SKIP_RSI_ASSET
 
     # Equity floor
     if current_equity < equity_floor:
-        return EntrySignal(should_enter=False, skip_reason="equity_floor")
+        return _SKIP_EQUITY_FLOOR
 
     direction = -1 if z > entry_z else 1  # z > entry_z -> short spread
     notional = current_equity * leverage
@@ -24,12 +24,27 @@ _bot_instance: Optional["TelegramBot"] = None
 class TelegramBot:
     """Telegram bot running in a background thread with its own event loop."""
 
-    def __init__(self, token: str, chat_ids: list[int]):
+    def __init__(
+        self,
+        token: str,
+        chat_ids: list[int],
+        main_loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
         self.token = token
         self.chat_ids = set(chat_ids)
         self._app: Optional[Application] = None
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The app's loop, which owns the shared Lighter clients and the scheduler
+        self._main_loop = main_loop
+
+    async def _run_on_main_loop(self, coro):
+        """Await a coroutine on the app's main loop from the bot's loop."""
+        if self._main_loop is None:
+            return await coro
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._main_loop)
+        )
 
     def _is_authorized(self, user_id: int) -> bool:
         return user_id in self.chat_ids
@@ -45,14 +60,17 @@ class TelegramBot:
         if not await self._check_auth(update):
             return
 
+        from sqlalchemy import func
+
         from backend.engine.scheduler import get_scheduler_status
         from backend.database import engine
         from backend.models.position import OpenPosition
 
         status = get_scheduler_status()
         with Session(engine) as session:
-            positions = session.exec(select(OpenPosition)).all()
-            pos_count = len(positions)
+            pos_count = session.exec(
+                select(func.count()).select_from(OpenPosition)
+            ).one()
 
         scheduler_str = "running" if status["running"] else "stopped"
         text = (
@@ -66,19 +84,23 @@ class TelegramBot:
         if not await self._check_auth(update):
             return
 
+        from sqlalchemy.orm import selectinload
+
         from backend.database import engine
         from backend.models.position import OpenPosition
-        from backend.models.trading_pair import TradingPair
 
         with Session(engine) as session:
-            positions = session.exec(select(OpenPosition)).all()
+            # One IN query for all pairs instead of a get() per position
+            positions = session.exec(
+                select(OpenPosition).options(selectinload(OpenPosition.pair))
+            ).all()
             if not positions:
                 await update.message.reply_text("No open positions.")
                 return
 
             lines = []
             for pos in positions:
-                pair = session.get(TradingPair, pos.pair_id)
+                pair = pos.pair
                 name = pair.name if pair else f"#{pos.pair_id}"
                 direction = "Long" if pos.direction == 1 else "Short"
                 lines.append(
@@ -156,7 +178,9 @@ class TelegramBot:
 
         if query.data == "confirm_close_all":
             await query.edit_message_text("Closing all positions...")
-            result = await run_emergency_stop(close_positions=True, disable_pairs=False)
+            result = await self._run_on_main_loop(
+                run_emergency_stop(close_positions=True, disable_pairs=False)
+            )
             errors = f"\nErrors: {len(result['errors'])}" if result["errors"] else ""
             await query.edit_message_text(
                 f"Closed {result['positions_closed']} positions.{errors}"
@@ -164,7 +188,9 @@ class TelegramBot:
 
         elif query.data == "confirm_stop_all":
             await query.edit_message_text("Emergency stop in progress...")
-            result = await run_emergency_stop(close_positions=True, disable_pairs=True)
+            result = await self._run_on_main_loop(
+                run_emergency_stop(close_positions=True, disable_pairs=True)
+            )
             errors = f"\nErrors: {len(result['errors'])}" if result["errors"] else ""
             await query.edit_message_text(
                 f"Closed {result['positions_closed']} positions, "
@@ -175,11 +201,14 @@ class TelegramBot:
         """Send a message to all whitelisted chat IDs."""
         if not self._app or not self._app.bot:
             return
-        for chat_id in self.chat_ids:
-            try:
-                await self._app.bot.send_message(chat_id=chat_id, text=message)
-            except Exception as e:
-                logger.warning(f"Failed to send Telegram notification to {chat_id}: {e}")
+        chat_ids = list(self.chat_ids)
+        results = await asyncio.gather(
+            *(self._app.bot.send_message(chat_id=chat_id, text=message) for chat_id in chat_ids),
+            return_exceptions=True,
+        )
+        for chat_id, result in zip(chat_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send Telegram notification to {chat_id}: {result}")
 
     def _run_bot(self):
         """Run the bot in a background thread with its own event loop."""
@@ -220,12 +249,13 @@ class TelegramBot:
             self._loop.call_soon_threadsafe(self._loop.stop)
 
 
-def init_bot() -> TelegramBot:
+def init_bot(main_loop: Optional[asyncio.AbstractEventLoop] = None) -> TelegramBot:
     """Initialize and return the bot singleton."""
     global _bot_instance
     _bot_instance = TelegramBot(
         token=settings.telegram_bot_token,
         chat_ids=settings.telegram_chat_ids,
+        main_loop=main_loop,
     )
     return _bot_instance
 
@@ -4,11 +4,17 @@ import lighter
 BASE_URL = "https://mainnet.zklighter.elliot.ai"
 L1_ADDRESS = "0x636B6094942B10f17cD15A650d4D2C7e46256497"
 
+async def get_subaccount_index(l1_address: str, *, client: lighter.ApiClient | None = None) -> int:
+    """Return the first sub-account index for an L1 address, reusing `client` if given."""
+    if client is None:
+        async with lighter.ApiClient(lighter.Configuration(host=BASE_URL)) as client:
+            return await get_subaccount_index(l1_address, client=client)
+    resp = await lighter.AccountApi(client).accounts_by_l1_address(l1_address=l1_address)
+    return resp.sub_accounts[0].index
+
 async def main():
-    client = lighter.ApiClient(lighter.Configuration(host=BASE_URL))
-    resp = await lighter.AccountApi(client).accounts_by_l1_address(l1_address=L1_ADDRESS)
-    print(resp.sub_accounts[0].index)
-    await client.close()
+    async with lighter.ApiClient(lighter.Configuration(host=BASE_URL)) as client:
+        print(await get_subaccount_index(L1_ADDRESS, client=client))
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 """Shared constants and defaults, ported from hedge-fund-claude."""
 
-VALID_INTERVALS = ["1m", "5m", "15m", "30m", "1h", "2h", "4h", "8h", "12h", "1d", "1w"]
+VALID_INTERVALS = ("1m", "5m", "15m", "30m", "1h", "2h", "4h", "8h", "12h", "1d", "1w")
+VALID_INTERVALS_SET = frozenset(VALID_INTERVALS)
 
 # Interval to hours mapping for APScheduler
 INTERVAL_HOURS: dict[str, float] = {
@@ -17,6 +18,12 @@ INTERVAL_HOURS: dict[str, float] = {
     "1w": 168.0,
 }
 
+# Trade.direction label per spread direction (1 = long spread, -1 = short)
+DIRECTION_LABELS: dict[int, str] = {1: "Long A / Short B", -1: "Short A / Long B"}
+
+# (is_ask_a, is_ask_b) for the orders that close a position in each direction
+CLOSE_IS_ASK: dict[int, tuple[bool, bool]] = {1: (True, False), -1: (False, True)}
+
 # Intervals routed to Lighter DEX candle data
 LIGHTER_CANDLE_INTERVALS = {"1m", "5m", "15m", "30m", "1h", "4h", "12h"}
 
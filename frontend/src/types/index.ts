@@ -37,6 +37,7 @@ export interface TradingPair {
   use_exit_schedule: boolean;
   is_enabled: boolean;
   guardian_excluded: boolean;
+  debug_replay_enabled: boolean;
   credential_id: number | null;
   current_equity: number;
   created_at: string;
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+import backend.models  # noqa: F401
+from backend.database import get_session
+
+
+@pytest.fixture
+def engine():
+    """Fresh in-memory SQLite database with every table created."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def app(engine):
+    """Bare FastAPI app whose get_session dependency uses ``engine``."""
+    def override_session():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI()
+    app.dependency_overrides[get_session] = override_session
+    return app
@@ -0,0 +1,134 @@
+import time
+from collections import deque
+from types import SimpleNamespace
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from backend.api import auth as auth_api
+from backend.api import deps
+from backend.database import get_async_session, get_session
+from backend.models.user import User
+from backend.services import auth as auth_service
+from backend.services.auth import create_access_token
+
+
+def _add_user(engine, username: str = "alice") -> User:
+    user = User(username=username, hashed_password="x", totp_secret="x")
+    with Session(engine) as session:
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        return user
+
+
+def test_cached_user_survives_committing_request(monkeypatch, engine, app):
+    _add_user(engine)
+    monkeypatch.setattr(deps, "_user_cache", {})
+
+    @app.post("/write")
+    def write(
+        _user: User = Depends(deps.get_current_user),
+        session: Session = Depends(get_session),
+    ):
+        session.commit()
+        return {}
+
+    @app.get("/me")
+    def me(user: User = Depends(deps.get_current_user)):
+        return {"username": user.username, "is_active": user.is_active}
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token('alice')}"}
+
+    assert client.post("/write", headers=headers).status_code == 200
+    response = client.get("/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"username": "alice", "is_active": True}
+    assert "alice" in deps._user_cache
+
+
+class _FakeAsyncSession:
+    def __init__(self, user):
+        self.user = user
+
+    async def exec(self, _stmt):
+        return SimpleNamespace(first=lambda: self.user)
+
+
+def _login_client(monkeypatch, password_ok: bool = True):
+    monkeypatch.setattr(auth_api, "_login_attempts", {})
+    monkeypatch.setattr(auth_api, "verify_password", lambda _plain, _hashed: password_ok)
+    monkeypatch.setattr(auth_api, "verify_totp", lambda _secret, _code: True)
+    user = User(id=1, username="alice", hashed_password="x", totp_secret="x")
+
+    async def override_session():
+        yield _FakeAsyncSession(user)
+
+    app = FastAPI()
+    app.dependency_overrides[get_async_session] = override_session
+    app.include_router(auth_api.router)
+    return TestClient(app)
+
+
+def _login(client, username: str = "alice"):
+    return client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "pw", "totp_code": "123456"},
+    )
+
+
+def test_login_throttles_failed_attempts_per_username(monkeypatch):
+    client = _login_client(monkeypatch, password_ok=False)
+
+    statuses = [_login(client).status_code for _ in range(6)]
+
+    assert statuses == [401] * 5 + [429]
+    # Another account from the same client has its own budget
+    assert _login(client, username="bob").status_code == 401
+
+
+def test_successful_login_resets_throttle(monkeypatch):
+    client = _login_client(monkeypatch)
+
+    statuses = [_login(client).status_code for _ in range(8)]
+
+    assert statuses == [200] * 8
+    assert auth_api._login_attempts == {}
+
+
+def test_stale_login_attempts_are_pruned(monkeypatch):
+    monkeypatch.setattr(auth_api, "_LOGIN_PRUNE_THRESHOLD", 2)
+    monkeypatch.setattr(auth_api, "_login_attempts", {
+        ("10.0.0.1", "alice"): deque([0.0]),
+        ("10.0.0.2", "bob"): deque([0.0]),
+    })
+
+    auth_api._check_rate_limit(("10.0.0.3", "carol"))
+
+    assert list(auth_api._login_attempts) == [("10.0.0.3", "carol")]
+
+
+def test_decoded_token_cache_reuses_and_expires(monkeypatch):
+    monkeypatch.setattr(auth_service, "_decoded_tokens", {})
+    token = create_access_token("alice")
+
+    assert auth_service.decode_access_token(token) == "alice"
+    assert token in auth_service._decoded_tokens
+
+    # A cached entry is served without decoding again...
+    auth_service._decoded_tokens[token] = (time.time() + 60, "cached")
+    assert auth_service.decode_access_token(token) == "cached"
+
+    # ...until its exp passes, when the token is decoded afresh
+    auth_service._decoded_tokens[token] = (time.time() - 1, "cached")
+    assert auth_service.decode_access_token(token) == "alice"
+
+
+def test_invalid_token_is_not_cached(monkeypatch):
+    monkeypatch.setattr(auth_service, "_decoded_tokens", {})
+
+    assert auth_service.decode_access_token("not-a-jwt") is None
+    assert auth_service._decoded_tokens == {}
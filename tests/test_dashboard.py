@@ -0,0 +1,103 @@
+import asyncio
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from sqlmodel import Session
+
+from backend.api import dashboard
+from backend.models.equity_snapshot import EquitySnapshot
+
+
+def test_equity_curve_buckets_keep_worst_drawdown(engine):
+    points = [
+        (datetime(2024, 1, 1, 0, 0, 5, tzinfo=timezone.utc), 100.0, -1.0),
+        (datetime(2024, 1, 1, 0, 0, 25, tzinfo=timezone.utc), 96.0, -5.0),
+        (datetime(2024, 1, 1, 0, 0, 45, tzinfo=timezone.utc), 98.0, -2.0),
+        (datetime(2024, 1, 1, 0, 1, 10, tzinfo=timezone.utc), 101.0, 0.0),
+    ]
+    with Session(engine) as session:
+        for ts, equity, dd in points:
+            session.add(EquitySnapshot(pair_id=1, timestamp=ts, equity=equity, drawdown_pct=dd))
+        session.commit()
+
+        response = dashboard.pair_equity_curve(pair_id=1, resolution="1m", session=session)
+
+    assert orjson.loads(response.body) == [
+        {"timestamp": "2024-01-01T00:00:00Z", "equity": 98.0, "drawdown_pct": -5.0},
+        {"timestamp": "2024-01-01T00:01:00Z", "equity": 101.0, "drawdown_pct": 0.0},
+    ]
+
+
+def _count_summaries(monkeypatch, fail: bool = False) -> list[int]:
+    calls = []
+
+    async def fake_compute():
+        calls.append(1)
+        await asyncio.sleep(0)
+        if fail:
+            raise RuntimeError("exchange down")
+        return {"total_pairs": len(calls)}
+
+    monkeypatch.setattr(dashboard, "_summary_cache", None)
+    monkeypatch.setattr(dashboard, "_compute_summary", fake_compute)
+    return calls
+
+
+def test_summary_cache_shares_one_computation(monkeypatch):
+    calls = _count_summaries(monkeypatch)
+
+    async def scenario():
+        concurrent = await asyncio.gather(*(dashboard.dashboard_summary() for _ in range(5)))
+        later = await dashboard.dashboard_summary()
+        return concurrent, later
+
+    concurrent, later = asyncio.run(scenario())
+
+    assert concurrent == [{"total_pairs": 1}] * 5
+    assert later == {"total_pairs": 1}
+    assert len(calls) == 1
+
+
+def test_summary_cache_recomputes_after_invalidate(monkeypatch):
+    calls = _count_summaries(monkeypatch)
+
+    async def scenario():
+        await dashboard.dashboard_summary()
+        dashboard.invalidate_summary_cache()
+        return await dashboard.dashboard_summary()
+
+    assert asyncio.run(scenario()) == {"total_pairs": 2}
+    assert len(calls) == 2
+
+
+def test_summary_cache_does_not_keep_failures(monkeypatch):
+    calls = _count_summaries(monkeypatch, fail=True)
+
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await dashboard.dashboard_summary()
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 2
+    assert dashboard._summary_cache is None
+
+
+def test_equity_curve_defaults_to_raw_snapshots(engine):
+    with Session(engine) as session:
+        for second, equity in ((5, 100.004), (25, 96.0)):
+            session.add(EquitySnapshot(
+                pair_id=1,
+                timestamp=datetime(2024, 1, 1, 0, 0, second, tzinfo=timezone.utc),
+                equity=equity,
+                drawdown_pct=-1.234,
+            ))
+        session.commit()
+
+        response = dashboard.pair_equity_curve(pair_id=1, session=session)
+
+    points = orjson.loads(response.body)
+    assert [(p["equity"], p["drawdown_pct"]) for p in points] == [(100.0, -1.23), (96.0, -1.23)]
+    assert [p["timestamp"][:19] for p in points] == ["2024-01-01T00:00:05", "2024-01-01T00:00:25"]
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from backend.api import system, trades
+from backend.api.deps import get_current_user
+from backend.models.job_log import JobLog
+from backend.models.trade import Trade
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def client(app):
+    app.dependency_overrides[get_current_user] = lambda: {"username": "test"}
+    app.include_router(system.router)
+    app.include_router(trades.router)
+    return TestClient(app)
+
+
+def _trade(exit_time: datetime) -> Trade:
+    return Trade(
+        pair_id=1,
+        direction="Long A / Short B",
+        entry_time=T0,
+        exit_time=exit_time,
+        entry_price_a=1, exit_price_a=1, entry_price_b=1, exit_price_b=1,
+        size_a=1, size_b=1, hedge_ratio=1, pnl=0, pnl_pct=0,
+        exit_reason="manual",
+    )
+
+
+def test_job_log_keyset_pages_include_tied_timestamps(client, engine):
+    # Five logs share one timestamp, as a bulk position sync writes them
+    stamps = [T0 + timedelta(minutes=1)] * 5 + [T0]
+    with Session(engine) as session:
+        session.add_all(JobLog(pair_id=1, timestamp=ts, status="success") for ts in stamps)
+        session.commit()
+
+    first = client.get("/api/system/logs", params={"limit": 2}).json()
+    assert first["total"] == 6
+
+    seen = [row["id"] for row in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get("/api/system/logs", params={"limit": 2, "before": cursor}).json()
+        assert page["total"] is None
+        seen += [row["id"] for row in page["items"]]
+        cursor = page["next_cursor"]
+
+    assert seen == [5, 4, 3, 2, 1, 6]
+
+
+def test_trade_keyset_pages_include_tied_exit_times(client, engine):
+    # Four trades closed in one batch share an exit_time
+    exit_times = [T0 + timedelta(minutes=1)] * 4 + [T0]
+    with Session(engine) as session:
+        session.add_all(_trade(ts) for ts in exit_times)
+        session.commit()
+
+    pages = []
+    response = client.get("/api/trades", params={"limit": 2})
+    while True:
+        pages.append([t["id"] for t in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+        response = client.get("/api/trades", params={"limit": 2, "before": cursor})
+
+    assert pages == [[4, 3], [2, 1], [5]]
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/api/trades", params={"before": "not-a-cursor"})
+
+    assert response.status_code == 422
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timezone
+
+from sqlmodel import Session, select
+
+from backend.engine import pair_job
+from backend.models.job_log import JobLog
+from backend.models.trading_pair import TradingPair
+
+
+def _add_pair(engine) -> int:
+    with Session(engine) as session:
+        pair = TradingPair(name="ETH-BTC", asset_a="ETH", asset_b="BTC", current_equity=100.0)
+        session.add(pair)
+        session.commit()
+        return pair.id
+
+
+def test_job_log_writer_flushes_queue_on_stop(monkeypatch, engine):
+    pair_id = _add_pair(engine)
+    monkeypatch.setattr(pair_job, "write_engine", engine)
+    # Keep the flush window short; stop must still drain whatever is queued
+    monkeypatch.setattr(pair_job, "JOB_LOG_FLUSH_INTERVAL", 0.05)
+
+    async def scenario():
+        pair_job.start_job_log_writer()
+        pair_job._log_cycle(pair_id, "success", action="none", message="first")
+        pair_job._log_cycle(pair_id, "success", action="none", current_equity=110.0)
+        pair_job._log_cycle(pair_id, "success", action="none", current_equity=120.0)
+        # Nothing is committed until the writer's flush window elapses
+        with Session(engine) as session:
+            assert session.exec(select(JobLog)).all() == []
+        await pair_job.stop_job_log_writer()
+
+    asyncio.run(scenario())
+
+    with Session(engine) as session:
+        logs = session.exec(select(JobLog).order_by(JobLog.id)).all()
+        pair = session.get(TradingPair, pair_id)
+        assert [log.message for log in logs] == ["first", None, None]
+        # Last queued equity for the pair wins
+        assert pair.current_equity == 120.0
+    assert pair_job._job_log_queue is None
+
+
+def test_log_cycle_writes_synchronously_without_writer(monkeypatch, engine):
+    pair_id = _add_pair(engine)
+    monkeypatch.setattr(pair_job, "write_engine", engine)
+
+    pair_job._log_cycle(pair_id, "error", message="no loop")
+
+    with Session(engine) as session:
+        assert [log.message for log in session.exec(select(JobLog)).all()] == ["no loop"]
+
+
+def test_get_pair_cached_reuses_row_until_updated(monkeypatch, engine):
+    pair_id = _add_pair(engine)
+    monkeypatch.setattr(pair_job, "_pair_cache", {})
+
+    with Session(engine) as session:
+        first = pair_job.get_pair_cached(pair_id, session)
+        # A committing caller must not expire the cached row for later cycles
+        session.commit()
+    with Session(engine) as session:
+        second = pair_job.get_pair_cached(pair_id, session)
+
+    assert second is first
+    assert second.name == "ETH-BTC"
+
+    with Session(engine) as session:
+        pair = session.get(TradingPair, pair_id)
+        pair.name = "ETH-SOL"
+        pair.updated_at = datetime.now(timezone.utc)
+        session.add(pair)
+        session.commit()
+    with Session(engine) as session:
+        third = pair_job.get_pair_cached(pair_id, session)
+
+    assert third is not first
+    assert third.name == "ETH-SOL"
+
+
+def test_get_pair_cached_drops_deleted_pair(monkeypatch, engine):
+    pair_id = _add_pair(engine)
+    monkeypatch.setattr(pair_job, "_pair_cache", {})
+
+    with Session(engine) as session:
+        pair_job.get_pair_cached(pair_id, session)
+        session.delete(session.get(TradingPair, pair_id))
+        session.commit()
+    with Session(engine) as session:
+        assert pair_job.get_pair_cached(pair_id, session) is None
+    assert pair_id not in pair_job._pair_cache
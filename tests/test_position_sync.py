@@ -0,0 +1,40 @@
+import asyncio
+from types import SimpleNamespace
+
+from backend.engine import position_sync
+from backend.services import lighter_client
+
+
+class _UnreachableClient:
+    def __init__(self, **_kwargs):
+        self.calls = 0
+
+    async def get_positions(self):
+        self.calls += 1
+        raise ConnectionError("exchange unreachable")
+
+    async def close(self):
+        pass
+
+
+def test_startup_fetch_retries_stay_within_backoff_budget(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(lighter_client, "LighterClient", _UnreachableClient)
+    monkeypatch.setattr(position_sync, "get_decrypted_pk", lambda _cred: "pk")
+    monkeypatch.setattr(position_sync.asyncio, "sleep", fake_sleep)
+    cred = SimpleNamespace(
+        id=1, name="main", lighter_host="h", api_key_index=0, account_index="0"
+    )
+
+    async def scenario():
+        positions = await position_sync._fetch_positions_for_credential(cred)
+        await asyncio.gather(*position_sync._close_tasks)
+        return positions
+
+    assert asyncio.run(scenario()) == []
+    assert sleeps == [0.25, 0.5, 1.0]
+    assert sum(sleeps) <= position_sync.FETCH_BACKOFF_BUDGET
@@ -0,0 +1,134 @@
+import dataclasses
+import math
+
+import numpy as np
+import pytest
+
+from backend.services import signal_engine
+
+
+def _prices(seed: int, n: int = 200) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    b = 50 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return a, b
+
+
+def test_skipping_asset_rsi_keeps_logged_signals():
+    a, b = _prices(1)
+    kwargs = dict(
+        prices_a=a, prices_b=b, train_prices_a=a, train_prices_b=b,
+        window_candles=40, train_candles=100, rsi_period=14,
+    )
+
+    full = signal_engine.compute_signals(**kwargs)
+    exit_only = signal_engine.compute_signals(**kwargs, asset_rsi=False)
+
+    for field in ("z_score", "hedge_ratio", "half_life", "rsi", "spread_std"):
+        assert getattr(exit_only, field) == getattr(full, field)
+    assert math.isnan(exit_only.rsi_a) and math.isnan(exit_only.rsi_b)
+    assert not math.isnan(full.rsi_a)
+
+
+def test_entry_rejections_are_shared_and_immutable():
+    a, b = _prices(2)
+    signals = signal_engine.compute_signals(
+        prices_a=a, prices_b=b, train_prices_a=a, train_prices_b=b,
+        window_candles=40, train_candles=100,
+    )
+    kwargs = dict(
+        entry_z=1e9, max_half_life=0, rsi_upper=100, rsi_lower=0,
+        current_equity=100.0, equity_floor=0.0, leverage=1.0,
+    )
+
+    first = signal_engine.evaluate_entry(signals, **kwargs)
+    second = signal_engine.evaluate_entry(signals, **kwargs)
+
+    assert first is second
+    assert first.skip_reason == "no_signal"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.notional = 1.0
+
+
+def _loop_rsi(values: np.ndarray, period: int = 14) -> float:
+    """The original Wilder RSI loop, kept as the reference implementation."""
+    if len(values) < period + 2:
+        return float("nan")
+    deltas = np.diff(values)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    avg_gain = float(np.mean(gains[:period]))
+    avg_loss = float(np.mean(losses[:period]))
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    if avg_loss == 0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ols_slope_matches_polyfit(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(100, 5, 300)
+    y = 1.7 * x + rng.normal(0, 1, 300)
+
+    assert signal_engine._ols_slope(x, y) == pytest.approx(np.polyfit(x, y, 1)[0], rel=1e-9)
+
+
+def test_ols_slope_constant_x_returns_none():
+    x = np.full(50, 3.0)
+
+    assert signal_engine._ols_slope(x, np.arange(50.0)) is None
+    assert signal_engine.compute_hedge_ratio(np.arange(50.0), x) == 1.0
+    assert signal_engine.rolling_half_life(np.full(50, 2.0)) == float("inf")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_zscore_matches_numpy_mean_std(seed):
+    spread = np.random.default_rng(seed).normal(0, 3, 40)
+
+    z, current, mean, std = signal_engine._zscore_from_spread(spread)
+
+    assert mean == pytest.approx(np.mean(spread), rel=1e-12)
+    assert std == pytest.approx(np.std(spread, ddof=1), rel=1e-12)
+    assert current == spread[-1]
+    assert z == pytest.approx((spread[-1] - np.mean(spread)) / np.std(spread, ddof=1), rel=1e-9)
+
+
+def test_zscore_constant_spread_is_zero():
+    z, _current, mean, std = signal_engine._zscore_from_spread(np.full(20, 5.0))
+
+    assert (z, mean, std) == (0.0, 5.0, 0.0)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("period", [2, 14, 30])
+def test_rsi_matches_wilder_loop(seed, period):
+    values = 100 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0, 0.02, 250)))
+
+    assert signal_engine.compute_rsi(values, period) == pytest.approx(
+        _loop_rsi(values, period), abs=1e-9
+    )
+
+
+@pytest.mark.parametrize("values, expected", [
+    (np.full(40, 10.0), 100.0),                # constant: no losses
+    (np.arange(1.0, 41.0), 100.0),             # all gains
+    (np.arange(40.0, 0.0, -1.0), 0.0),         # all losses
+])
+def test_rsi_monotone_and_constant_series(values, expected):
+    assert signal_engine.compute_rsi(values, 14) == expected
+    assert _loop_rsi(values, 14) == expected
+
+
+def test_rsi_window_length_edges():
+    period = 14
+    values = 100 + np.random.default_rng(7).normal(0, 1, period + 2)
+
+    # period + 1 closes is one delta short of a smoothed value
+    assert math.isnan(signal_engine.compute_rsi(values[:period + 1], period))
+    # period + 2 closes: exactly one smoothing step
+    assert signal_engine.compute_rsi(values, period) == pytest.approx(
+        _loop_rsi(values, period), abs=1e-12
+    )